@@ -1,5 +1,5 @@
 from django.contrib import admin
-from api.models import ProgramStudy, Faculty, Survey, ProgramSpecificQuestion, Periode, Section, Question, Answer, Department, SupervisorAnswer, SupervisorToken, SystemConfig
+from api.models import ProgramStudy, Faculty, Survey, ProgramSpecificQuestion, Periode, Section, Question, Answer, Department, SupervisorAnswer, SupervisorToken, SystemConfig, AlumniPrediction, SupervisorInvitation, ReminderJob, ReminderLog, SurveyProgress, QuestionStatistic
 
 # Register your models here.
 admin.site.register(ProgramStudy)
@@ -14,3 +14,9 @@ admin.site.register(Answer)
 admin.site.register(SupervisorAnswer)
 admin.site.register(SystemConfig)
 admin.site.register(SupervisorToken)
+admin.site.register(AlumniPrediction)
+admin.site.register(SupervisorInvitation)
+admin.site.register(ReminderJob)
+admin.site.register(ReminderLog)
+admin.site.register(SurveyProgress)
+admin.site.register(QuestionStatistic)
@@ -1,6 +1,29 @@
+import logging
+
 from django.apps import AppConfig
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
 
 
 class ApiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'api'
+
+    def ready(self):
+        # Invalidasi cache struktur survey (Survey.version)
+        from api import signals  # noqa: F401
+
+        # Opt-in: load & run semua ML model saat worker start (ML_WARMUP_ON_START=True)
+        if not getattr(settings, 'ML_WARMUP_ON_START', False):
+            return
+
+        from utils.ml_utils import ml_loader
+
+        report = ml_loader.warm_up()
+        for group in ('artifacts', 'predictions'):
+            for name, result in report[group].items():
+                if result['status'] == 'ok':
+                    logger.info("ML warm-up %s loaded in %.2f ms", name, result['elapsed_ms'])
+                else:
+                    logger.warning("ML warm-up %s failed after %.2f ms: %s", name, result['elapsed_ms'], result['error'])
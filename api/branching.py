@@ -0,0 +1,117 @@
+from django.conf import settings
+from django.core.cache import cache
+from api.models import Survey, Section, Question, QuestionBranch
+
+
+class SurveyGraph:
+    """
+    Graph navigasi satu survey: section sebagai node, QuestionBranch sebagai edge
+
+    Tanpa branch yang cocok, responden lanjut ke section berikutnya (urut order, id).
+    Jika jawaban sebuah pertanyaan radio cocok dengan branch, responden lompat ke
+    next_section branch tersebut. Branch pertama yang cocok (urut pertanyaan) dipakai.
+    """
+
+    def __init__(self, survey_id, version, sections, questions, branches):
+        """
+        Args:
+            sections: list section_id urut order
+            questions: iterable (question_id, section_id, is_required), urut order
+            branches: iterable (question_id, answer_value, next_section_id)
+        """
+        self.survey_id = survey_id
+        self.version = version
+        self.sections = list(sections)
+        self.next_section = dict(zip(self.sections, self.sections[1:] + [None]))
+
+        self.required = {section_id: [] for section_id in self.sections}
+        self.branch_questions = {section_id: [] for section_id in self.sections}
+        question_sections = {}
+        for question_id, section_id, is_required in questions:
+            question_sections[question_id] = section_id
+            if is_required:
+                self.required[section_id].append(question_id)
+
+        self.edges = {}
+        for question_id, answer_value, next_section_id in branches:
+            if question_id not in question_sections or next_section_id not in self.next_section:
+                continue
+            if question_id not in self.edges:
+                self.edges[question_id] = {}
+                self.branch_questions[question_sections[question_id]].append(question_id)
+            self.edges[question_id].setdefault(answer_value, next_section_id)
+
+    @property
+    def branch_question_ids(self):
+        return set(self.edges)
+
+    @property
+    def required_question_ids(self):
+        return {question_id for ids in self.required.values() for question_id in ids}
+
+    def reachable_sections(self, answers):
+        """
+        Section yang dilalui responden untuk jawaban tertentu, O(sections)
+
+        Args:
+            answers: dict question_id -> answer_value (cukup pertanyaan branch)
+
+        Returns:
+            list section_id sesuai urutan dilalui
+        """
+        path, visited = [], set()
+        section_id = self.sections[0] if self.sections else None
+
+        while section_id is not None and section_id not in visited:
+            visited.add(section_id)
+            path.append(section_id)
+
+            next_section = self.next_section[section_id]
+            for question_id in self.branch_questions[section_id]:
+                target = self.edges[question_id].get(answers.get(question_id))
+                if target is not None:
+                    next_section = target
+                    break
+            section_id = next_section
+
+        return path
+
+    def reachable_required(self, answers):
+        """Pertanyaan wajib pada section yang dilalui"""
+        return {
+            question_id
+            for section_id in self.reachable_sections(answers)
+            for question_id in self.required[section_id]
+        }
+
+
+def compile_survey_graph(survey_id, version):
+    sections = Section.objects.filter(survey_id=survey_id).order_by('order', 'id').values_list('id', flat=True)
+    questions = Question.objects.filter(section__survey_id=survey_id).order_by(
+        'section__order', 'order', 'id'
+    ).values_list('id', 'section_id', 'is_required')
+    branches = QuestionBranch.objects.filter(
+        question__section__survey_id=survey_id
+    ).order_by('id').values_list('question_id', 'answer_value', 'next_section_id')
+
+    return SurveyGraph(survey_id, version, sections, questions, branches)
+
+
+def get_survey_graph(survey_id, version=None):
+    """
+    Graph survey dari cache, dikompilasi ulang jika Survey.version berubah
+
+    Returns:
+        SurveyGraph, atau None jika survey tidak ada
+    """
+    if version is None:
+        version = Survey.objects.filter(pk=survey_id).values_list('version', flat=True).first()
+        if version is None:
+            return None
+
+    cache_key = f"survey_graph:{survey_id}:{version}"
+    graph = cache.get(cache_key)
+    if graph is None:
+        graph = compile_survey_graph(survey_id, version)
+        cache.set(cache_key, graph, settings.SURVEY_TREE_CACHE_TIMEOUT)
+    return graph
@@ -0,0 +1,110 @@
+import json
+import tempfile
+from api.models import Question, ProgramSpecificQuestion
+
+# Kolom identitas responden di awal setiap baris export
+RESPONDENT_HEADERS = ['user_id', 'username', 'program_study']
+
+
+def export_value(question_type, value):
+    """Nilai sel export: checkbox JSON array digabung dengan '; ', lainnya apa adanya"""
+    if question_type != 'checkbox':
+        return value
+    try:
+        decoded = json.loads(value)
+    except (json.JSONDecodeError, TypeError):
+        return value
+    if isinstance(decoded, list):
+        return '; '.join(str(item) for item in decoded)
+    return str(decoded)
+
+
+class SurveyAnswerExport:
+    """
+    Export jawaban satu survey dalam bentuk lebar: satu baris per responden,
+    satu kolom per pertanyaan (urut section.order, question.order), lalu
+    pertanyaan khusus prodi.
+
+    Jawaban dibaca dengan values_list + iterator, diurutkan per user, dan baris
+    dikirim satu per satu sehingga memori tidak bergantung pada jumlah responden.
+    """
+
+    def __init__(self, survey, answers, program_study=None, chunk_size=2000):
+        """
+        Args:
+            answers: queryset Answer survey ini (sudah difilter sesuai role)
+            program_study: batasi kolom pertanyaan khusus prodi (opsional)
+        """
+        self.survey = survey
+        self.answers = answers
+        self.chunk_size = chunk_size
+
+        questions = Question.objects.filter(section__survey=survey).order_by(
+            'section__order', 'order', 'id'
+        ).values_list('id', 'code', 'text', 'question_type')
+
+        program_questions = ProgramSpecificQuestion.objects.filter(survey=survey)
+        if program_study is not None:
+            program_questions = program_questions.filter(program_study=program_study)
+        program_questions = program_questions.order_by(
+            'program_study_id', 'order', 'id'
+        ).values_list('id', 'code', 'text', 'question_type')
+
+        # (jenis pertanyaan, id) -> index kolom
+        self.columns = {}
+        self.types = []
+        self.headers = list(RESPONDENT_HEADERS)
+        for kind, rows in (('question', questions), ('program', program_questions)):
+            for question_id, code, text, question_type in rows:
+                self.columns[(kind, question_id)] = len(self.types)
+                self.types.append(question_type)
+                self.headers.append(code or text)
+
+    def _answer_rows(self):
+        return self.answers.order_by('user_id').values_list(
+            'user_id', 'user__username', 'user__program_study__name',
+            'question_id', 'program_specific_question_id', 'answer_value'
+        ).iterator(chunk_size=self.chunk_size)
+
+    def rows(self):
+        """Yield header, lalu satu list per responden"""
+        yield self.headers
+
+        current_user, respondent, values = None, None, None
+        for user_id, username, program_study, question_id, program_question_id, value in self._answer_rows():
+            if user_id != current_user:
+                if current_user is not None:
+                    yield respondent + values
+                current_user = user_id
+                respondent = [user_id, username, program_study or '']
+                values = [''] * len(self.types)
+
+            if question_id is not None:
+                index = self.columns.get(('question', question_id))
+            else:
+                index = self.columns.get(('program', program_question_id))
+            if index is not None:
+                values[index] = export_value(self.types[index], value)
+
+        if current_user is not None:
+            yield respondent + values
+
+    def write_xlsx(self):
+        """
+        Tulis export ke file XLSX sementara dengan openpyxl mode write_only
+        (baris langsung ditulis ke disk, tidak disimpan di memori)
+
+        Returns:
+            file object yang sudah di-seek ke awal
+        """
+        from openpyxl import Workbook
+
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet(title='Answers')
+        for row in self.rows():
+            sheet.append(row)
+
+        output = tempfile.TemporaryFile(suffix='.xlsx')
+        workbook.save(output)
+        output.seek(0)
+        return output
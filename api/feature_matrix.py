@@ -0,0 +1,160 @@
+import json
+import numpy as np
+import pandas as pd
+from api.models import Question, Answer
+
+NUMERIC_TYPES = ('number', 'scale')
+
+
+def decode_answer(question_type, numeric_value, choice_key, choice_keys, answer_value):
+    """
+    Nilai jawaban dari kolom bertipe Answer (lihat api.validation.typed_answer_values)
+
+    number/scale -> float (NaN jika tidak valid), radio/dropdown -> choice_key,
+    checkbox -> list choice_keys, lainnya -> answer_value
+    """
+    if question_type in NUMERIC_TYPES:
+        return np.nan if numeric_value is None else numeric_value
+
+    if question_type in ('radio', 'dropdown'):
+        return choice_key
+
+    if question_type == 'checkbox':
+        return choice_keys or []
+
+    return answer_value
+
+
+class SurveyFeatureExtractor:
+    """
+    Pivot Answer menjadi matrix responden x Question.code untuk satu survey
+
+    Answer dibaca dari kolom bertipe dengan values_list + iterator (tanpa model
+    instance maupun parsing answer_value), diurutkan per user, lalu dikirim per
+    chunk berisi `chunk_size` responden sebagai DataFrame dengan index user_id
+    dan satu kolom per code:
+    - number/scale: float64 (NaN jika tidak dijawab)
+    - radio/dropdown/text: object (string, kosong/NA jika tidak dijawab)
+    - checkbox: object berisi list, atau kolom 0/1 per opsi jika expand_checkbox=True
+    """
+
+    def __init__(self, survey, codes=None, chunk_size=2000, expand_checkbox=False):
+        self.survey = survey
+        self.chunk_size = chunk_size
+        self.expand_checkbox = expand_checkbox
+
+        questions = Question.objects.filter(
+            section__survey=survey,
+            code__isnull=False
+        ).exclude(code='').order_by('section__order', 'order', 'id').values_list(
+            'id', 'code', 'question_type', 'options'
+        )
+        if codes is not None:
+            questions = questions.filter(code__in=codes)
+
+        # Pertanyaan dengan code yang sama (mis. di cabang berbeda) masuk ke kolom yang sama
+        self.question_codes = {}
+        self.types = {}
+        self.options = {}
+        for question_id, code, question_type, options in questions:
+            self.question_codes[question_id] = code
+            if code not in self.types:
+                self.types[code] = question_type
+                self.options[code] = self._parse_options(options)
+
+        self.codes = list(self.types)
+
+    def _parse_options(self, options):
+        if not options:
+            return []
+        try:
+            parsed = json.loads(options)
+        except (json.JSONDecodeError, TypeError):
+            return options.splitlines()
+        return parsed if isinstance(parsed, list) else []
+
+    @property
+    def numeric_codes(self):
+        return [code for code in self.codes if self.types[code] in NUMERIC_TYPES]
+
+    def _answer_rows(self, user_ids=None):
+        answers = Answer.objects.filter(
+            survey=self.survey,
+            question_id__in=list(self.question_codes)
+        )
+        if user_ids is not None:
+            answers = answers.filter(user_id__in=user_ids)
+
+        return answers.order_by('user_id').values_list(
+            'user_id', 'question_id', 'numeric_value', 'choice_key', 'choice_keys', 'answer_value'
+        ).iterator(chunk_size=self.chunk_size)
+
+    def _build_chunk(self, users, columns):
+        data = {}
+        for code in self.codes:
+            question_type = self.types[code]
+            values = columns[code]
+
+            if question_type in NUMERIC_TYPES:
+                data[code] = np.fromiter(
+                    (values.get(user_id, np.nan) for user_id in users),
+                    dtype=np.float64, count=len(users)
+                )
+            elif question_type == 'checkbox' and self.expand_checkbox:
+                for option in self.options[code]:
+                    data[f"{code}__{option}"] = np.fromiter(
+                        (option in values.get(user_id, ()) for user_id in users),
+                        dtype=np.int8, count=len(users)
+                    )
+            else:
+                # Isi satu per satu supaya list checkbox tetap menjadi satu elemen
+                column = np.empty(len(users), dtype=object)
+                for i, user_id in enumerate(users):
+                    column[i] = values.get(user_id)
+                data[code] = column
+
+        return pd.DataFrame(data, index=pd.Index(users, name='user_id'))
+
+    def iter_chunks(self, user_ids=None):
+        """
+        Yield DataFrame per `chunk_size` responden
+
+        Args:
+            user_ids: batasi ke user tertentu (opsional)
+        """
+        if not self.question_codes:
+            return
+
+        users = []
+        columns = {code: {} for code in self.codes}
+        current_user = None
+
+        for user_id, question_id, *values in self._answer_rows(user_ids):
+            if user_id != current_user:
+                if len(users) == self.chunk_size:
+                    yield self._build_chunk(users, columns)
+                    users = []
+                    columns = {code: {} for code in self.codes}
+                users.append(user_id)
+                current_user = user_id
+
+            code = self.question_codes[question_id]
+            columns[code][user_id] = decode_answer(self.types[code], *values)
+
+        if users:
+            yield self._build_chunk(users, columns)
+
+    def iter_arrays(self, user_ids=None):
+        """
+        Yield (user_ids, matrix float64) hanya untuk kolom numerik (number/scale)
+        """
+        numeric_codes = self.numeric_codes
+        for chunk in self.iter_chunks(user_ids):
+            yield chunk.index.to_numpy(), chunk[numeric_codes].to_numpy(dtype=np.float64)
+
+    def to_dataframe(self, user_ids=None):
+        """Seluruh matrix dalam satu DataFrame (untuk data yang muat di memori)"""
+        chunks = list(self.iter_chunks(user_ids))
+        if not chunks:
+            return pd.DataFrame(columns=self.codes, index=pd.Index([], name='user_id'))
+        return pd.concat(chunks)
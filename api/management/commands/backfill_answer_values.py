@@ -0,0 +1,50 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models.functions import Coalesce
+from api.models import Answer
+from api.validation import TYPED_ANSWER_FIELDS, typed_answer_values
+
+
+class Command(BaseCommand):
+    help = "Fill the typed answer columns (numeric_value, choice_key, choice_keys) from answer_value"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--survey', type=int, action='append', dest='surveys',
+            help="Survey ID to backfill (repeatable). Default: every survey."
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=2000,
+            help="Number of answers read and updated per batch (default: 2000)."
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        if batch_size < 1:
+            raise CommandError("--batch-size must be at least 1.")
+
+        answers = Answer.objects.annotate(
+            question_type=Coalesce('question__question_type', 'program_specific_question__question_type')
+        ).order_by('id')
+        if options['surveys']:
+            answers = answers.filter(survey_id__in=options['surveys'])
+
+        self.stdout.write(self.style.WARNING("🧮 Backfilling typed answer values..."))
+
+        # Keyset per id: setiap batch satu SELECT dan satu bulk_update
+        total, last_id = 0, 0
+        while True:
+            rows = list(answers.filter(id__gt=last_id).values_list(
+                'id', 'question_type', 'answer_value'
+            )[:batch_size])
+            if not rows:
+                break
+
+            Answer.objects.bulk_update([
+                Answer(id=answer_id, **typed_answer_values(question_type, value))
+                for answer_id, question_type, value in rows
+            ], TYPED_ANSWER_FIELDS)
+
+            total += len(rows)
+            last_id = rows[-1][0]
+
+        self.stdout.write(self.style.SUCCESS(f"Backfilled typed values of {total} answers !."))
@@ -0,0 +1,207 @@
+import json
+import statistics
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Avg
+from accounts.models import User, Role
+from api.models import Survey, Section, Question, ProgramStudy, Answer
+from api.views.answer_views import get_answer_queryset, shape_answer_queryset
+
+
+class Rollback(Exception):
+    """Dipakai untuk membatalkan transaksi benchmark (data seed tidak disimpan)"""
+
+
+def seed(users, questions, surveys, program_studies, batch_size=5000):
+    """
+    Data benchmark: `surveys` survey dengan `questions` pertanyaan, setiap user
+    menjawab semua pertanyaan semua survey
+
+    Returns:
+        dict object yang dipakai untuk membangun query
+    """
+    roles = {name: Role.objects.get_or_create(name=name)[0] for name in ('Admin', 'Tim Prodi', 'Alumni')}
+    studies = ProgramStudy.objects.bulk_create([
+        ProgramStudy(name=f"Benchmark Prodi {i}") for i in range(program_studies)
+    ])
+    alumni = User.objects.bulk_create([
+        User(
+            id=f"bench-{i}", username=f"Benchmark {i}", password='!',
+            role=roles['Alumni'], program_study=studies[i % program_studies],
+        )
+        for i in range(users)
+    ], batch_size=batch_size)
+    admin = User.objects.create(id='bench-admin', username='Benchmark Admin', password='!', role=roles['Admin'])
+    tim_prodi = User.objects.create(
+        id='bench-prodi', username='Benchmark Prodi', password='!', role=roles['Tim Prodi'], program_study=studies[0]
+    )
+
+    survey_questions = {}
+    for s in range(surveys):
+        survey = Survey.objects.create(title=f"Benchmark Survey {s}", survey_type='exit')
+        section = Section.objects.create(survey=survey, title="Benchmark", order=1)
+        survey_questions[survey] = Question.objects.bulk_create([
+            Question(section=section, text=f"Q{q}", question_type='number', order=q)
+            for q in range(questions)
+        ])
+
+    # Per user supaya created_at naik seperti jawaban yang masuk bertahap
+    pending = []
+    for user in alumni:
+        for survey, items in survey_questions.items():
+            pending.extend(
+                Answer(user=user, survey=survey, question=question, answer_value=str(i), numeric_value=i)
+                for i, question in enumerate(items)
+            )
+        if len(pending) >= batch_size:
+            Answer.objects.bulk_create(pending)
+            pending = []
+    Answer.objects.bulk_create(pending)
+
+    survey = next(iter(survey_questions))
+    return {
+        'survey': survey,
+        'questions': survey_questions[survey],
+        'admin': admin,
+        'tim_prodi': tim_prodi,
+        'alumni': alumni[len(alumni) // 2],
+    }
+
+
+def hot_queries(data, page_size):
+    """Query Answer yang paling sering dijalankan, dibangun dari kode view / helper aslinya"""
+    survey, question = data['survey'], data['questions'][len(data['questions']) // 2]
+
+    def page(answers):
+        # Sama seperti KeysetPagination halaman pertama
+        return shape_answer_queryset(answers).order_by('-created_at', '-id')[:page_size]
+
+    return {
+        'list_admin': page(get_answer_queryset(data['admin'], survey)),
+        'list_tim_prodi': page(get_answer_queryset(data['tim_prodi'], survey)),
+        'list_alumni': page(get_answer_queryset(data['alumni'], survey)),
+        'by_question': page(get_answer_queryset(data['admin'], survey).filter(question=question)),
+        # Sama seperti refresh_progress / rebuild_progress
+        'progress_refresh': Answer.objects.filter(
+            user=data['alumni'], survey_id__in=[survey.id], question_id__in=[q.id for q in data['questions']]
+        ).order_by().values_list('survey_id', 'question_id', 'answer_value'),
+        'survey_respondents': Answer.objects.filter(survey=survey).order_by().values_list(
+            'user_id', flat=True
+        ).distinct(),
+        'question_average': Answer.objects.filter(question=question).values('question_id').annotate(
+            average=Avg('numeric_value')
+        ).values_list('question_id', 'average'),
+    }
+
+
+def measure(queries, repeat):
+    results = {}
+    for name, queryset in queries.items():
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            list(queryset.all())
+            timings.append((time.perf_counter() - start) * 1000)
+        results[name] = {
+            'plan': queryset.explain(),
+            'median_ms': round(statistics.median(timings), 3),
+        }
+    return results
+
+
+def analyze(table):
+    with connection.cursor() as cursor:
+        cursor.execute(f"ANALYZE {connection.ops.quote_name(table)}")
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a large answer dataset in a throwaway database (created from the default database "
+        "settings like the test runner does, then destroyed) and record EXPLAIN plans and timings "
+        "of the hot Answer queries without and with the Answer Meta indexes"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=3000, help="Seeded respondents (default: 3000).")
+        parser.add_argument('--questions', type=int, default=30, help="Questions per survey (default: 30).")
+        parser.add_argument('--surveys', type=int, default=3, help="Seeded surveys (default: 3).")
+        parser.add_argument('--program-studies', type=int, default=10, help="Seeded program studies (default: 10).")
+        parser.add_argument('--page-size', type=int, default=100, help="Page size of the list queries (default: 100).")
+        parser.add_argument('--repeat', type=int, default=5, help="Runs per query, median reported (default: 5).")
+        parser.add_argument('--output', help="Write the full report (plans included) as JSON to this path.")
+        parser.add_argument(
+            '--i-know-this-locks-production', action='store_true', dest='in_place',
+            help=(
+                "Run on the configured database itself inside a rolled-back transaction. Dropping the "
+                "indexes locks the Answer table until the run ends, so never use this on a live database."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        for option in ('users', 'questions', 'surveys', 'program_studies', 'page_size', 'repeat'):
+            if options[option] < 1:
+                raise CommandError(f"--{option.replace('_', '-')} must be at least 1.")
+
+        self.stdout.write(self.style.WARNING("🧪 Benchmarking Answer indexes..."))
+
+        if options['in_place']:
+            report = self.benchmark(options)
+        else:
+            # Database sementara (test_<nama>), dimigrasi dari nol lalu dihapus lagi
+            old_name = connection.settings_dict['NAME']
+            connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+            try:
+                report = self.benchmark(options)
+            finally:
+                connection.creation.destroy_test_db(old_name, verbosity=0)
+
+        self.write_report(report, options)
+
+    def benchmark(self, options):
+        editor = connection.schema_editor(atomic=False)
+        indexes = Answer._meta.indexes
+        report = {'vendor': connection.vendor, 'indexes': [index.name for index in indexes]}
+
+        try:
+            with transaction.atomic():
+                data = seed(options['users'], options['questions'], options['surveys'], options['program_studies'])
+                report['answers'] = Answer.objects.count()
+                queries = hot_queries(data, options['page_size'])
+
+                with connection.cursor() as cursor:
+                    for index in indexes:
+                        cursor.execute(editor.sql_delete_index % {
+                            'table': editor.quote_name(Answer._meta.db_table),
+                            'name': editor.quote_name(index.name),
+                        })
+                analyze(Answer._meta.db_table)
+                report['before'] = measure(queries, options['repeat'])
+
+                with connection.cursor() as cursor:
+                    for index in indexes:
+                        cursor.execute(str(index.create_sql(Answer, editor)))
+                analyze(Answer._meta.db_table)
+                report['after'] = measure(queries, options['repeat'])
+
+                raise Rollback
+        except Rollback:
+            pass
+
+        return report
+
+    def write_report(self, report, options):
+        self.stdout.write(f"\n{report['answers']} answers seeded ({report['vendor']})")
+        for name in report['before']:
+            before, after = report['before'][name], report['after'][name]
+            self.stdout.write(self.style.SUCCESS(
+                f"  {name:<20} {before['median_ms']:>10.2f} ms -> {after['median_ms']:>10.2f} ms"
+            ))
+            self.stdout.write(f"    before: {before['plan']}".replace('\n', '\n            '))
+            self.stdout.write(f"    after:  {after['plan']}".replace('\n', '\n            '))
+
+        if options['output']:
+            with open(options['output'], 'w') as output:
+                json.dump(report, output, indent=2)
+
+        self.stdout.write(self.style.SUCCESS("\nBenchmark finished, seeded data discarded !."))
@@ -0,0 +1,40 @@
+import time
+from django.core.management.base import BaseCommand
+from api.reminders import claim_job, run_job
+
+
+class Command(BaseCommand):
+    help = "Process queued survey reminder jobs (created by the mailer/reminder/* endpoints)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--loop', action='store_true',
+            help="Keep polling for new jobs instead of exiting when the queue is empty."
+        )
+        parser.add_argument(
+            '--interval', type=float, default=5.0,
+            help="Seconds to sleep between polls when the queue is empty (default: 5)."
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.WARNING("📨 Processing reminder jobs..."))
+
+        processed = 0
+        while True:
+            job = claim_job()
+            if job is None:
+                if not options['loop']:
+                    break
+                time.sleep(options['interval'])
+                continue
+
+            run_job(job)
+            processed += 1
+
+            line = f"  Job #{job.id}: {job.status} sent={job.sent} failed={job.failed} skipped={job.skipped}"
+            if job.status == 'done':
+                self.stdout.write(self.style.SUCCESS(line))
+            else:
+                self.stdout.write(self.style.ERROR(f"{line}  {job.errors[-1:]}"))
+
+        self.stdout.write(self.style.SUCCESS(f"Processed {processed} reminder jobs !."))
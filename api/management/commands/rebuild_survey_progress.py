@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand, CommandError
+from api.models import Survey
+from api.progress import rebuild_progress
+
+
+class Command(BaseCommand):
+    help = "Rebuild the SurveyProgress table from stored answers (e.g. after required questions change)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--survey', type=int, action='append', dest='surveys',
+            help="Survey ID to rebuild (repeatable). Default: every survey."
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help="Number of progress rows written per INSERT (default: 1000)."
+        )
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError("--batch-size must be at least 1.")
+
+        surveys = Survey.objects.all()
+        if options['surveys']:
+            surveys = surveys.filter(pk__in=options['surveys'])
+
+        self.stdout.write(self.style.WARNING("📊 Rebuilding survey progress..."))
+
+        for survey in surveys:
+            total = rebuild_progress(survey, batch_size=options['batch_size'])
+            self.stdout.write(self.style.SUCCESS(f"Rebuilt progress of {total} respondents for survey '{survey.title}' !."))
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+from api.models import Survey
+from api.statistics import recompute_statistics
+
+
+class Command(BaseCommand):
+    help = "Recompute the per-question answer statistics counters from stored answers"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--survey', type=int, action='append', dest='surveys',
+            help="Survey ID to recompute (repeatable). Default: every survey."
+        )
+
+    def handle(self, *args, **options):
+        surveys = Survey.objects.all()
+        if options['surveys']:
+            surveys = surveys.filter(pk__in=options['surveys'])
+
+        self.stdout.write(self.style.WARNING("📊 Recomputing answer statistics..."))
+
+        for survey in surveys:
+            total = recompute_statistics(survey)
+            self.stdout.write(self.style.SUCCESS(f"Recomputed {total} counters for survey '{survey.title}' !."))
@@ -0,0 +1,147 @@
+import math
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from api.models import Survey, AlumniPrediction
+from api.feature_matrix import SurveyFeatureExtractor
+from utils.ml_utils import ml_loader
+
+# Question.code yang dipakai sebagai fitur model
+NUMERIC_CODES = ['F502', 'F505', 'F5d']
+CATEGORICAL_CODES = ['F14', 'F1101']
+FEATURE_CODES = NUMERIC_CODES + CATEGORICAL_CODES
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def chunk_features(chunk):
+    """
+    Ubah chunk dari SurveyFeatureExtractor menjadi fitur mentah per user
+
+    Returns:
+        dict user_id -> {code: value}, tanpa code yang tidak dijawab
+    """
+    features = {}
+    for user_id, row in chunk.to_dict('index').items():
+        features[user_id] = {}
+        for code, value in row.items():
+            if code in NUMERIC_CODES:
+                value = _to_float(value)
+            if value is None or (isinstance(value, float) and math.isnan(value)):
+                continue
+            features[user_id][code] = value
+    return features
+
+
+def clustering_record(raw, mappings):
+    """Record clustering, None jika ada fitur yang tidak tersedia"""
+    record = {
+        'F502': raw.get('F502'),
+        'F505': raw.get('F505'),
+        'F14_enc': mappings['f14_map'].get(raw.get('F14')),
+        'F5d_enc': raw.get('F5d'),
+        'F1101_enc': mappings['f1101_map'].get(raw.get('F1101')),
+    }
+    if any(value is None for value in record.values()):
+        return None
+    return record
+
+
+class Command(BaseCommand):
+    help = "Score every alumni who answered a survey with the classification & clustering models and store the results"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--survey', type=int, action='append', dest='surveys',
+            help="Survey ID to score (repeatable). Default: every survey with feature answers."
+        )
+        parser.add_argument(
+            '--chunk-size', type=int, default=1000,
+            help="Number of alumni scored per model call (default: 1000)."
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        if chunk_size < 1:
+            raise CommandError("--chunk-size must be at least 1.")
+
+        if options['surveys']:
+            surveys = Survey.objects.filter(pk__in=options['surveys'])
+        else:
+            surveys = Survey.objects.filter(
+                answers__question__code__in=FEATURE_CODES
+            ).distinct()
+
+        self.stdout.write(self.style.WARNING("🤖 Scoring alumni..."))
+
+        for survey in surveys:
+            total = self.score_survey(survey, chunk_size)
+            self.stdout.write(self.style.SUCCESS(f"Scored {total} alumni for survey '{survey.title}' !."))
+
+    def score_survey(self, survey, chunk_size):
+        mappings = ml_loader.load_classification_mappings()
+        extractor = SurveyFeatureExtractor(survey, codes=FEATURE_CODES, chunk_size=chunk_size)
+
+        total = 0
+        for chunk in extractor.iter_chunks():
+            total += self.score_chunk(survey, chunk_features(chunk), mappings)
+
+        return total
+
+    def score_chunk(self, survey, features, mappings):
+        user_ids = list(features)
+
+        # Classification: fitur yang tidak ada memakai default preprocessing
+        classification = ml_loader.predict_classification_batch(
+            [features[user_id] for user_id in user_ids]
+        )['results']
+
+        # Clustering: hanya untuk alumni dengan fitur lengkap
+        cluster_records = {}
+        for user_id in user_ids:
+            record = clustering_record(features[user_id], mappings)
+            if record is not None:
+                cluster_records[user_id] = record
+
+        clusters = {}
+        if cluster_records:
+            results = ml_loader.predict_clustering(list(cluster_records.values()))['results']
+            clusters = dict(zip(cluster_records, results))
+
+        classification_version = ml_loader.get_version_info('classification')['version'] or ''
+        clustering_version = (ml_loader.get_version_info('clustering')['version'] or '') if clusters else ''
+        scored_at = timezone.now()
+
+        predictions = []
+        for user_id, result in zip(user_ids, classification):
+            cluster = clusters.get(user_id)
+            predictions.append(AlumniPrediction(
+                user_id=user_id,
+                survey=survey,
+                prediction=result['prediction'],
+                predicted_label=result['predicted_label'],
+                confidence=result['confidence'],
+                cluster=cluster['cluster'] if cluster else None,
+                cluster_label=cluster['cluster_label'] if cluster else '',
+                features=features[user_id],
+                classification_version=classification_version,
+                clustering_version=clustering_version,
+                scored_at=scored_at,
+            ))
+
+        AlumniPrediction.objects.bulk_create(
+            predictions,
+            update_conflicts=True,
+            unique_fields=['user', 'survey'],
+            update_fields=[
+                'prediction', 'predicted_label', 'confidence',
+                'cluster', 'cluster_label', 'features',
+                'classification_version', 'clustering_version', 'scored_at',
+            ],
+        )
+
+        return len(predictions)
@@ -0,0 +1,222 @@
+import os
+import time
+from datetime import timedelta
+from django.conf import settings
+from django.core.mail import send_mail
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from api.models import Survey, Answer, SystemConfig, SupervisorToken, SupervisorInvitation
+
+
+def backoff_delay(attempts, base=60, cap=3600):
+    """Jeda sebelum percobaan berikutnya: base * 2^(attempts-1), maksimal cap detik"""
+    return min(cap, base * 2 ** (attempts - 1))
+
+
+def claim_invitations(batch_size, lease=300, max_attempts=5):
+    """
+    Ambil undangan yang jatuh tempo dalam transaksi singkat
+
+    Undangan pending (atau sending yang lease-nya habis karena worker mati)
+    dipindah ke status sending dengan lease `lease` detik, lalu transaksi
+    langsung di-commit sehingga lock tidak ditahan selama pengiriman SMTP.
+    skip_locked supaya beberapa worker tidak mengambil baris yang sama.
+
+    Returns:
+        (list undangan yang diklaim, jumlah undangan yang langsung failed)
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        invitations = list(
+            SupervisorInvitation.objects.select_for_update(skip_locked=True)
+            .filter(status__in=['pending', 'sending'], next_attempt_at__lte=now)
+            .order_by('next_attempt_at')[:batch_size]
+        )
+
+        # Lease habis setelah percobaan terakhir: tidak dikirim ulang
+        expired = [
+            invitation for invitation in invitations
+            if invitation.status == 'sending' and invitation.attempts >= max_attempts
+        ]
+        for invitation in expired:
+            invitation.status = 'failed'
+            invitation.last_error = "Lease pengiriman habis (worker berhenti)"
+
+        claimed = [invitation for invitation in invitations if invitation not in expired]
+        for invitation in claimed:
+            invitation.status = 'sending'
+            invitation.attempts += 1
+            invitation.next_attempt_at = now + timedelta(seconds=lease)
+
+        SupervisorInvitation.objects.bulk_update(
+            invitations, ['status', 'attempts', 'next_attempt_at', 'last_error']
+        )
+
+    claimed = list(
+        SupervisorInvitation.objects.select_related('alumni', 'alumni__program_study', 'token')
+        .filter(id__in=[invitation.id for invitation in claimed])
+        .order_by('next_attempt_at')
+    )
+    return claimed, len(expired)
+
+
+def finish_invitation(invitation, **fields):
+    """Simpan hasil satu undangan, hanya jika masih dipegang worker ini (status sending)"""
+    SupervisorInvitation.objects.filter(
+        pk=invitation.pk, status='sending', attempts=invitation.attempts
+    ).update(**fields)
+
+
+def supervisor_emails(invitations):
+    """
+    Email atasan per (alumni, survey) dari jawaban QUESTION_CODE_SPV_EMAIL,
+    dibaca dengan satu query untuk seluruh batch
+    """
+    code = SystemConfig.objects.filter(key="QUESTION_CODE_SPV_EMAIL").values_list('value', flat=True).first()
+    if not code:
+        return {}
+
+    answers = Answer.objects.filter(
+        question__code=code,
+        user_id__in={invitation.alumni_id for invitation in invitations},
+        survey_id__in={invitation.survey_id for invitation in invitations},
+    ).values_list('user_id', 'survey_id', 'answer_value')
+
+    return {(user_id, survey_id): value.strip() for user_id, survey_id, value in answers}
+
+
+def send_invitation(invitation, skp_survey):
+    alumni = invitation.alumni
+    program_study = alumni.program_study.name if alumni.program_study else '-'
+
+    if invitation.token is None:
+        # Token di-commit sebelum email dikirim: link yang sudah terkirim selalu valid,
+        # dan percobaan ulang memakai token yang sama
+        with transaction.atomic():
+            invitation.token = SupervisorToken.objects.create(alumni=alumni)
+            SupervisorInvitation.objects.filter(pk=invitation.pk).update(token=invitation.token)
+
+    send_mail(
+        f"Pengisian survey kepuasan pengguna - {alumni.username}",
+        f"""
+Nama : {alumni.username}
+NIM : {alumni.id}
+Program Studi : {program_study}
+
+Link:
+{os.getenv("FRONTEND_URL")}/surveys/{skp_survey.id}/skp?token={invitation.token.token}
+""",
+        settings.EMAIL_HOST_USER,
+        [invitation.recipient],
+        fail_silently=False,
+    )
+
+
+def process_batch(batch_size=50, max_attempts=5, backoff_base=60, lease=300):
+    """
+    Kirim satu batch undangan
+
+    Returns:
+        dict jumlah undangan sent / retry / failed
+    """
+    counts = {'sent': 0, 'retry': 0, 'failed': 0}
+
+    invitations, counts['failed'] = claim_invitations(batch_size, lease, max_attempts)
+    if not invitations:
+        return counts
+
+    emails = supervisor_emails(invitations)
+    skp_survey = Survey.objects.filter(survey_type='skp').first()
+
+    for invitation in invitations:
+        recipient = emails.get((invitation.alumni_id, invitation.survey_id), '')
+        invitation.recipient = recipient
+
+        try:
+            if skp_survey is None:
+                raise ValueError("Survey SKP tidak ditemukan")
+            if not recipient:
+                raise ValueError("Email atasan tidak ditemukan")
+            send_invitation(invitation, skp_survey)
+        except Exception as e:
+            if invitation.attempts >= max_attempts:
+                finish_invitation(invitation, recipient=recipient, status='failed', last_error=str(e))
+                counts['failed'] += 1
+            else:
+                finish_invitation(
+                    invitation, recipient=recipient, status='pending', last_error=str(e),
+                    next_attempt_at=timezone.now() + timedelta(
+                        seconds=backoff_delay(invitation.attempts, backoff_base)
+                    ),
+                )
+                counts['retry'] += 1
+        else:
+            finish_invitation(
+                invitation, recipient=recipient, status='sent', sent_at=timezone.now(), last_error=''
+            )
+            counts['sent'] += 1
+
+    return counts
+
+
+class Command(BaseCommand):
+    help = "Send queued supervisor invitation emails (SKP survey) with retries and exponential backoff"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--loop', action='store_true',
+            help="Keep polling the outbox instead of exiting when it is empty."
+        )
+        parser.add_argument(
+            '--interval', type=float, default=5.0,
+            help="Seconds to sleep between polls when the outbox is empty (default: 5)."
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=50,
+            help="Number of invitations claimed per batch (default: 50)."
+        )
+        parser.add_argument(
+            '--max-attempts', type=int, default=5,
+            help="Attempts before an invitation is marked as failed (default: 5)."
+        )
+        parser.add_argument(
+            '--backoff', type=int, default=60,
+            help="Base retry delay in seconds, doubled on every attempt (default: 60)."
+        )
+        parser.add_argument(
+            '--lease', type=int, default=300,
+            help="Seconds a claimed invitation stays reserved before another worker may retry it (default: 300)."
+        )
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError("--batch-size must be at least 1.")
+        if options['max_attempts'] < 1:
+            raise CommandError("--max-attempts must be at least 1.")
+        if options['lease'] < 1:
+            raise CommandError("--lease must be at least 1.")
+
+        self.stdout.write(self.style.WARNING("📨 Sending supervisor invitations..."))
+
+        totals = {'sent': 0, 'retry': 0, 'failed': 0}
+        while True:
+            counts = process_batch(
+                options['batch_size'], options['max_attempts'], options['backoff'], options['lease']
+            )
+            for key, value in counts.items():
+                totals[key] += value
+
+            if any(counts.values()):
+                self.stdout.write(
+                    f"  sent={counts['sent']} retry={counts['retry']} failed={counts['failed']}"
+                )
+                continue
+
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Sent {totals['sent']} invitations ({totals['retry']} to retry, {totals['failed']} failed) !."
+        ))
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand, CommandError
+from utils.ml_utils import ml_loader
+
+
+class Command(BaseCommand):
+    help = "Load all ML artifacts and run a dummy prediction through each model, reporting load times"
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.WARNING("🔥 Warming up ML models..."))
+
+        report = ml_loader.warm_up()
+        failed = False
+
+        for group in ('artifacts', 'predictions'):
+            self.stdout.write(f"\n{group.capitalize()}:")
+            for name, result in report[group].items():
+                line = f"  {name:<25} {result['elapsed_ms']:>10.2f} ms"
+                if result['status'] == 'ok':
+                    self.stdout.write(self.style.SUCCESS(line))
+                else:
+                    failed = True
+                    self.stdout.write(self.style.ERROR(f"{line}  {result['error']}"))
+
+        if failed:
+            raise CommandError("Some ML artifacts failed to warm up.")
+
+        self.stdout.write(self.style.SUCCESS("\nAll ML models are warm !."))
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.8 on 2026-10-18 03:40
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_systemconfig_supervisortoken_supervisoranswer'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AlumniPrediction',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('prediction', models.IntegerField()),
+                ('predicted_label', models.CharField(max_length=100)),
+                ('confidence', models.FloatField()),
+                ('cluster', models.IntegerField(blank=True, null=True)),
+                ('cluster_label', models.CharField(blank=True, max_length=100)),
+                ('features', models.JSONField(default=dict)),
+                ('classification_version', models.CharField(blank=True, max_length=20)),
+                ('clustering_version', models.CharField(blank=True, max_length=20)),
+                ('scored_at', models.DateTimeField()),
+                ('survey', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='predictions', to='api.survey')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='predictions', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-scored_at'],
+                'indexes': [models.Index(fields=['survey', 'predicted_label'], name='api_alumnip_survey__131f34_idx'), models.Index(fields=['survey', 'cluster'], name='api_alumnip_survey__99cd72_idx')],
+                'unique_together': {('user', 'survey')},
+            },
+        ),
+    ]
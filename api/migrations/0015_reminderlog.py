@@ -0,0 +1,31 @@
+# Generated by Django 5.2.8 on 2026-10-18 03:53
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0014_reminderjob'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReminderLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('first_reminded_at', models.DateTimeField()),
+                ('last_reminded_at', models.DateTimeField()),
+                ('reminder_count', models.PositiveIntegerField(default=1)),
+                ('survey', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reminder_logs', to='api.survey')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reminder_logs', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['last_reminded_at'], name='api_reminde_last_re_e259aa_idx')],
+                'unique_together': {('user', 'survey')},
+            },
+        ),
+    ]
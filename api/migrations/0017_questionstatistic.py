@@ -0,0 +1,28 @@
+# Generated by Django 5.2.8 on 2026-10-18 04:07
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0016_surveyprogress'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QuestionStatistic',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('option', models.CharField(max_length=255)),
+                ('count', models.IntegerField(default=0)),
+                ('value_sum', models.FloatField(default=0)),
+                ('program_study', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='api.programstudy')),
+                ('question', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='statistics', to='api.question')),
+            ],
+            options={
+                'unique_together': {('question', 'program_study', 'option')},
+            },
+        ),
+    ]
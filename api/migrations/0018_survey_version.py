@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-18 04:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0017_questionstatistic'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='survey',
+            name='version',
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+    ]
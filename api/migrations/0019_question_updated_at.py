@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-18 04:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0018_survey_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='programspecificquestion',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='question',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.8 on 2026-10-18 04:29
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0020_answer_typed_values'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='answer',
+            index=models.Index(fields=['survey', '-created_at', '-id'], name='answer_survey_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='answer',
+            index=models.Index(fields=['survey', 'user', '-created_at', '-id'], name='answer_survey_user_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='answer',
+            index=models.Index(fields=['question', 'survey', '-created_at', '-id'], name='answer_question_survey_idx'),
+        ),
+    ]
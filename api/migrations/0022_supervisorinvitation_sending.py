@@ -0,0 +1,28 @@
+# Generated by Django 5.2.8 on 2026-10-18 04:41
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0021_answer_access_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='supervisorinvitation',
+            name='unique_pending_supervisor_invitation',
+        ),
+        migrations.AlterField(
+            model_name='supervisorinvitation',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('sending', 'Sending'), ('sent', 'Sent'), ('failed', 'Failed')], default='pending', max_length=10),
+        ),
+        migrations.AddConstraint(
+            model_name='supervisorinvitation',
+            constraint=models.UniqueConstraint(condition=models.Q(('status__in', ['pending', 'sending'])), fields=('alumni', 'survey'), name='unique_pending_supervisor_invitation'),
+        ),
+    ]
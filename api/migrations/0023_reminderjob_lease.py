@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-18 04:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0022_supervisorinvitation_sending'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='reminderjob',
+            name='attempts',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='reminderjob',
+            name='heartbeat_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,102 @@
+from django.db import migrations
+from django.utils import timezone
+
+
+def reachable_required(sections, required, branch_questions, edges, answers):
+    """
+    Salinan api.branching.SurveyGraph.reachable_required saat migration ini dibuat
+    (migration tidak boleh bergantung pada kode aplikasi)
+    """
+    next_section = dict(zip(sections, sections[1:] + [None]))
+    result, visited = set(), set()
+    section_id = sections[0] if sections else None
+
+    while section_id is not None and section_id not in visited:
+        visited.add(section_id)
+        result.update(required[section_id])
+
+        target = next_section[section_id]
+        for question_id in branch_questions[section_id]:
+            branch_target = edges[question_id].get(answers.get(question_id))
+            if branch_target is not None:
+                target = branch_target
+                break
+        section_id = target
+
+    return result
+
+
+def backfill_survey_progress(apps, schema_editor):
+    """
+    Isi SurveyProgress dari jawaban yang sudah ada (sama seperti rebuild_progress),
+    supaya alumni yang sudah selesai sebelum tabel ini ada tidak dianggap belum mengisi
+    """
+    Survey = apps.get_model('api', 'Survey')
+    Section = apps.get_model('api', 'Section')
+    Question = apps.get_model('api', 'Question')
+    QuestionBranch = apps.get_model('api', 'QuestionBranch')
+    Answer = apps.get_model('api', 'Answer')
+    SurveyProgress = apps.get_model('api', 'SurveyProgress')
+
+    now = timezone.now()
+    for survey_id in Survey.objects.values_list('id', flat=True):
+        sections = list(Section.objects.filter(survey_id=survey_id).order_by('order', 'id').values_list('id', flat=True))
+        required = {section_id: set() for section_id in sections}
+        branch_questions = {section_id: [] for section_id in sections}
+        question_sections = {}
+        for question_id, section_id, is_required in Question.objects.filter(
+            section__survey_id=survey_id
+        ).order_by('section__order', 'order', 'id').values_list('id', 'section_id', 'is_required'):
+            question_sections[question_id] = section_id
+            if is_required:
+                required[section_id].add(question_id)
+
+        edges = {}
+        for question_id, answer_value, next_section_id in QuestionBranch.objects.filter(
+            question__section__survey_id=survey_id
+        ).order_by('id').values_list('question_id', 'answer_value', 'next_section_id'):
+            if question_id not in question_sections or next_section_id not in required:
+                continue
+            if question_id not in edges:
+                edges[question_id] = {}
+                branch_questions[question_sections[question_id]].append(question_id)
+            edges[question_id].setdefault(answer_value, next_section_id)
+
+        relevant = set(edges).union(*required.values())
+        answers = {
+            user_id: {}
+            for user_id in Answer.objects.filter(survey_id=survey_id).order_by().values_list(
+                'user_id', flat=True
+            ).distinct()
+        }
+        for user_id, question_id, value in Answer.objects.filter(
+            survey_id=survey_id,
+            question_id__in=relevant,
+        ).order_by().values_list('user_id', 'question_id', 'answer_value').iterator(chunk_size=5000):
+            answers[user_id][question_id] = value
+
+        rows = []
+        for user_id, user_answers in answers.items():
+            user_required = reachable_required(sections, required, branch_questions, edges, user_answers)
+            answered = len(user_required.intersection(user_answers))
+            rows.append(SurveyProgress(
+                user_id=user_id,
+                survey_id=survey_id,
+                answered_required=answered,
+                total_required=len(user_required),
+                completed_at=now if answered >= len(user_required) else None,
+            ))
+
+        # Baris yang sudah ditulis lewat submit jawaban setelah deploy dibiarkan
+        SurveyProgress.objects.bulk_create(rows, batch_size=1000, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0023_reminderjob_lease'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_survey_progress, migrations.RunPython.noop),
+    ]
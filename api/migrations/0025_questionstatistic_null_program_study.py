@@ -0,0 +1,93 @@
+import json
+import math
+from collections import defaultdict
+from django.db import migrations, models
+
+CHOICE_TYPES = ('radio', 'dropdown', 'checkbox')
+NUMERIC_TYPES = ('number', 'scale')
+
+
+# Salinan api.statistics saat migration ini dibuat (migration tidak boleh bergantung pada kode aplikasi)
+def _number_label(value):
+    if value == int(value):
+        return str(int(value))
+    return f"{value:.10f}".rstrip('0')
+
+
+def _number_bin(value):
+    if value == 0:
+        return '0'
+    magnitude = abs(value)
+    exponent = math.floor(math.log10(magnitude))
+    mantissa = magnitude / 10 ** exponent
+    lower = 1 if mantissa < 2 else 2 if mantissa < 5 else 5
+    return _number_label(math.copysign(lower * 10 ** exponent, value))
+
+
+def _contributions(question_type, value):
+    if question_type in ('radio', 'dropdown'):
+        return [(value, 0.0)] if value else []
+    if question_type == 'checkbox':
+        try:
+            selected = json.loads(value)
+        except (json.JSONDecodeError, TypeError):
+            selected = value.splitlines() if value else []
+        if not isinstance(selected, list):
+            selected = [selected]
+        return [(str(option), 0.0) for option in dict.fromkeys(selected)]
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return []
+    if not math.isfinite(number):
+        return []
+    return [(_number_label(number) if question_type == 'scale' else _number_bin(number), number)]
+
+
+def recompute_statistics(apps, schema_editor):
+    """
+    Hitung ulang semua counter dari jawaban yang sudah ada (sama seperti
+    recompute_statistics), sekaligus menggabungkan counter tanpa program studi
+    yang terduplikasi sebelum constraint-nya dipasang
+    """
+    Question = apps.get_model('api', 'Question')
+    Answer = apps.get_model('api', 'Answer')
+    QuestionStatistic = apps.get_model('api', 'QuestionStatistic')
+
+    question_types = dict(Question.objects.filter(
+        question_type__in=CHOICE_TYPES + NUMERIC_TYPES
+    ).values_list('id', 'question_type'))
+
+    deltas = defaultdict(lambda: [0, 0.0])
+    for question_id, program_study_id, value in Answer.objects.filter(
+        question_id__in=list(question_types)
+    ).order_by().values_list('question_id', 'user__program_study_id', 'answer_value').iterator(chunk_size=5000):
+        for option, number in _contributions(question_types[question_id], value):
+            delta = deltas[(question_id, program_study_id, option[:255])]
+            delta[0] += 1
+            delta[1] += number
+
+    QuestionStatistic.objects.all().delete()
+    QuestionStatistic.objects.bulk_create([
+        QuestionStatistic(
+            question_id=question_id, program_study_id=program_study_id,
+            option=option, count=count, value_sum=value_sum,
+        )
+        for (question_id, program_study_id, option), (count, value_sum) in deltas.items()
+        if count > 0
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0024_backfill_survey_progress'),
+    ]
+
+    operations = [
+        migrations.RunPython(recompute_statistics, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='questionstatistic',
+            constraint=models.UniqueConstraint(condition=models.Q(('program_study__isnull', True)), fields=('question', 'option'), name='unique_statistic_without_program_study'),
+        ),
+    ]
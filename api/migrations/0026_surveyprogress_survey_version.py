@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-18 04:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0025_questionstatistic_null_program_study'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='surveyprogress',
+            name='survey_version',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,68 @@
+import json
+import math
+
+from django.db import migrations
+from django.db.models.functions import Coalesce
+
+
+# Salinan api.validation.typed_answer_values saat migration ini dibuat
+# (migration tidak boleh bergantung pada kode aplikasi)
+def typed_answer_values(question_type, answer_value):
+    values = {'numeric_value': None, 'choice_key': None, 'choice_keys': None}
+
+    if question_type in ('number', 'scale'):
+        try:
+            number = float(answer_value)
+        except (TypeError, ValueError):
+            number = None
+        if number is not None and math.isfinite(number):
+            values['numeric_value'] = number
+
+    elif question_type in ('radio', 'dropdown'):
+        if isinstance(answer_value, str) and answer_value.strip():
+            values['choice_key'] = answer_value.strip()[:255]
+
+    elif question_type == 'checkbox':
+        try:
+            selected = json.loads(answer_value)
+        except (json.JSONDecodeError, TypeError):
+            selected = answer_value.splitlines() if isinstance(answer_value, str) else []
+        if not isinstance(selected, list):
+            selected = [selected]
+        values['choice_keys'] = list(dict.fromkeys(str(option) for option in selected))
+
+    return values
+
+
+def backfill_typed_values(apps, schema_editor):
+    """
+    Isi numeric_value / choice_key / choice_keys untuk jawaban yang disimpan sebelum
+    kolom bertipe ada (sama seperti command backfill_answer_values)
+    """
+    Answer = apps.get_model('api', 'Answer')
+
+    answers = Answer.objects.annotate(
+        question_type=Coalesce('question__question_type', 'program_specific_question__question_type')
+    ).order_by('id')
+
+    last_id = 0
+    while True:
+        rows = list(answers.filter(id__gt=last_id).values_list('id', 'question_type', 'answer_value')[:2000])
+        if not rows:
+            break
+        Answer.objects.bulk_update([
+            Answer(id=answer_id, **typed_answer_values(question_type, value))
+            for answer_id, question_type, value in rows
+        ], ['numeric_value', 'choice_key', 'choice_keys'])
+        last_id = rows[-1][0]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0027_questionstatistic_program_specific_question'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_typed_values, migrations.RunPython.noop),
+    ]
@@ -52,6 +52,9 @@ class Survey(models.Model):
     start_at = models.DateTimeField(null=True, blank=True)
     end_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    # Naik setiap survey / section / pertanyaan / branch berubah (lihat api/signals.py),
+    # dipakai sebagai key cache & ETag struktur survey
+    version = models.PositiveIntegerField(default=1, editable=False)
 
     def __str__(self):
         return f"{self.title} @ {self.created_at}"
@@ -86,6 +89,7 @@ class Question(models.Model):
     order = models.IntegerField(default=0)
     is_required = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"{self.text[:60]}..."
@@ -111,6 +115,7 @@ class ProgramSpecificQuestion(models.Model):
     order = models.IntegerField(default=0)
     is_required = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"{self.text[:60]}..."
@@ -143,6 +148,14 @@ class Answer(models.Model):
     # Untuk checkbox: JSON array ["option1", "option2"]
     # Untuk scale: number (1-5)
     answer_value = models.TextField()
+    # Salinan bertipe dari answer_value (diisi AnswerSerializer / signal pre_save) untuk agregasi di SQL
+    # dan dibaca oleh statistik (recompute_statistics) serta SurveyFeatureExtractor
+    # Untuk number/scale: numeric_value
+    # Untuk radio/dropdown: choice_key (opsi yang dipilih)
+    # Untuk checkbox: choice_keys (list opsi yang dipilih)
+    numeric_value = models.FloatField(null=True, blank=True)
+    choice_key = models.CharField(max_length=255, null=True, blank=True)
+    choice_keys = models.JSONField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -152,6 +165,17 @@ class Answer(models.Model):
             ['user', 'question'],
             ['user', 'program_specific_question']
         ]
+        indexes = [
+            models.Index(fields=['question', 'numeric_value'], name='answer_question_numeric_idx'),
+            models.Index(fields=['question', 'choice_key'], name='answer_question_choice_idx'),
+            # Pola akses terukur (lihat command benchmark_answer_indexes):
+            # list jawaban per survey terurut terbaru (KeysetPagination)
+            models.Index(fields=['survey', '-created_at', '-id'], name='answer_survey_created_idx'),
+            # jawaban per survey + user (Alumni, Tim Prodi lewat join user, responden survey)
+            models.Index(fields=['survey', 'user', '-created_at', '-id'], name='answer_survey_user_idx'),
+            # jawaban per pertanyaan dalam satu survey
+            models.Index(fields=['question', 'survey', '-created_at', '-id'], name='answer_question_survey_idx'),
+        ]
         ordering = ['-created_at']
 
     def __str__(self):
@@ -214,4 +238,230 @@ class SupervisorAnswer(models.Model):
         ]
 
     def __str__(self):
-        return f"Supervisor {self.token.alumni.username} - {self.question.text[:40]}"
\ No newline at end of file
+        return f"Supervisor {self.token.alumni.username} - {self.question.text[:40]}"
+
+class AlumniPrediction(models.Model):
+    """
+    Hasil scoring offline (classification + clustering) per alumni per survey.
+    Diisi oleh management command `score_alumni`, sehingga dashboard cukup membaca tabel ini.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='predictions')
+    survey = models.ForeignKey(Survey, on_delete=models.CASCADE, related_name='predictions')
+
+    # Classification (XGBoost)
+    prediction = models.IntegerField()
+    predicted_label = models.CharField(max_length=100)
+    confidence = models.FloatField()
+
+    # Clustering (KMeans), null jika fitur clustering tidak lengkap
+    cluster = models.IntegerField(null=True, blank=True)
+    cluster_label = models.CharField(max_length=100, blank=True)
+
+    # Fitur mentah hasil ekstraksi dari Answer (berdasarkan Question.code)
+    features = models.JSONField(default=dict)
+
+    classification_version = models.CharField(max_length=20, blank=True)
+    clustering_version = models.CharField(max_length=20, blank=True)
+    scored_at = models.DateTimeField()
+
+    class Meta:
+        unique_together = [
+            ['user', 'survey']
+        ]
+        ordering = ['-scored_at']
+        indexes = [
+            models.Index(fields=['survey', 'predicted_label']),
+            models.Index(fields=['survey', 'cluster']),
+        ]
+
+    def __str__(self):
+        return f"{self.user.username} - {self.predicted_label} ({self.survey.title})"
+
+
+class SupervisorInvitation(models.Model):
+    """
+    Outbox email undangan survey SKP untuk atasan alumni.
+    Dibuat saat alumni submit survey lv1, lalu dikirim oleh worker
+    `send_supervisor_invitations` (dengan retry & backoff) di luar request.
+    """
+    STATUS_CHOICES = (
+        ('pending', 'Pending'),
+        ('sending', 'Sending'),
+        ('sent', 'Sent'),
+        ('failed', 'Failed'),
+    )
+
+    alumni = models.ForeignKey(User, on_delete=models.CASCADE, related_name='supervisor_invitations')
+    survey = models.ForeignKey(Survey, on_delete=models.CASCADE, related_name='supervisor_invitations')
+    token = models.ForeignKey(SupervisorToken, on_delete=models.SET_NULL, null=True, blank=True)
+    recipient = models.EmailField(blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveIntegerField(default=0)
+    # pending: jadwal percobaan berikutnya, sending: batas lease worker yang sedang mengirim
+    next_attempt_at = models.DateTimeField(auto_now_add=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['next_attempt_at']
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at']),
+        ]
+        constraints = [
+            # Submit ulang tidak membuat undangan ganda selama masih pending / sedang dikirim
+            models.UniqueConstraint(
+                fields=['alumni', 'survey'],
+                condition=models.Q(status__in=['pending', 'sending']),
+                name='unique_pending_supervisor_invitation',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.alumni.username} -> {self.recipient or '?'} ({self.status})"
+
+
+class ReminderJob(models.Model):
+    """
+    Job reminder email yang diproses di background oleh worker `process_reminder_jobs`.
+    Endpoint mailer/reminder/* hanya membuat job; progress dibaca lewat endpoint job.
+    """
+    SCOPE_CHOICES = (
+        ('all', 'Semua Alumni'),
+        ('program_study', 'Alumni Program Studi'),
+        ('users', 'Alumni Tertentu'),
+    )
+    STATUS_CHOICES = (
+        ('queued', 'Queued'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    )
+
+    scope = models.CharField(max_length=20, choices=SCOPE_CHOICES)
+    program_study = models.ForeignKey(ProgramStudy, on_delete=models.SET_NULL, null=True, blank=True)
+    user_ids = models.JSONField(default=list, blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='queued')
+    created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name='reminder_jobs')
+
+    total = models.PositiveIntegerField(default=0)
+    sent = models.PositiveIntegerField(default=0)
+    failed = models.PositiveIntegerField(default=0)
+    skipped = models.PositiveIntegerField(default=0)
+    errors = models.JSONField(default=list, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    # Diperbarui worker setiap chunk; job running tanpa heartbeat melewati lease dianggap mati
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+    attempts = models.PositiveIntegerField(default=0)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+        ]
+
+    @property
+    def processed(self):
+        return self.sent + self.failed + self.skipped
+
+    def __str__(self):
+        return f"ReminderJob #{self.id} ({self.scope}, {self.status})"
+
+
+class ReminderLog(models.Model):
+    """
+    Ledger reminder per (user, survey): kapan terakhir diingatkan dan berapa kali.
+    Dipakai untuk cooldown per user supaya reminder berulang tidak mengirim ulang.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='reminder_logs')
+    survey = models.ForeignKey(Survey, on_delete=models.CASCADE, related_name='reminder_logs')
+    first_reminded_at = models.DateTimeField()
+    last_reminded_at = models.DateTimeField()
+    reminder_count = models.PositiveIntegerField(default=1)
+
+    class Meta:
+        unique_together = ['user', 'survey']
+        indexes = [
+            models.Index(fields=['last_reminded_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.user.username} - {self.survey.title} ({self.reminder_count}x)"
+
+
+class SurveyProgress(models.Model):
+    """
+    Progress pengisian survey per user (jumlah pertanyaan wajib yang sudah dijawab).
+    Diperbarui oleh view answer setiap ada perubahan jawaban; bisa dibangun ulang
+    dengan `python manage.py rebuild_survey_progress`. Baris dengan survey_version
+    lama dibangun ulang oleh reminder sebelum dipakai (lihat refresh_stale_progress).
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='survey_progress')
+    survey = models.ForeignKey(Survey, on_delete=models.CASCADE, related_name='progress')
+    answered_required = models.PositiveIntegerField(default=0)
+    total_required = models.PositiveIntegerField(default=0)
+    completed_at = models.DateTimeField(null=True, blank=True)
+    # Survey.version saat progress dihitung; berbeda = struktur survey berubah sejak itu
+    survey_version = models.PositiveIntegerField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ['user', 'survey']
+        indexes = [
+            models.Index(fields=['survey', 'completed_at']),
+        ]
+
+    @property
+    def is_completed(self):
+        return self.completed_at is not None
+
+    def __str__(self):
+        return f"{self.user.username} - {self.survey.title} ({self.answered_required}/{self.total_required})"
+
+
+class QuestionStatistic(models.Model):
+    """
+    Counter jawaban per (question / program specific question, program studi responden, option).
+    - radio/dropdown/checkbox: option = pilihan yang dijawab
+    - scale: option = nilai skala
+    - number: option = batas bawah bin histogram (deret 1-2-5)
+    value_sum menyimpan jumlah nilai (scale/number) untuk menghitung rata-rata.
+    Diperbarui saat jawaban ditulis; bisa dihitung ulang dengan
+    `python manage.py recompute_statistics`.
+    """
+    # Salah satu diisi, sama seperti Answer
+    question = models.ForeignKey(
+        Question, on_delete=models.CASCADE, related_name='statistics', null=True, blank=True
+    )
+    program_specific_question = models.ForeignKey(
+        ProgramSpecificQuestion, on_delete=models.CASCADE, related_name='statistics', null=True, blank=True
+    )
+    program_study = models.ForeignKey(ProgramStudy, on_delete=models.CASCADE, null=True, blank=True)
+    option = models.CharField(max_length=255)
+    count = models.IntegerField(default=0)
+    value_sum = models.FloatField(default=0)
+
+    class Meta:
+        unique_together = [
+            ['question', 'program_study', 'option'],
+            ['program_specific_question', 'program_study', 'option'],
+        ]
+        constraints = [
+            # unique_together tidak membandingkan NULL: counter tanpa program studi perlu constraint sendiri
+            models.UniqueConstraint(
+                fields=['question', 'option'],
+                condition=models.Q(program_study__isnull=True),
+                name='unique_statistic_without_program_study',
+            ),
+            models.UniqueConstraint(
+                fields=['program_specific_question', 'option'],
+                condition=models.Q(program_study__isnull=True),
+                name='unique_program_statistic_without_program_study',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.question_id or self.program_specific_question_id} - {self.option}: {self.count}"
@@ -105,4 +105,11 @@ class ProdiReminderPermission(BasePermission):
         return all(
             str(ps_id) == str(user.program_study_id)
             for ps_id in program_study_ids
-        )
\ No newline at end of file
+        )
+class AnswerExportPermissions(BasePermission):
+    def has_permission(self, request, view):
+        return request.user.is_authenticated and request.user.role.name in ['Admin', 'Tracer', 'Tim Prodi']
+
+class StatisticsPermissions(BasePermission):
+    def has_permission(self, request, view):
+        return request.user.is_authenticated and request.user.role.name in ['Admin', 'Tracer', 'Tim Prodi', 'Pimpinan Unit']
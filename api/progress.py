@@ -0,0 +1,162 @@
+from django.db.models import Count
+from django.utils import timezone
+from api.models import Survey, Question, Answer, SurveyProgress
+from api.branching import get_survey_graph
+
+
+def required_totals(surveys):
+    """
+    Jumlah pertanyaan wajib per survey (satu query GROUP BY)
+
+    Returns:
+        dict survey_id -> total_required, hanya survey yang punya pertanyaan wajib
+    """
+    totals = Question.objects.filter(
+        section__survey__in=surveys,
+        is_required=True
+    ).values('section__survey').annotate(total=Count('id'))
+
+    return {row['section__survey']: row['total'] for row in totals}
+
+
+def survey_graphs(survey_ids):
+    """Graph branching per survey (versi dibaca dalam satu query, graph dari cache)"""
+    return {
+        survey_id: get_survey_graph(survey_id, version)
+        for survey_id, version in Survey.objects.filter(id__in=survey_ids).values_list('id', 'version')
+    }
+
+
+def relevant_question_ids(graph):
+    """Pertanyaan yang menentukan progress: pertanyaan wajib dan pertanyaan branch"""
+    return graph.required_question_ids | graph.branch_question_ids
+
+
+def _progress_rows(pairs, answers, graphs, existing, now):
+    """
+    Args:
+        answers: dict (user_id, survey_id) -> {question_id: answer_value}
+    """
+    rows = []
+    for user_id, survey_id in pairs:
+        user_answers = answers.get((user_id, survey_id), {})
+        # Hanya pertanyaan wajib pada section yang bisa dicapai lewat jawaban user
+        required = graphs[survey_id].reachable_required(user_answers)
+        total = len(required)
+        count = len(required.intersection(user_answers))
+        completed_at = None
+        if count >= total:
+            # Pertahankan waktu selesai pertama kali
+            completed_at = existing.get((user_id, survey_id)) or now
+        rows.append(SurveyProgress(
+            user_id=user_id,
+            survey_id=survey_id,
+            answered_required=count,
+            total_required=total,
+            completed_at=completed_at,
+            survey_version=graphs[survey_id].version,
+        ))
+    return rows
+
+
+def _save_rows(rows, batch_size=None):
+    SurveyProgress.objects.bulk_create(
+        rows,
+        batch_size=batch_size,
+        update_conflicts=True,
+        unique_fields=['user', 'survey'],
+        update_fields=['answered_required', 'total_required', 'completed_at', 'survey_version', 'updated_at'],
+    )
+
+
+def refresh_progress(user_id, survey_ids):
+    """
+    Hitung ulang progress satu user untuk survey yang jawabannya baru berubah
+
+    Jumlah query tetap (tidak tergantung jumlah jawaban / survey):
+    versi survey, jawaban pertanyaan wajib / branch, completed_at lama, lalu satu upsert.
+    Graph branching diambil dari cache sehingga penelusuran section O(sections).
+    """
+    survey_ids = {survey_id for survey_id in survey_ids if survey_id is not None}
+    if not survey_ids:
+        return
+
+    graphs = survey_graphs(survey_ids)
+    if not graphs:
+        return
+
+    answers = {(user_id, survey_id): {} for survey_id in graphs}
+    question_ids = set().union(*(relevant_question_ids(graph) for graph in graphs.values()))
+    for survey_id, question_id, value in Answer.objects.filter(
+        user_id=user_id,
+        survey_id__in=list(graphs),
+        question_id__in=question_ids,
+    ).order_by().values_list('survey_id', 'question_id', 'answer_value'):
+        answers[(user_id, survey_id)][question_id] = value
+
+    existing = {
+        (user_id, survey_id): completed_at
+        for survey_id, completed_at in SurveyProgress.objects.filter(
+            user_id=user_id,
+            survey_id__in=list(graphs),
+        ).values_list('survey_id', 'completed_at')
+    }
+
+    pairs = [(user_id, survey_id) for survey_id in sorted(graphs)]
+    _save_rows(_progress_rows(pairs, answers, graphs, existing, timezone.now()))
+
+
+def rebuild_progress(survey, batch_size=1000, chunk_size=5000):
+    """
+    Bangun ulang progress seluruh responden satu survey
+
+    Returns:
+        jumlah baris progress yang ditulis
+    """
+    graphs = survey_graphs([survey.id])
+    graph = graphs[survey.id]
+
+    answers = {
+        (user_id, survey.id): {}
+        # order_by() kosong: tanpa itu ordering default (-created_at) ikut masuk ke DISTINCT
+        for user_id in Answer.objects.filter(survey=survey).order_by().values_list('user_id', flat=True).distinct()
+    }
+    for user_id, question_id, value in Answer.objects.filter(
+        survey=survey,
+        question_id__in=relevant_question_ids(graph),
+    ).values_list('user_id', 'question_id', 'answer_value').iterator(chunk_size=chunk_size):
+        answers[(user_id, survey.id)][question_id] = value
+
+    existing = dict(
+        ((user_id, survey.id), completed_at)
+        for user_id, completed_at in SurveyProgress.objects.filter(
+            survey=survey
+        ).values_list('user_id', 'completed_at')
+    )
+
+    rows = _progress_rows(list(answers), answers, graphs, existing, timezone.now())
+    _save_rows(rows, batch_size=batch_size)
+
+    # Progress user yang sudah tidak punya jawaban sama sekali dihapus
+    SurveyProgress.objects.filter(survey=survey).exclude(
+        user_id__in=Answer.objects.filter(survey=survey).values('user_id')
+    ).delete()
+
+    return len(rows)
+
+
+def refresh_stale_progress(survey):
+    """
+    Bangun ulang progress survey jika ada baris yang dihitung dari versi survey lama
+
+    Signal menaikkan Survey.version setiap section / pertanyaan / branch berubah,
+    sehingga total_required baris lama bisa salah (mis. pertanyaan wajib baru).
+
+    Returns:
+        True jika progress dibangun ulang
+    """
+    stale = SurveyProgress.objects.filter(survey=survey).exclude(survey_version=survey.version)
+    if not stale.exists():
+        return False
+    rebuild_progress(survey)
+    return True
@@ -0,0 +1,313 @@
+import time
+from datetime import timedelta
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from accounts.models import User
+from api.models import Survey, ReminderJob, ReminderLog, SurveyProgress
+from api.progress import required_totals, refresh_stale_progress
+
+
+def active_surveys(now=None):
+    now = now or timezone.now()
+    return Survey.objects.filter(
+        is_active=True,
+        start_at__lte=now,
+        end_at__gte=now
+    )
+
+
+def incomplete_users(survey, users):
+    """
+    User dari `users` yang belum menyelesaikan `survey`
+
+    Lookup ke SurveyProgress: total_required per user hanya menghitung pertanyaan
+    wajib pada section yang bisa dicapai (lihat api.branching), sehingga user
+    dianggap selesai jika answered_required >= total_required miliknya sendiri;
+    user tanpa progress belum mengisi.
+    """
+    return users.exclude(
+        id__in=SurveyProgress.objects.filter(
+            survey=survey,
+            answered_required__gte=F('total_required')
+        ).values('user_id')
+    )
+
+
+def cooled_down(users, now=None, cooldown_hours=None):
+    """
+    Buang user yang sudah diingatkan (survey apa pun) dalam jendela cooldown
+    """
+    cooldown_hours = settings.REMINDER_COOLDOWN_HOURS if cooldown_hours is None else cooldown_hours
+    if not cooldown_hours:
+        return users
+
+    cutoff = (now or timezone.now()) - timedelta(hours=cooldown_hours)
+    return users.exclude(
+        id__in=ReminderLog.objects.filter(last_reminded_at__gt=cutoff).values('user_id')
+    )
+
+
+def find_unfinished(users, now=None, cooldown_hours=None):
+    """
+    Survey aktif yang belum diselesaikan, digabung per user (digest)
+
+    Args:
+        users: queryset User yang menjadi target reminder
+        cooldown_hours: override REMINDER_COOLDOWN_HOURS (0 = tanpa cooldown)
+
+    Returns:
+        list of (User, [Survey, ...])
+    """
+    surveys = list(active_surveys(now))
+    totals = required_totals(surveys)
+    users = cooled_down(users, now, cooldown_hours)
+
+    digests = {}
+    for survey in surveys:
+        if not totals.get(survey.id):
+            continue
+        refresh_stale_progress(survey)
+        for user in incomplete_users(survey, users):
+            digests.setdefault(user.id, (user, []))[1].append(survey)
+
+    return list(digests.values())
+
+
+def record_reminders(pairs, now=None):
+    """
+    Catat (user_id, survey_id) yang berhasil diingatkan ke ReminderLog
+    """
+    if not pairs:
+        return
+    now = now or timezone.now()
+    pairs = set(pairs)
+
+    existing = {
+        (user_id, survey_id): log_id
+        for log_id, user_id, survey_id in ReminderLog.objects.filter(
+            user_id__in={user_id for user_id, _ in pairs},
+            survey_id__in={survey_id for _, survey_id in pairs},
+        ).values_list('id', 'user_id', 'survey_id')
+        if (user_id, survey_id) in pairs
+    }
+
+    ReminderLog.objects.filter(id__in=existing.values()).update(
+        last_reminded_at=now,
+        reminder_count=F('reminder_count') + 1
+    )
+    ReminderLog.objects.bulk_create(
+        [
+            ReminderLog(user_id=user_id, survey_id=survey_id, first_reminded_at=now, last_reminded_at=now)
+            for user_id, survey_id in pairs - existing.keys()
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def reminder_message(user, surveys):
+    """Satu email untuk semua survey yang belum diselesaikan user"""
+    if len(surveys) == 1:
+        subject = f"Reminder Survey: {surveys[0].title}"
+        intro = "Anda belum menyelesaikan survey:\n"
+    else:
+        subject = f"Reminder Survey: {len(surveys)} survey belum selesai"
+        intro = "Anda belum menyelesaikan survey berikut:\n"
+
+    items = "\n".join(
+        f"- {survey.title} (batas waktu: {survey.end_at})" for survey in surveys
+    )
+
+    return EmailMessage(
+        subject=subject,
+        body=(
+            f"Halo {user.username},\n\n"
+            f"{intro}"
+            f"{items}\n\n"
+            f"Terima kasih."
+        ),
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[user.email],
+    )
+
+
+class ReminderDelivery:
+    """
+    Pengiriman email reminder massal, satu email digest per user
+
+    Email dikirim per chunk berisi `chunk_size` pesan lewat satu koneksi SMTP
+    (get_connection + send_messages), dengan batas `rate` email/detik.
+    Status tiap penerima dicatat di `self.statuses`:
+    - sent: terkirim
+    - failed: error SMTP (koneksi dibuka ulang untuk pesan berikutnya)
+    - skipped: user tidak punya email
+    Survey dari email yang terkirim dicatat ke ReminderLog setiap chunk selesai.
+    """
+
+    def __init__(self, chunk_size=None, rate=None, connection_factory=get_connection):
+        self.chunk_size = max(1, chunk_size or settings.REMINDER_CHUNK_SIZE)
+        self.rate = settings.REMINDER_SEND_RATE if rate is None else rate
+        self.connection_factory = connection_factory
+        self.statuses = []
+        self._last_sent_at = None
+
+    def _record(self, user, surveys, status, error=''):
+        self.statuses.append({
+            'user_id': user.id,
+            'survey_ids': [survey.id for survey in surveys],
+            'email': user.email,
+            'status': status,
+            'error': error,
+        })
+
+    def _throttle(self):
+        if not self.rate:
+            return
+        if self._last_sent_at is not None:
+            wait = self._last_sent_at + 1.0 / self.rate - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+        self._last_sent_at = time.monotonic()
+
+    def _send_chunk(self, chunk):
+        connection = self.connection_factory(fail_silently=False)
+        done = 0
+        try:
+            connection.open()
+            for user, surveys in chunk:
+                self._throttle()
+                try:
+                    connection.send_messages([reminder_message(user, surveys)])
+                except Exception as e:
+                    self._record(user, surveys, 'failed', str(e))
+                    done += 1
+                    # Koneksi bisa rusak setelah error, buka ulang untuk pesan berikutnya
+                    connection.close()
+                    connection.open()
+                else:
+                    self._record(user, surveys, 'sent')
+                    done += 1
+        except Exception as e:
+            # Koneksi gagal dibuka: sisa chunk dianggap gagal
+            for user, surveys in chunk[done:]:
+                self._record(user, surveys, 'failed', str(e))
+        finally:
+            connection.close()
+
+    def send(self, digests, on_progress=None):
+        """
+        Args:
+            digests: iterable (User, [Survey, ...]) dari find_unfinished
+            on_progress: callback(delivery) setelah setiap chunk (opsional)
+
+        Returns:
+            dict jumlah sent / failed / skipped
+        """
+        pending = []
+        for user, surveys in digests:
+            if user.email:
+                pending.append((user, surveys))
+            else:
+                self._record(user, surveys, 'skipped', 'User tidak punya email')
+
+        for i in range(0, len(pending), self.chunk_size):
+            start = len(self.statuses)
+            self._send_chunk(pending[i:i + self.chunk_size])
+            record_reminders([
+                (status['user_id'], survey_id)
+                for status in self.statuses[start:] if status['status'] == 'sent'
+                for survey_id in status['survey_ids']
+            ])
+            if on_progress is not None:
+                on_progress(self)
+
+        return self.counts()
+
+    def counts(self):
+        counts = {'sent': 0, 'failed': 0, 'skipped': 0}
+        for status in self.statuses:
+            counts[status['status']] += 1
+        return counts
+
+
+# Jumlah error yang disimpan di ReminderJob.errors
+MAX_JOB_ERRORS = 100
+
+
+def job_users(job):
+    """Queryset alumni target sesuai scope job"""
+    users = User.objects.filter(role__name='Alumni')
+    if job.scope == 'program_study':
+        return users.filter(program_study=job.program_study)
+    if job.scope == 'users':
+        return users.filter(id__in=job.user_ids)
+    return users
+
+
+def claim_job(lease_seconds=None, max_attempts=None):
+    """
+    Ambil satu job dan tandai running (aman untuk beberapa worker)
+
+    Selain job queued, job running yang heartbeat-nya lebih lama dari lease
+    (worker mati setelah claim) diambil ulang; job yang sudah mencapai
+    max_attempts ditandai failed.
+    """
+    lease_seconds = settings.REMINDER_JOB_LEASE_SECONDS if lease_seconds is None else lease_seconds
+    max_attempts = settings.REMINDER_JOB_MAX_ATTEMPTS if max_attempts is None else max_attempts
+    now = timezone.now()
+    cutoff = now - timedelta(seconds=lease_seconds)
+    stale = Q(status='running') & (
+        Q(heartbeat_at__lt=cutoff) | Q(heartbeat_at__isnull=True, started_at__lt=cutoff)
+    )
+
+    with transaction.atomic():
+        for job in ReminderJob.objects.select_for_update(skip_locked=True).filter(
+            Q(status='queued') | stale
+        ).order_by('created_at')[:10]:
+            if job.status == 'running' and job.attempts >= max_attempts:
+                job.status = 'failed'
+                job.finished_at = now
+                job.errors = [*job.errors, {'error': 'Lease habis, worker berhenti saat menjalankan job'}][-MAX_JOB_ERRORS:]
+                job.save(update_fields=['status', 'finished_at', 'errors'])
+                continue
+
+            job.status = 'running'
+            job.attempts += 1
+            job.started_at = job.heartbeat_at = now
+            job.save(update_fields=['status', 'attempts', 'started_at', 'heartbeat_at'])
+            return job
+
+    return None
+
+
+def run_job(job):
+    """Jalankan job reminder, progress disimpan setiap chunk selesai"""
+    def save_progress(delivery):
+        counts = delivery.counts()
+        job.sent, job.failed, job.skipped = counts['sent'], counts['failed'], counts['skipped']
+        job.heartbeat_at = timezone.now()
+        job.errors = [
+            {'user_id': status['user_id'], 'survey_ids': status['survey_ids'], 'error': status['error']}
+            for status in delivery.statuses if status['status'] == 'failed'
+        ][:MAX_JOB_ERRORS]
+        job.save(update_fields=['sent', 'failed', 'skipped', 'errors', 'heartbeat_at'])
+
+    try:
+        digests = find_unfinished(job_users(job))
+        job.total = len(digests)
+        job.heartbeat_at = timezone.now()
+        job.save(update_fields=['total', 'heartbeat_at'])
+
+        delivery = ReminderDelivery()
+        delivery.send(digests, on_progress=save_progress)
+        save_progress(delivery)
+        job.status = 'done'
+    except Exception as e:
+        job.status = 'failed'
+        job.errors = [*job.errors, {'error': str(e)}][-MAX_JOB_ERRORS:]
+
+    job.finished_at = timezone.now()
+    job.save(update_fields=['status', 'errors', 'finished_at'])
+    return job
@@ -3,6 +3,7 @@ from api.views import ml_views
 
 urlpatterns = [
     path('classification/predict/', ml_views.classification_predict, name='classification-predict'),
+    path('classification/predict/batch/', ml_views.classification_predict_batch, name='classification-predict-batch'),
     path('classification/info/', ml_views.classification_info, name='classification-info'),
     
     path('clustering/predict/', ml_views.clustering_predict, name='clustering-predict'),
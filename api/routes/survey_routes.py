@@ -1,12 +1,18 @@
 from django.urls import path
 from api.views import survey_views as views
 from api.views import answer_views as answer_views
+from api.views import statistics_views
 # from api.views import mail_views
 
 urlpatterns = [
     # ---- Survey ----
     path("", views.survey_list_create, name="survey-list-create"),
     path("<int:pk>/", views.survey_detail, name="survey-detail"),
+    path("<int:pk>/tree/", views.survey_tree, name="survey-tree"),
+    path("<int:pk>/navigation/", views.survey_navigation, name="survey-navigation"),
+
+    # ---- Statistics ----
+    path("statistics/", statistics_views.survey_statistics, name="survey-statistics"),
 
     # ---- Section ----
     path("<int:survey_id>/sections/", views.section_list_create, name="section-list-create"),
@@ -41,6 +47,9 @@ urlpatterns = [
     # List/create answers for a survey
     path("<int:survey_id>/answers/", answer_views.answer_list_create, name="answer-list-create"),
     
+    # Export answers (CSV / XLSX)
+    path("<int:survey_id>/answers/export/", answer_views.answer_export, name="answer-export"),
+
     # Detail/update/delete specific answer
     path("<int:survey_id>/answers/<int:pk>/", answer_views.answer_detail, name="answer-detail"),
     
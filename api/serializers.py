@@ -1,6 +1,8 @@
 from rest_framework import serializers
-from .models import SupervisorAnswer, Survey, ProgramStudy, Section, Question, ProgramSpecificQuestion, Faculty, Periode, Answer, Department, QuestionBranch, SystemConfig
+from .models import SupervisorAnswer, Survey, ProgramStudy, Section, Question, ProgramSpecificQuestion, Faculty, Periode, Answer, Department, QuestionBranch, SystemConfig, ReminderJob
 import json
+from django.utils import timezone
+from api.validation import get_answer_validator, typed_answer_values
 
 class ClassificationInputSerializer(serializers.Serializer):
     F502 = serializers.FloatField(required=False, allow_null=True, help_text="Waktu tunggu kerja (bulan)")
@@ -24,6 +26,16 @@ class ClassificationOutputSerializer(serializers.Serializer):
     confidence = serializers.FloatField(help_text="Confidence score (max probability)")
 
 
+class ClassificationBatchInputSerializer(serializers.Serializer):
+    records = ClassificationInputSerializer(many=True, allow_empty=False, max_length=5000, help_text="Daftar record alumni yang akan diprediksi")
+
+
+class ClassificationBatchOutputSerializer(serializers.Serializer):
+    total = serializers.IntegerField(help_text="Number of scored records")
+    label_counts = serializers.DictField(help_text="Number of records per predicted label")
+    results = ClassificationOutputSerializer(many=True)
+
+
 class ClusteringInputSerializer(serializers.Serializer):
     F502 = serializers.FloatField(required=True, help_text="Waktu tunggu kerja (bulan)")
     F505 = serializers.FloatField(required=True, help_text="Gaji/pendapatan per bulan")
@@ -269,6 +281,28 @@ class ProgramSpecificQuestionSerializer(serializers.ModelSerializer):
         return rep
 
 
+class SurveyTreeSectionSerializer(serializers.ModelSerializer):
+    questions = QuestionSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Section
+        fields = ['id', 'title', 'description', 'order', 'questions']
+
+
+class SurveyTreeSerializer(SurveySerializer):
+    """
+    Survey lengkap: section -> question -> branch, ditambah pertanyaan khusus prodi.
+    Queryset harus sudah di-prefetch (lihat survey_tree di survey_views).
+    """
+    sections = SurveyTreeSectionSerializer(many=True, read_only=True)
+    program_specific_questions = ProgramSpecificQuestionSerializer(
+        source='tree_program_questions', many=True, read_only=True
+    )
+
+    class Meta(SurveySerializer.Meta):
+        fields = SurveySerializer.Meta.fields + ['version', 'sections', 'program_specific_questions']
+
+
 class FacultySerializer(serializers.ModelSerializer):
     class Meta:
         model = Faculty
@@ -297,6 +331,35 @@ class ProgramStudySerializer(serializers.ModelSerializer):
         ]
 
 
+class PreloadedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    PrimaryKeyRelatedField yang mengambil object dari context[preload_key]
+    (dict pk -> object) jika tersedia, sehingga validasi bulk tidak melakukan
+    satu query per item. Tanpa context tersebut perilakunya sama seperti biasa.
+    """
+
+    def __init__(self, preload_key, **kwargs):
+        self.preload_key = preload_key
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        preloaded = self.context.get(self.preload_key)
+        if preloaded is None:
+            return super().to_internal_value(data)
+
+        if isinstance(data, bool):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        try:
+            pk = int(data)
+        except (TypeError, ValueError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+
+        obj = preloaded.get(pk)
+        if obj is None:
+            self.fail('does_not_exist', pk_value=data)
+        return obj
+
+
 class AnswerSerializer(serializers.ModelSerializer):
     """
     Serializer untuk menyimpan dan mengambil jawaban survey.
@@ -316,6 +379,19 @@ class AnswerSerializer(serializers.ModelSerializer):
         source='program_specific_question.question_type', 
         read_only=True
     )
+    survey = PreloadedPrimaryKeyRelatedField('surveys', queryset=Survey.objects.all())
+    question = PreloadedPrimaryKeyRelatedField(
+        'questions',
+        queryset=Question.objects.all(),
+        required=False,
+        allow_null=True
+    )
+    program_specific_question = PreloadedPrimaryKeyRelatedField(
+        'program_specific_questions',
+        queryset=ProgramSpecificQuestion.objects.all(),
+        required=False,
+        allow_null=True
+    )
 
     class Meta:
         model = Answer
@@ -360,102 +436,12 @@ class AnswerSerializer(serializers.ModelSerializer):
                 "Hanya boleh menyediakan 'question' ATAU 'program_specific_question', tidak keduanya"
             )
 
-        # Tentukan question object dan tipe pertanyaan
-        if question:
-            question_obj = question
-            question_type = question.question_type
-        else:
-            question_obj = program_specific_question
-            question_type = program_specific_question.question_type
-
-        # Validasi answer_value sesuai tipe pertanyaan
-        if question_type == 'text':
-            if not isinstance(answer_value, str):
-                raise serializers.ValidationError(
-                    "Jawaban untuk tipe 'text' harus berupa string"
-                )
-        
-        elif question_type == 'number':
-            try:
-                float(answer_value)
-            except (ValueError, TypeError):
-                raise serializers.ValidationError(
-                    "Jawaban untuk tipe 'number' harus berupa angka"
-                )
-        
-        elif question_type in ['radio', 'dropdown']:
-            # Single choice - harus string dan harus ada di options
-            if not isinstance(answer_value, str):
-                raise serializers.ValidationError(
-                    f"Jawaban untuk tipe '{question_type}' harus berupa string"
-                )
-            if question_obj.options:
-                try:
-                    options = json.loads(question_obj.options) if isinstance(question_obj.options, str) else question_obj.options
-                    if answer_value not in options:
-                        raise serializers.ValidationError(
-                            f"Jawaban '{answer_value}' tidak ada dalam pilihan yang tersedia"
-                        )
-                except (json.JSONDecodeError, TypeError):
-                    # Jika options bukan JSON, anggap sebagai line-separated
-                    options = question_obj.options.splitlines() if question_obj.options else []
-                    if answer_value not in options:
-                        raise serializers.ValidationError(
-                            f"Jawaban '{answer_value}' tidak ada dalam pilihan yang tersedia"
-                        )
-        
-        elif question_type == 'checkbox':
-            # Multiple choice - harus array dan semua item harus ada di options
-            if not isinstance(answer_value, (list, str)):
-                raise serializers.ValidationError(
-                    "Jawaban untuk tipe 'checkbox' harus berupa array/list"
-                )
-            
-            # Jika string, coba parse sebagai JSON
-            if isinstance(answer_value, str):
-                try:
-                    answer_value = json.loads(answer_value)
-                except json.JSONDecodeError:
-                    raise serializers.ValidationError(
-                        "Jawaban untuk tipe 'checkbox' harus berupa JSON array yang valid"
-                    )
-            
-            if not isinstance(answer_value, list):
-                raise serializers.ValidationError(
-                    "Jawaban untuk tipe 'checkbox' harus berupa array/list"
-                )
-            
-            if question_obj.options:
-                try:
-                    options = json.loads(question_obj.options) if isinstance(question_obj.options, str) else question_obj.options
-                    for ans in answer_value:
-                        if ans not in options:
-                            raise serializers.ValidationError(
-                                f"Jawaban '{ans}' tidak ada dalam pilihan yang tersedia"
-                            )
-                except (json.JSONDecodeError, TypeError):
-                    options = question_obj.options.splitlines() if question_obj.options else []
-                    for ans in answer_value:
-                        if ans not in options:
-                            raise serializers.ValidationError(
-                                f"Jawaban '{ans}' tidak ada dalam pilihan yang tersedia"
-                            )
-            
-            # Simpan sebagai JSON string
-            data['answer_value'] = json.dumps(answer_value)
-        
-        elif question_type == 'scale':
-            # Scale 1-5 - harus angka antara 1-5
-            try:
-                scale_value = int(answer_value)
-                if scale_value < 1 or scale_value > 5:
-                    raise serializers.ValidationError(
-                        "Jawaban untuk tipe 'scale' harus berupa angka antara 1-5"
-                    )
-            except (ValueError, TypeError):
-                raise serializers.ValidationError(
-                    "Jawaban untuk tipe 'scale' harus berupa angka antara 1-5"
-                )
+        # Validasi answer_value sesuai tipe pertanyaan (validator dikompilasi per pertanyaan)
+        question_obj = question or program_specific_question
+        answer_value = get_answer_validator(question_obj).validate(answer_value)
+        if 'answer_value' in data:
+            data['answer_value'] = answer_value
+            data.update(typed_answer_values(question_obj.question_type, answer_value))
 
         return data
 
@@ -498,4 +484,37 @@ class SupervisorAnswerSerializer(serializers.ModelSerializer):
 class SystemConfigSerializer(serializers.ModelSerializer):
     class Meta:
         model = SystemConfig
-        fields = ['id', 'key', 'value']
\ No newline at end of file
+        fields = ['id', 'key', 'value']
+
+class ReminderUsersSerializer(serializers.Serializer):
+    """Body endpoint reminder per user: daftar ID alumni (NIM)"""
+    user_ids = serializers.ListField(child=serializers.CharField(), required=False, default=list)
+
+
+class ReminderJobSerializer(serializers.ModelSerializer):
+    processed = serializers.IntegerField(read_only=True)
+    progress = serializers.SerializerMethodField()
+    throughput = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ReminderJob
+        fields = [
+            'id', 'scope', 'status', 'total', 'processed', 'sent', 'failed', 'skipped',
+            'progress', 'throughput', 'errors', 'created_at', 'started_at', 'finished_at',
+        ]
+
+    def get_progress(self, obj):
+        """Persentase penerima yang sudah diproses"""
+        if obj.status == 'done':
+            return 100.0
+        if not obj.total:
+            return 0.0
+        return round(obj.processed * 100 / obj.total, 2)
+
+    def get_throughput(self, obj):
+        """Email diproses per detik sejak job mulai"""
+        if obj.started_at is None:
+            return None
+        end = obj.finished_at or timezone.now()
+        elapsed = (end - obj.started_at).total_seconds()
+        return round(obj.processed / elapsed, 2) if elapsed > 0 else None
@@ -0,0 +1,62 @@
+from django.db.models import F
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+from api.models import Survey, Section, Question, QuestionBranch, ProgramSpecificQuestion, Answer
+from api.validation import invalidate_answer_validator, typed_answer_values
+
+
+def bump_survey_version(**filters):
+    Survey.objects.filter(**filters).update(version=F('version') + 1)
+
+
+@receiver(pre_save, sender=Survey)
+def survey_pre_save(sender, instance, **kwargs):
+    # Naikkan di database (version = version + 1) supaya instance lama tidak menimpa versi baru
+    if instance.pk and not kwargs.get('raw'):
+        instance.version = F('version') + 1
+
+
+@receiver(post_save, sender=Survey)
+def survey_post_save(sender, instance, created, **kwargs):
+    # Ganti ekspresi F() dengan angka versi yang tersimpan (untuk ETag, cache key, serializer)
+    if not created and not kwargs.get('raw'):
+        instance.refresh_from_db(fields=['version'])
+
+
+@receiver(post_save, sender=Section)
+@receiver(post_delete, sender=Section)
+def section_changed(sender, instance, **kwargs):
+    bump_survey_version(pk=instance.survey_id)
+
+
+@receiver(post_save, sender=Question)
+@receiver(post_delete, sender=Question)
+def question_changed(sender, instance, **kwargs):
+    invalidate_answer_validator(instance)
+    bump_survey_version(sections__id=instance.section_id)
+
+
+@receiver(post_save, sender=QuestionBranch)
+@receiver(post_delete, sender=QuestionBranch)
+def branch_changed(sender, instance, **kwargs):
+    bump_survey_version(sections__questions__id=instance.question_id)
+
+
+@receiver(post_save, sender=ProgramSpecificQuestion)
+@receiver(post_delete, sender=ProgramSpecificQuestion)
+def program_question_changed(sender, instance, **kwargs):
+    invalidate_answer_validator(instance)
+    if instance.survey_id:
+        bump_survey_version(pk=instance.survey_id)
+
+
+@receiver(pre_save, sender=Answer)
+def answer_pre_save(sender, instance, **kwargs):
+    # Kolom bertipe selalu mengikuti answer_value, juga untuk simpan lewat admin / ORM
+    # (bulk_create di bulk_upsert_answers memakai nilai dari AnswerSerializer)
+    if kwargs.get('raw'):
+        return
+    question = instance.question if instance.question_id else instance.program_specific_question
+    if question is not None:
+        for field, value in typed_answer_values(question.question_type, instance.answer_value).items():
+            setattr(instance, field, value)
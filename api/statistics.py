@@ -0,0 +1,290 @@
+import json
+import math
+from collections import defaultdict
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from api.models import Question, ProgramSpecificQuestion, Answer, QuestionStatistic
+
+CHOICE_TYPES = ('radio', 'dropdown', 'checkbox')
+NUMERIC_TYPES = ('number', 'scale')
+
+
+def _number_label(value):
+    if value == int(value):
+        return str(int(value))
+    return f"{value:.10f}".rstrip('0')
+
+
+def number_bin(value):
+    """
+    Batas bawah bin histogram untuk jawaban number, deret 1-2-5
+    (..., 1, 2, 5, 10, 20, 50, ...); nilai negatif memakai bin dari nilai absolutnya
+    """
+    if value == 0:
+        return '0'
+    magnitude = abs(value)
+    exponent = math.floor(math.log10(magnitude))
+    mantissa = magnitude / 10 ** exponent
+    lower = 1 if mantissa < 2 else 2 if mantissa < 5 else 5
+    bound = lower * 10 ** exponent
+    return _number_label(math.copysign(bound, value))
+
+
+def parse_options(options):
+    if not options:
+        return []
+    try:
+        parsed = json.loads(options)
+    except (json.JSONDecodeError, TypeError):
+        return options.splitlines()
+    return parsed if isinstance(parsed, list) else []
+
+
+def numeric_option(question_type, number):
+    """Option counter untuk jawaban angka: nilai skala, atau bin histogram untuk number"""
+    return _number_label(number) if question_type == 'scale' else number_bin(number)
+
+
+def typed_values(answer):
+    """(numeric_value, choice_key, choice_keys) dari kolom bertipe Answer"""
+    return answer.numeric_value, answer.choice_key, answer.choice_keys
+
+
+def answer_contributions(question_type, numeric_value, choice_key, choice_keys):
+    """
+    Kontribusi satu jawaban ke counter, dari kolom bertipe (lihat api.validation.typed_answer_values)
+
+    Returns:
+        list of (option, nilai untuk value_sum)
+    """
+    if question_type in ('radio', 'dropdown'):
+        return [(choice_key, 0.0)] if choice_key else []
+
+    if question_type == 'checkbox':
+        return [(option, 0.0) for option in choice_keys or []]
+
+    if question_type in NUMERIC_TYPES and numeric_value is not None:
+        return [(numeric_option(question_type, numeric_value), numeric_value)]
+
+    return []
+
+
+def answer_question(answer):
+    """Question atau ProgramSpecificQuestion yang dijawab oleh answer"""
+    return answer.question if answer.question_id else answer.program_specific_question
+
+
+def statistic_target(question):
+    """
+    Returns:
+        (question_id, program_specific_question_id) untuk Question / ProgramSpecificQuestion
+    """
+    if isinstance(question, ProgramSpecificQuestion):
+        return None, question.id
+    return question.id, None
+
+
+def add_contributions(deltas, question, program_study_id, values, sign):
+    if question is None:
+        return
+    target = statistic_target(question)
+    for option, number in answer_contributions(question.question_type, *values):
+        delta = deltas[(*target, program_study_id, option[:255])]
+        delta[0] += sign
+        delta[1] += sign * number
+
+
+def apply_deltas(deltas):
+    """
+    Terapkan perubahan counter
+    {(question_id, program_specific_question_id, program_study_id, option): [count, sum]}
+
+    Query tetap: sisipkan counter yang belum ada (ignore_conflicts, aman jika dua
+    submit membuat counter yang sama bersamaan), baca semua counter terkait dengan
+    lock, lalu bulk_update. Counter yang menjadi 0 tidak dihapus supaya tidak
+    berebut dengan transaksi lain; pembacaan mengabaikan counter 0.
+    """
+    deltas = {key: delta for key, delta in deltas.items() if delta[0] or delta[1]}
+    if not deltas:
+        return
+
+    with transaction.atomic():
+        QuestionStatistic.objects.bulk_create([
+            QuestionStatistic(
+                question_id=question_id, program_specific_question_id=program_question_id,
+                program_study_id=program_study_id, option=option,
+            )
+            for question_id, program_question_id, program_study_id, option in deltas
+        ], ignore_conflicts=True)
+
+        rows = []
+        for row in QuestionStatistic.objects.select_for_update().filter(
+            Q(question_id__in={key[0] for key in deltas if key[0] is not None})
+            | Q(program_specific_question_id__in={key[1] for key in deltas if key[1] is not None}),
+            option__in={key[3] for key in deltas},
+        ).order_by('id'):
+            delta = deltas.get((row.question_id, row.program_specific_question_id, row.program_study_id, row.option))
+            if delta is None:
+                continue
+            row.count += delta[0]
+            row.value_sum += delta[1]
+            rows.append(row)
+
+        QuestionStatistic.objects.bulk_update(rows, ['count', 'value_sum'])
+
+
+def update_answer_statistics(removed=(), added=()):
+    """
+    Perbarui counter untuk jawaban yang dihapus / ditambahkan
+
+    Args:
+        removed, added: iterable (Question / ProgramSpecificQuestion, program_study_id, typed_values)
+    """
+    deltas = defaultdict(lambda: [0, 0.0])
+    for question, program_study_id, values in removed:
+        add_contributions(deltas, question, program_study_id, values, -1)
+    for question, program_study_id, values in added:
+        add_contributions(deltas, question, program_study_id, values, 1)
+    apply_deltas(deltas)
+
+
+def recompute_statistics(survey, chunk_size=5000):
+    """
+    Hitung ulang seluruh counter satu survey (termasuk pertanyaan program studi) dari tabel Answer
+
+    Agregasi dilakukan di database atas kolom bertipe: COUNT per choice_key untuk
+    radio/dropdown, COUNT + SUM per numeric_value untuk number/scale (bin dihitung
+    per nilai unik). Hanya choice_keys checkbox (JSON array) yang dibaca per baris.
+
+    Returns:
+        jumlah baris counter yang ditulis
+    """
+    questions = Question.objects.filter(
+        section__survey=survey,
+        question_type__in=CHOICE_TYPES + NUMERIC_TYPES
+    ).in_bulk()
+    program_questions = ProgramSpecificQuestion.objects.filter(
+        survey=survey,
+        question_type__in=CHOICE_TYPES + NUMERIC_TYPES
+    ).in_bulk()
+
+    def question_type(question_id, program_question_id):
+        if question_id:
+            return questions[question_id].question_type
+        return program_questions[program_question_id].question_type
+
+    answers = Answer.objects.filter(
+        Q(question_id__in=list(questions)) | Q(program_specific_question_id__in=list(program_questions))
+    ).order_by()
+    keys = ('question_id', 'program_specific_question_id', 'user__program_study_id')
+
+    deltas = defaultdict(lambda: [0, 0.0])
+    for question_id, program_question_id, program_study_id, option, count in answers.filter(
+        choice_key__isnull=False
+    ).values(*keys, 'choice_key').annotate(count=Count('id')).values_list(*keys, 'choice_key', 'count'):
+        if question_type(question_id, program_question_id) in ('radio', 'dropdown'):
+            deltas[(question_id, program_question_id, program_study_id, option)][0] += count
+
+    for question_id, program_question_id, program_study_id, number, count, total in answers.filter(
+        numeric_value__isnull=False
+    ).values(*keys, 'numeric_value').annotate(
+        count=Count('id'), total=Sum('numeric_value')
+    ).values_list(*keys, 'numeric_value', 'count', 'total'):
+        kind = question_type(question_id, program_question_id)
+        if kind in NUMERIC_TYPES:
+            delta = deltas[(question_id, program_question_id, program_study_id, numeric_option(kind, number))]
+            delta[0] += count
+            delta[1] += total
+
+    for question_id, program_question_id, program_study_id, options in answers.filter(
+        choice_keys__isnull=False
+    ).values_list(*keys, 'choice_keys').iterator(chunk_size=chunk_size):
+        if question_type(question_id, program_question_id) == 'checkbox':
+            for option in options:
+                deltas[(question_id, program_question_id, program_study_id, option[:255])][0] += 1
+
+    with transaction.atomic():
+        QuestionStatistic.objects.filter(
+            Q(question_id__in=list(questions)) | Q(program_specific_question_id__in=list(program_questions))
+        ).delete()
+        QuestionStatistic.objects.bulk_create([
+            QuestionStatistic(
+                question_id=question_id, program_specific_question_id=program_question_id,
+                program_study_id=program_study_id, option=option, count=count, value_sum=value_sum,
+            )
+            for (question_id, program_question_id, program_study_id, option), (count, value_sum) in deltas.items()
+            if count > 0
+        ], batch_size=1000)
+
+    return len(deltas)
+
+
+def question_statistics(questions, program_study_id=None, program_questions=None):
+    """
+    Distribusi jawaban per pertanyaan dari counter (tanpa membaca Answer)
+
+    Args:
+        questions: queryset Question (urutan dipertahankan)
+        program_study_id: filter program studi responden (opsional)
+        program_questions: queryset ProgramSpecificQuestion, ditampilkan setelah questions (opsional)
+
+    Returns:
+        list of dict per pertanyaan
+    """
+    questions = list(questions.filter(
+        question_type__in=CHOICE_TYPES + NUMERIC_TYPES
+    ).select_related('section'))
+    if program_questions is not None:
+        program_questions = list(program_questions.filter(question_type__in=CHOICE_TYPES + NUMERIC_TYPES))
+    else:
+        program_questions = []
+
+    counters = QuestionStatistic.objects.filter(
+        Q(question__in=questions) | Q(program_specific_question__in=program_questions),
+        count__gt=0,
+    )
+    if program_study_id is not None:
+        counters = counters.filter(program_study_id=program_study_id)
+
+    rows = defaultdict(dict)
+    for question_id, program_question_id, option, count, value_sum in counters.values(
+        'question_id', 'program_specific_question_id', 'option'
+    ).annotate(
+        total=Sum('count'), total_value=Sum('value_sum')
+    ).values_list('question_id', 'program_specific_question_id', 'option', 'total', 'total_value'):
+        rows[(question_id, program_question_id)][option] = (count, value_sum)
+
+    results = []
+    for question in questions + program_questions:
+        target = statistic_target(question)
+        counts = rows.get(target, {})
+        total = sum(count for count, _ in counts.values())
+        result = {
+            'question_id': target[0],
+            'program_specific_question_id': target[1],
+            'survey_id': question.section.survey_id if target[0] else question.survey_id,
+            'code': question.code,
+            'text': question.text,
+            'question_type': question.question_type,
+            'total': total,
+        }
+
+        if question.question_type in CHOICE_TYPES:
+            # Opsi yang tersedia (termasuk yang belum dipilih) lalu opsi lain yang tercatat
+            options = [str(option) for option in parse_options(question.options)]
+            options += sorted(option for option in counts if option not in options)
+            result['options'] = [
+                {'option': option, 'count': counts.get(option, (0, 0))[0]}
+                for option in options
+            ]
+        else:
+            value_sum = sum(number for _, number in counts.values())
+            result['mean'] = round(value_sum / total, 4) if total else None
+            result['histogram'] = [
+                {'bin': option, 'count': counts[option][0]}
+                for option in sorted(counts, key=float)
+            ]
+
+        results.append(result)
+
+    return results
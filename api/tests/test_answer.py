@@ -0,0 +1,567 @@
+import csv
+import io
+import json
+import tempfile
+from datetime import timedelta
+from unittest import mock
+
+from django.core import mail
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.utils import timezone
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from rest_framework import serializers, status
+
+from api.models import (
+    Survey, Section, Question, ProgramSpecificQuestion, ProgramStudy, Answer,
+    SystemConfig, SupervisorToken, SupervisorInvitation, SurveyProgress
+)
+from api.validation import get_answer_validator
+from accounts.models import User, Role
+
+
+class AnswerBulkCreateAPITest(APITestCase):
+    def setUp(self):
+        self.program_study = ProgramStudy.objects.create(name="Informatika")
+        self.alumni = User.objects.create_user(
+            id='3001', username='Alumni', password='pass12345',
+            role=Role.objects.create(name='Alumni'),
+            program_study=self.program_study,
+        )
+        self.client.force_authenticate(self.alumni)
+
+        self.survey = Survey.objects.create(title="Exit Survey", survey_type="exit")
+        self.section = Section.objects.create(survey=self.survey, title="Profil", order=1)
+        self.questions = [
+            Question.objects.create(section=self.section, text=f"Q{i}", question_type="text", order=i)
+            for i in range(30)
+        ]
+        self.radio = Question.objects.create(
+            section=self.section, text="Radio", question_type="radio", order=99,
+            options=json.dumps(["Ya", "Tidak"])
+        )
+        self.program_question = ProgramSpecificQuestion.objects.create(
+            program_study=self.program_study, survey=self.survey, text="Prodi", question_type="number"
+        )
+        self.url = f"/api/surveys/{self.survey.id}/answers/bulk/"
+
+    def payload(self, n, value="Jawaban"):
+        return {"answers": [
+            {"question": question.id, "answer_value": value}
+            for question in self.questions[:n]
+        ]}
+
+    def test_bulk_create(self):
+        print("\n[Test feature] Bulk answer WHEN all answers are valid → expect 201 & all rows stored")
+
+        payload = self.payload(3)
+        payload["answers"].append({"program_specific_question": self.program_question.id, "answer_value": "7"})
+
+        res = self.client.post(self.url, payload, format="json")
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(res.data), 4)
+        self.assertEqual(res.data[0]["question"], self.questions[0].id)
+        self.assertEqual(res.data[3]["answer_value"], 7)
+        self.assertEqual(Answer.objects.count(), 4)
+
+    def test_resubmit_upserts(self):
+        print("\n[Test feature] Bulk answer WHEN survey is resubmitted → expect answers updated, not duplicated")
+
+        self.client.post(self.url, self.payload(5, "Lama"), format="json")
+        res = self.client.post(self.url, self.payload(5, "Baru"), format="json")
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Answer.objects.count(), 5)
+        self.assertEqual(set(Answer.objects.values_list("answer_value", flat=True)), {"Baru"})
+
+    def test_partial_errors(self):
+        print("\n[Test feature] Bulk answer WHEN some answers are invalid → expect 207 with valid ones stored")
+
+        payload = self.payload(2)
+        payload["answers"] += [
+            {"question": self.radio.id, "answer_value": "Mungkin"},
+            {"question": 999999, "answer_value": "x"},
+        ]
+
+        res = self.client.post(self.url, payload, format="json")
+
+        self.assertEqual(res.status_code, 207)
+        self.assertEqual(len(res.data["success"]), 2)
+        self.assertEqual([error["index"] for error in res.data["errors"]], [2, 3])
+        self.assertIn("question", res.data["errors"][1]["errors"])
+        self.assertEqual(Answer.objects.count(), 2)
+
+    def test_query_count_is_constant(self):
+        print("\n[Test feature] Bulk answer WHEN survey has more answers → expect same number of queries")
+
+        with CaptureQueriesContext(connection) as small:
+            self.client.post(self.url, self.payload(2), format="json")
+        Answer.objects.all().delete()
+
+        with CaptureQueriesContext(connection) as large:
+            self.client.post(self.url, self.payload(30), format="json")
+
+        self.assertEqual(len(small), len(large))
+
+
+class AnswerValidatorTest(APITestCase):
+    def setUp(self):
+        section = Section.objects.create(
+            survey=Survey.objects.create(title="Exit Survey", survey_type="exit"), title="Profil", order=1
+        )
+        self.checkbox = Question.objects.create(
+            section=section, text="Skill", question_type="checkbox", options=json.dumps(["IT", "English"])
+        )
+        self.dropdown = Question.objects.create(
+            section=section, text="Kota", question_type="dropdown", options="Bandung\nJakarta"
+        )
+
+    def test_compiled_once_and_invalidated_on_write(self):
+        print("\n[Test feature] Answer validator WHEN question is reused then edited → expect cached until question changes")
+
+        validator = get_answer_validator(self.checkbox)
+        self.assertEqual(validator.choices, frozenset(["IT", "English"]))
+        self.assertIs(get_answer_validator(Question.objects.get(pk=self.checkbox.pk)), validator)
+        self.assertEqual(validator.validate(["IT", "English"]), json.dumps(["IT", "English"]))
+        self.assertEqual(get_answer_validator(self.dropdown).validate("Jakarta"), "Jakarta")
+
+        self.checkbox.options = json.dumps(["IT", "Desain"])
+        self.checkbox.save()
+
+        validator = get_answer_validator(Question.objects.get(pk=self.checkbox.pk))
+        self.assertEqual(validator.validate('["Desain"]'), json.dumps(["Desain"]))
+        with self.assertRaises(serializers.ValidationError):
+            validator.validate(["English"])
+        with self.assertRaises(serializers.ValidationError):
+            validator.validate([["IT"]])
+
+
+class AnswerTypedValuesTest(APITestCase):
+    def setUp(self):
+        self.alumni = User.objects.create_user(
+            id='3701', username='Alumni', password='pass12345', role=Role.objects.create(name='Alumni')
+        )
+        self.client.force_authenticate(self.alumni)
+
+        self.survey = Survey.objects.create(title="Exit Survey", survey_type="exit")
+        section = Section.objects.create(survey=self.survey, title="Profil", order=1)
+        self.salary = Question.objects.create(section=section, text="Gaji", question_type="number", order=1)
+        self.status_q = Question.objects.create(
+            section=section, text="Status", question_type="radio", order=2, options=json.dumps(["Bekerja", "Studi"])
+        )
+        self.skills = Question.objects.create(
+            section=section, text="Skill", question_type="checkbox", order=3, options=json.dumps(["IT", "English"])
+        )
+        self.scale = Question.objects.create(section=section, text="Kepuasan", question_type="scale", order=4)
+        self.url = f"/api/surveys/{self.survey.id}/answers/"
+
+    def typed(self, question):
+        return Answer.objects.values_list('numeric_value', 'choice_key', 'choice_keys').get(question=question)
+
+    def test_typed_columns_populated_on_write(self):
+        print("\n[Test feature] Typed answer columns WHEN answers are submitted → expect numeric/choice columns filled")
+
+        res = self.client.post(f"{self.url}bulk/", {"answers": [
+            {"question": self.salary.id, "answer_value": "4500000"},
+            {"question": self.status_q.id, "answer_value": "Bekerja"},
+            {"question": self.skills.id, "answer_value": json.dumps(["IT", "English"])},
+        ]}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.client.post(self.url, {"question": self.scale.id, "answer_value": "4"}, format="json")
+
+        self.assertEqual(self.typed(self.salary), (4500000.0, None, None))
+        self.assertEqual(self.typed(self.status_q), (None, "Bekerja", None))
+        self.assertEqual(self.typed(self.skills), (None, None, ["IT", "English"]))
+        self.assertEqual(self.typed(self.scale), (4.0, None, None))
+
+        # Resubmit lewat upsert ikut memperbarui kolom bertipe
+        self.client.post(f"{self.url}bulk/", {"answers": [
+            {"question": self.status_q.id, "answer_value": "Studi"},
+        ]}, format="json")
+        self.assertEqual(self.typed(self.status_q), (None, "Studi", None))
+
+    def test_typed_columns_filled_on_orm_save(self):
+        print("\n[Test feature] Typed answer columns WHEN an answer is saved outside the API → expect columns follow answer_value")
+
+        answer = Answer.objects.create(user=self.alumni, survey=self.survey, question=self.scale, answer_value="3")
+        self.assertEqual(self.typed(self.scale), (3.0, None, None))
+
+        answer.answer_value = "5"
+        answer.save()
+        self.assertEqual(self.typed(self.scale), (5.0, None, None))
+
+    def test_backfill_command(self):
+        print("\n[Test feature] Backfill typed answers WHEN rows predate the columns → expect columns filled from answer_value")
+
+        Answer.objects.create(user=self.alumni, survey=self.survey, question=self.salary, answer_value="12.5")
+        Answer.objects.create(user=self.alumni, survey=self.survey, question=self.skills, answer_value="IT\nEnglish")
+        Answer.objects.create(user=self.alumni, survey=self.survey, question=self.status_q, answer_value=" Studi ")
+        # Seperti baris lama sebelum kolom bertipe diisi saat simpan
+        Answer.objects.update(numeric_value=None, choice_key=None, choice_keys=None)
+
+        call_command("backfill_answer_values", "--batch-size", "2", stdout=io.StringIO())
+
+        self.assertEqual(self.typed(self.salary), (12.5, None, None))
+        self.assertEqual(self.typed(self.skills), (None, None, ["IT", "English"]))
+        self.assertEqual(self.typed(self.status_q), (None, "Studi", None))
+
+
+class AnswerIndexBenchmarkTest(APITestCase):
+    def test_benchmark_records_plans_and_rolls_back(self):
+        print("\n[Test feature] Answer index benchmark WHEN run on a small seed → expect plans before/after and no data left")
+
+        output = io.StringIO()
+        with tempfile.NamedTemporaryFile(suffix='.json') as report_file:
+            call_command(
+                # Database test sudah sementara, jadi boleh dijalankan di tempat
+                "benchmark_answer_indexes", "--users", "20", "--questions", "3", "--repeat", "1",
+                "--output", report_file.name, "--i-know-this-locks-production", stdout=output,
+            )
+            report = json.load(report_file)
+
+        self.assertEqual(report["answers"], 20 * 3 * 3)
+        self.assertIn("answer_survey_created_idx", report["indexes"])
+        self.assertEqual(set(report["before"]), set(report["after"]))
+        self.assertIn("answer_survey_created_idx", report["after"]["list_admin"]["plan"])
+        self.assertFalse(Answer.objects.exists())
+        self.assertFalse(User.objects.filter(id__startswith="bench-").exists())
+
+    def test_benchmark_uses_throwaway_database_by_default(self):
+        print("\n[Test feature] Answer index benchmark WHEN run without the in-place flag → expect a throwaway database")
+
+        old_name = connection.settings_dict['NAME']
+        with mock.patch.object(connection.creation, 'create_test_db') as create_test_db, \
+                mock.patch.object(connection.creation, 'destroy_test_db') as destroy_test_db:
+            call_command(
+                "benchmark_answer_indexes", "--users", "5", "--questions", "2", "--repeat", "1",
+                stdout=io.StringIO(),
+            )
+
+        create_test_db.assert_called_once()
+        destroy_test_db.assert_called_once_with(old_name, verbosity=0)
+
+
+@override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend')
+class SupervisorInvitationOutboxTest(APITestCase):
+    def setUp(self):
+        self.alumni = User.objects.create_user(
+            id='3101', username='Alumni', password='pass12345',
+            role=Role.objects.create(name='Alumni'),
+            program_study=ProgramStudy.objects.create(name="Informatika"),
+        )
+        self.client.force_authenticate(self.alumni)
+
+        self.survey = Survey.objects.create(title="Tracer Study", survey_type="lv1")
+        self.skp = Survey.objects.create(title="Kepuasan Pengguna", survey_type="skp")
+        section = Section.objects.create(survey=self.survey, title="Atasan", order=1)
+        self.question = Question.objects.create(
+            section=section, text="Email atasan", code="SPV_EMAIL", question_type="text", order=1
+        )
+        SystemConfig.objects.create(key="QUESTION_CODE_SPV_EMAIL", value="SPV_EMAIL")
+        self.url = f"/api/surveys/{self.survey.id}/answers/bulk/"
+
+    def submit(self):
+        return self.client.post(self.url, {"answers": [
+            {"question": self.question.id, "answer_value": "atasan@example.com"}
+        ]}, format="json")
+
+    def send(self, **options):
+        call_command("send_supervisor_invitations", stdout=io.StringIO(), **options)
+
+    def test_submit_only_queues_invitation(self):
+        print("\n[Test feature] Submit lv1 WHEN answers are valid → expect invitation queued, no email sent")
+
+        res = self.submit()
+        self.submit()
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(SupervisorInvitation.objects.filter(status='pending').count(), 1)
+
+    def test_worker_sends_invitation(self):
+        print("\n[Test feature] Invitation worker WHEN invitation is pending → expect email with token link sent")
+
+        self.submit()
+        self.send()
+
+        invitation = SupervisorInvitation.objects.get()
+        token = SupervisorToken.objects.get(alumni=self.alumni)
+        self.assertEqual(invitation.status, 'sent')
+        self.assertEqual(invitation.token, token)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ["atasan@example.com"])
+        self.assertIn(f"/surveys/{self.skp.id}/skp?token={token.token}", mail.outbox[0].body)
+
+    def test_worker_retries_with_backoff(self):
+        print("\n[Test feature] Invitation worker WHEN email is missing → expect retry with backoff, then failed")
+
+        SupervisorInvitation.objects.create(alumni=self.alumni, survey=self.survey)
+        self.send(max_attempts=2, backoff=60)
+
+        invitation = SupervisorInvitation.objects.get()
+        self.assertEqual(invitation.status, 'pending')
+        self.assertEqual(invitation.attempts, 1)
+        self.assertGreater(invitation.next_attempt_at, timezone.now() + timedelta(seconds=50))
+
+        SupervisorInvitation.objects.update(next_attempt_at=timezone.now())
+        self.send(max_attempts=2)
+
+        invitation.refresh_from_db()
+        self.assertEqual(invitation.status, 'failed')
+        self.assertEqual(invitation.attempts, 2)
+        self.assertTrue(invitation.last_error)
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_stale_sending_invitation_is_reclaimed(self):
+        print("\n[Test feature] Invitation worker WHEN a worker died while sending → expect lease expiry then resend")
+
+        self.submit()
+        invitation = SupervisorInvitation.objects.get()
+        SupervisorInvitation.objects.update(
+            status='sending', attempts=1, next_attempt_at=timezone.now() + timedelta(minutes=5)
+        )
+        self.send()
+        self.assertEqual(len(mail.outbox), 0)
+
+        SupervisorInvitation.objects.update(next_attempt_at=timezone.now())
+        self.send()
+
+        invitation.refresh_from_db()
+        self.assertEqual(invitation.status, 'sent')
+        self.assertEqual(invitation.attempts, 2)
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_token_committed_before_send_and_reused(self):
+        print("\n[Test feature] Invitation worker WHEN SMTP fails after token creation → expect same token on retry")
+
+        self.submit()
+        with mock.patch(
+            "api.management.commands.send_supervisor_invitations.send_mail", side_effect=OSError("SMTP down")
+        ):
+            self.send()
+
+        invitation = SupervisorInvitation.objects.get()
+        self.assertEqual(invitation.status, 'pending')
+        self.assertIsNotNone(invitation.token)
+
+        SupervisorInvitation.objects.update(next_attempt_at=timezone.now())
+        self.send()
+
+        invitation.refresh_from_db()
+        self.assertEqual(invitation.status, 'sent')
+        self.assertEqual(SupervisorToken.objects.filter(alumni=self.alumni).count(), 1)
+        self.assertIn(f"token={invitation.token.token}", mail.outbox[0].body)
+
+
+class SurveyProgressTest(APITestCase):
+    def setUp(self):
+        self.alumni = User.objects.create_user(
+            id='3201', username='Alumni', password='pass12345',
+            role=Role.objects.create(name='Alumni'),
+            program_study=ProgramStudy.objects.create(name="Informatika"),
+        )
+        self.client.force_authenticate(self.alumni)
+
+        self.survey = Survey.objects.create(title="Exit Survey", survey_type="exit")
+        section = Section.objects.create(survey=self.survey, title="Profil", order=1)
+        self.required = [
+            Question.objects.create(section=section, text=f"Wajib {i}", question_type="text", is_required=True, order=i)
+            for i in range(2)
+        ]
+        self.optional = Question.objects.create(section=section, text="Opsional", question_type="text", order=3)
+        self.url = f"/api/surveys/{self.survey.id}/answers/"
+
+    def progress(self):
+        return SurveyProgress.objects.get(user=self.alumni, survey=self.survey)
+
+    def test_progress_follows_answer_writes(self):
+        print("\n[Test feature] Survey progress WHEN answers are created, bulk-submitted and deleted → expect progress updated")
+
+        self.client.post(self.url, {"question": self.required[0].id, "answer_value": "a"}, format="json")
+        self.assertEqual((self.progress().answered_required, self.progress().total_required), (1, 2))
+        self.assertFalse(self.progress().is_completed)
+
+        self.client.post(f"{self.url}bulk/", {"answers": [
+            {"question": self.required[1].id, "answer_value": "b"},
+            {"question": self.optional.id, "answer_value": "c"},
+        ]}, format="json")
+        completed_at = self.progress().completed_at
+        self.assertEqual(self.progress().answered_required, 2)
+        self.assertIsNotNone(completed_at)
+
+        answer = Answer.objects.get(question=self.required[0])
+        self.client.force_authenticate(User.objects.create_user(
+            id='3202', username='Admin', password='pass12345', role=Role.objects.create(name='Admin')
+        ))
+        res = self.client.delete(f"{self.url}{answer.id}/")
+
+        self.assertEqual(res.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self.progress().answered_required, 1)
+        self.assertIsNone(self.progress().completed_at)
+
+    def test_rebuild_command(self):
+        print("\n[Test feature] Rebuild progress WHEN answers were stored without progress → expect progress recomputed")
+
+        for question in self.required:
+            Answer.objects.create(user=self.alumni, survey=self.survey, question=question, answer_value="x")
+
+        call_command("rebuild_survey_progress", stdout=io.StringIO())
+
+        self.assertEqual(self.progress().answered_required, 2)
+        self.assertTrue(self.progress().is_completed)
+
+
+class AnswerKeysetPaginationTest(APITestCase):
+    def setUp(self):
+        self.alumni = User.objects.create_user(
+            id='3301', username='Alumni', password='pass12345',
+            role=Role.objects.create(name='Alumni'),
+        )
+        self.client.force_authenticate(self.alumni)
+
+        self.survey = Survey.objects.create(title="Exit Survey", survey_type="exit")
+        section = Section.objects.create(survey=self.survey, title="Profil", order=1)
+        self.answers = [
+            Answer.objects.create(
+                user=self.alumni, survey=self.survey, answer_value=str(i),
+                question=Question.objects.create(section=section, text=f"Q{i}", question_type="text", order=i),
+            )
+            for i in range(25)
+        ]
+        # Sebagian jawaban dengan created_at sama: urutan harus tetap stabil lewat id
+        Answer.objects.filter(pk__in=[answer.pk for answer in self.answers[5:15]]).update(
+            created_at=self.answers[5].created_at
+        )
+        self.url = f"/api/surveys/{self.survey.id}/answers/"
+
+    def test_walk_pages_with_cursor(self):
+        print("\n[Test feature] Answer list WHEN paginated with cursor → expect every answer once, newest first")
+
+        ids, url, pages = [], f"{self.url}?page_size=10", 0
+        while url:
+            res = self.client.get(url)
+            self.assertEqual(res.status_code, status.HTTP_200_OK)
+            ids += [answer["id"] for answer in res.data["results"]]
+            url, pages = res.data["next"], pages + 1
+
+        expected = list(Answer.objects.order_by('-created_at', '-id').values_list('id', flat=True))
+        self.assertEqual(pages, 3)
+        self.assertEqual(ids, expected)
+
+    def test_default_page_and_invalid_cursor(self):
+        print("\n[Test feature] Answer list WHEN no page_size / invalid cursor → expect default page / 404")
+
+        res = self.client.get(self.url)
+        self.assertEqual(len(res.data["results"]), 25)
+        self.assertIsNone(res.data["next_cursor"])
+
+        res = self.client.get(f"{self.url}?cursor=rusak")
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class AnswerReadQueryCountTest(APITestCase):
+    def setUp(self):
+        program_study = ProgramStudy.objects.create(name="Informatika")
+        alumni = User.objects.create_user(
+            id='3401', username='Alumni', password='pass12345',
+            role=Role.objects.create(name='Alumni'), program_study=program_study,
+        )
+        self.client.force_authenticate(alumni)
+
+        self.survey = Survey.objects.create(title="Exit Survey", survey_type="exit")
+        section = Section.objects.create(survey=self.survey, title="Profil", order=1)
+
+        for i in range(20):
+            Answer.objects.create(
+                user=alumni, survey=self.survey, answer_value='["IT"]',
+                question=Question.objects.create(section=section, text=f"Q{i}", question_type="checkbox", order=i),
+            )
+            Answer.objects.create(
+                user=alumni, survey=self.survey, answer_value='5',
+                program_specific_question=ProgramSpecificQuestion.objects.create(
+                    program_study=program_study, survey=self.survey, text=f"P{i}", question_type="number"
+                ),
+            )
+        self.url = f"/api/surveys/{self.survey.id}/answers/"
+
+    def test_query_count_independent_of_page_size(self):
+        print("\n[Test feature] Answer list WHEN page size grows → expect same number of queries")
+
+        with CaptureQueriesContext(connection) as small:
+            res = self.client.get(f"{self.url}?page_size=2")
+        self.assertEqual(len(res.data["results"]), 2)
+
+        with CaptureQueriesContext(connection) as large:
+            res = self.client.get(f"{self.url}?page_size=40")
+        self.assertEqual(len(res.data["results"]), 40)
+        self.assertEqual(res.data["results"][0]["answer_value"], 5)
+        self.assertEqual(res.data["results"][0]["user_program_study"], "Informatika")
+
+        self.assertEqual(len(small), len(large))
+
+
+class AnswerExportTest(APITestCase):
+    def setUp(self):
+        self.tracer = User.objects.create_user(
+            id='3501', username='Tracer', password='pass12345', role=Role.objects.create(name='Tracer')
+        )
+        self.client.force_authenticate(self.tracer)
+
+        program_study = ProgramStudy.objects.create(name="Informatika")
+        role = Role.objects.create(name='Alumni')
+        self.survey = Survey.objects.create(title="Exit Survey", survey_type="exit")
+        second = Section.objects.create(survey=self.survey, title="Pekerjaan", order=2)
+        first = Section.objects.create(survey=self.survey, title="Profil", order=1)
+        salary = Question.objects.create(section=second, text="Gaji", code="F505", question_type="number", order=1)
+        skills = Question.objects.create(section=first, text="Skill", question_type="checkbox", order=2)
+        name = Question.objects.create(section=first, text="Nama", code="F01", question_type="text", order=1)
+
+        for i, (value, skill) in enumerate([("5000000", '["IT", "English"]'), (None, '["IT"]')]):
+            user = User.objects.create_user(
+                id=f'35{i}0', username=f'Alumni {i}', password='pass12345', role=role, program_study=program_study
+            )
+            Answer.objects.create(user=user, survey=self.survey, question=name, answer_value=f"Nama {i}")
+            Answer.objects.create(user=user, survey=self.survey, question=skills, answer_value=skill)
+            if value:
+                Answer.objects.create(user=user, survey=self.survey, question=salary, answer_value=value)
+
+        self.url = f"/api/surveys/{self.survey.id}/answers/export/"
+
+    def test_csv_export(self):
+        print("\n[Test feature] Export answers WHEN file_type is csv → expect streamed wide CSV, one row per respondent")
+
+        res = self.client.get(self.url)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertTrue(res.streaming)
+        rows = list(csv.reader(io.StringIO(b"".join(res.streaming_content).decode())))
+        self.assertEqual(rows, [
+            ["user_id", "username", "program_study", "F01", "Skill", "F505"],
+            ["3500", "Alumni 0", "Informatika", "Nama 0", "IT; English", "5000000"],
+            ["3510", "Alumni 1", "Informatika", "Nama 1", "IT", ""],
+        ])
+
+    def test_xlsx_export(self):
+        print("\n[Test feature] Export answers WHEN file_type is xlsx → expect workbook with the same rows")
+
+        from openpyxl import load_workbook
+
+        res = self.client.get(f"{self.url}?file_type=xlsx")
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        sheet = load_workbook(io.BytesIO(b"".join(res.streaming_content))).active
+        rows = list(sheet.iter_rows(values_only=True))
+        self.assertEqual(rows[0], ("user_id", "username", "program_study", "F01", "Skill", "F505"))
+        self.assertEqual(len(rows), 3)
+
+    def test_alumni_cannot_export(self):
+        print("\n[Test feature] Export answers WHEN user is Alumni → expect 403")
+
+        self.client.force_authenticate(User.objects.get(id='3500'))
+
+        res = self.client.get(self.url)
+
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,134 @@
+import json
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from rest_framework import status
+
+from api.models import Survey, Section, Question, QuestionBranch, SurveyProgress
+from api.branching import get_survey_graph
+from accounts.models import User, Role
+
+
+class SurveyBranchingTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.alumni = User.objects.create_user(
+            id='8001', username='Alumni', password='pass12345', role=Role.objects.create(name='Alumni')
+        )
+        self.client.force_authenticate(self.alumni)
+
+        # Profil -> (Bekerja) Pekerjaan -> Penutup, (Studi) Studi Lanjut -> Penutup
+        self.survey = Survey.objects.create(title="Tracer Study", survey_type="lv1")
+        self.profil, self.pekerjaan, self.studi, self.penutup = [
+            Section.objects.create(survey=self.survey, title=title, order=i)
+            for i, title in enumerate(["Profil", "Pekerjaan", "Studi Lanjut", "Penutup"])
+        ]
+        self.status_q = Question.objects.create(
+            section=self.profil, text="Status", question_type="radio", is_required=True, order=1,
+            options=json.dumps(["Bekerja", "Studi"])
+        )
+        QuestionBranch.objects.create(question=self.status_q, answer_value="Bekerja", next_section=self.pekerjaan)
+        QuestionBranch.objects.create(question=self.status_q, answer_value="Studi", next_section=self.studi)
+        self.company = Question.objects.create(
+            section=self.pekerjaan, text="Perusahaan", question_type="text", is_required=True, order=1
+        )
+        self.salary = Question.objects.create(
+            section=self.pekerjaan, text="Gaji", question_type="number", is_required=True, order=2
+        )
+        self.pekerjaan_done = Question.objects.create(
+            section=self.pekerjaan, text="Selesai", question_type="radio", order=3,
+            options=json.dumps(["Ya"])
+        )
+        QuestionBranch.objects.create(question=self.pekerjaan_done, answer_value="Ya", next_section=self.penutup)
+        self.campus = Question.objects.create(
+            section=self.studi, text="Kampus", question_type="text", is_required=True, order=1
+        )
+        self.feedback = Question.objects.create(
+            section=self.penutup, text="Saran", question_type="text", is_required=True, order=1
+        )
+
+    def section_ids(self, *sections):
+        return [section.id for section in sections]
+
+    def test_reachable_sections_follow_branches(self):
+        print("\n[Test feature] Branching graph WHEN answers select a branch → expect only sections on that path")
+
+        graph = get_survey_graph(self.survey.id)
+
+        self.assertEqual(
+            graph.reachable_sections({self.status_q.id: "Bekerja", self.pekerjaan_done.id: "Ya"}),
+            self.section_ids(self.profil, self.pekerjaan, self.penutup)
+        )
+        self.assertEqual(
+            graph.reachable_sections({self.status_q.id: "Studi"}),
+            self.section_ids(self.profil, self.studi, self.penutup)
+        )
+        # Tanpa jawaban branch: urut section apa adanya
+        self.assertEqual(
+            graph.reachable_sections({}),
+            self.section_ids(self.profil, self.pekerjaan, self.studi, self.penutup)
+        )
+        self.assertEqual(
+            graph.reachable_required({self.status_q.id: "Studi"}),
+            {self.status_q.id, self.campus.id, self.feedback.id}
+        )
+
+    def test_graph_cached_and_invalidated_on_writes(self):
+        print("\n[Test feature] Branching graph WHEN branches change → expect cached graph recompiled")
+
+        graph = get_survey_graph(self.survey.id)
+        with CaptureQueriesContext(connection) as queries:
+            cached = get_survey_graph(self.survey.id, graph.version)
+        self.assertEqual(cached.edges, graph.edges)
+        self.assertEqual(len(queries), 0)
+
+        QuestionBranch.objects.create(question=self.campus, answer_value="x", next_section=self.profil)
+        QuestionBranch.objects.filter(question=self.status_q, answer_value="Studi").update(next_section=self.penutup)
+        Question.objects.get(pk=self.campus.pk).save()
+
+        graph = get_survey_graph(self.survey.id)
+        self.assertEqual(
+            graph.reachable_sections({self.status_q.id: "Studi"}),
+            self.section_ids(self.profil, self.penutup)
+        )
+
+    def test_progress_counts_reachable_required_only(self):
+        print("\n[Test feature] Survey progress WHEN user takes a branch → expect skipped sections not required")
+
+        res = self.client.post(f"/api/surveys/{self.survey.id}/answers/bulk/", {"answers": [
+            {"question": self.status_q.id, "answer_value": "Studi"},
+            {"question": self.campus.id, "answer_value": "ITB"},
+        ]}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+
+        progress = SurveyProgress.objects.get(user=self.alumni, survey=self.survey)
+        self.assertEqual((progress.answered_required, progress.total_required), (2, 3))
+        self.assertFalse(progress.is_completed)
+
+        self.client.post(f"/api/surveys/{self.survey.id}/answers/", {
+            "question": self.feedback.id, "answer_value": "Bagus"
+        }, format="json")
+        progress.refresh_from_db()
+        self.assertEqual((progress.answered_required, progress.total_required), (3, 3))
+        self.assertTrue(progress.is_completed)
+
+    def test_navigation_endpoint(self):
+        print("\n[Test feature] Survey navigation WHEN answers given or saved → expect reachable sections")
+
+        url = f"/api/surveys/{self.survey.id}/navigation/"
+        res = self.client.get(url, {"answers": json.dumps({str(self.status_q.id): "Bekerja"})})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["sections"], self.section_ids(self.profil, self.pekerjaan, self.studi, self.penutup))
+        self.assertEqual(res.data["total_required"], 5)
+
+        self.client.post(f"/api/surveys/{self.survey.id}/answers/", {
+            "question": self.status_q.id, "answer_value": "Studi"
+        }, format="json")
+        res = self.client.get(url)
+        self.assertEqual(res.data["sections"], self.section_ids(self.profil, self.studi, self.penutup))
+        self.assertEqual((res.data["answered_required"], res.data["total_required"]), (1, 3))
+
+        self.assertEqual(self.client.get(url, {"answers": "[1]"}).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get("/api/surveys/999999/navigation/").status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,91 @@
+import json
+
+import numpy as np
+import pandas as pd
+from django.test import TestCase
+
+from api.feature_matrix import SurveyFeatureExtractor
+from api.models import Survey, Section, Question, Answer
+from accounts.models import User, Role
+
+
+class SurveyFeatureExtractorTest(TestCase):
+    def setUp(self):
+        role = Role.objects.create(name='Alumni')
+        self.survey = Survey.objects.create(title="Tracer", survey_type="lv1")
+        section = Section.objects.create(survey=self.survey, title="Pekerjaan", order=1)
+
+        self.salary = Question.objects.create(section=section, text="Gaji", code="F505", question_type="number", order=2)
+        self.level = Question.objects.create(section=section, text="Tingkat", code="F5d", question_type="scale", order=3)
+        self.relation = Question.objects.create(
+            section=section, text="Keeratan", code="F14", question_type="radio", order=1,
+            options=json.dumps(["Erat", "Kurang Erat"])
+        )
+        self.skills = Question.objects.create(
+            section=section, text="Skill", code="F17", question_type="checkbox", order=4,
+            options=json.dumps(["IT", "English", "Teamwork"])
+        )
+        Question.objects.create(section=section, text="Tanpa code", question_type="text", order=5)
+
+        self.users = [
+            User.objects.create_user(id=f'20{i}', username=f'Alumni {i}', password='pass12345', role=role)
+            for i in range(3)
+        ]
+        a, b, c = self.users
+        Answer.objects.create(user=a, survey=self.survey, question=self.salary, answer_value='6000000')
+        Answer.objects.create(user=a, survey=self.survey, question=self.level, answer_value='4')
+        Answer.objects.create(user=a, survey=self.survey, question=self.relation, answer_value='Erat')
+        Answer.objects.create(user=a, survey=self.survey, question=self.skills, answer_value='["IT", "Teamwork"]')
+        Answer.objects.create(user=b, survey=self.survey, question=self.salary, answer_value='4500000')
+        Answer.objects.create(user=c, survey=self.survey, question=self.relation, answer_value='Kurang Erat')
+
+    def test_typed_matrix(self):
+        print("\n[Test feature] Feature matrix WHEN answers exist → expect typed columns ordered by question order")
+
+        df = SurveyFeatureExtractor(self.survey).to_dataframe()
+
+        self.assertEqual(list(df.columns), ['F14', 'F505', 'F5d', 'F17'])
+        self.assertEqual(list(df.index), ['200', '201', '202'])
+        self.assertEqual(df['F505'].dtype, np.float64)
+        self.assertEqual(df.loc['200', 'F5d'], 4.0)
+        self.assertTrue(np.isnan(df.loc['201', 'F5d']))
+        self.assertEqual(df.loc['200', 'F17'], ['IT', 'Teamwork'])
+        self.assertTrue(pd.isna(df.loc['201', 'F14']))
+
+    def test_reads_typed_columns(self):
+        print("\n[Test feature] Feature matrix WHEN answers are stored → expect values from typed columns, not answer_value")
+
+        Answer.objects.update(answer_value='')
+
+        df = SurveyFeatureExtractor(self.survey).to_dataframe()
+
+        self.assertEqual(df.loc['200', 'F505'], 6000000.0)
+        self.assertEqual(df.loc['202', 'F14'], 'Kurang Erat')
+        self.assertEqual(df.loc['200', 'F17'], ['IT', 'Teamwork'])
+
+    def test_streaming_chunks(self):
+        print("\n[Test feature] Feature matrix WHEN chunk_size is 2 → expect respondents split across chunks")
+
+        chunks = list(SurveyFeatureExtractor(self.survey, chunk_size=2).iter_chunks())
+
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 1])
+
+    def test_numeric_arrays_and_checkbox_expansion(self):
+        print("\n[Test feature] Feature matrix WHEN expanding checkbox → expect 0/1 column per option and numeric arrays")
+
+        extractor = SurveyFeatureExtractor(self.survey, expand_checkbox=True)
+        df = extractor.to_dataframe()
+
+        self.assertEqual(list(df.loc['200', ['F17__IT', 'F17__English', 'F17__Teamwork']]), [1, 0, 1])
+
+        user_ids, X = next(extractor.iter_arrays())
+        self.assertEqual(X.shape, (3, 2))
+        self.assertEqual(X[1, 0], 4500000.0)
+
+    def test_codes_filter(self):
+        print("\n[Test feature] Feature matrix WHEN codes are given → expect only those columns & respondents")
+
+        df = SurveyFeatureExtractor(self.survey, codes=['F505']).to_dataframe()
+
+        self.assertEqual(list(df.columns), ['F505'])
+        self.assertEqual(list(df.index), ['200', '201'])
@@ -0,0 +1,313 @@
+import io
+import os
+import json
+import pickle
+import tempfile
+import importlib.util
+from unittest import skipUnless
+
+import numpy as np
+import pandas as pd
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+
+from api.tests.test_survey import create_user
+from api.models import Survey, Section, Question, Answer, AlumniPrediction
+from accounts.models import User, Role
+from utils.ml_utils import ml_loader
+from utils.model_registry import ArtifactRegistry
+
+HAS_ML_DEPS = all(
+    importlib.util.find_spec(name) is not None
+    for name in ('sklearn', 'xgboost', 'statsmodels')
+)
+
+
+def load_pickled_classifier():
+    with open(os.path.join(ml_loader.classification_path, 'xgb_model.pkl'), 'rb') as f:
+        return pickle.load(f)
+
+
+@skipUnless(HAS_ML_DEPS, "ML dependencies (scikit-learn, xgboost, statsmodels) are not installed")
+class ClassificationBatchAPITest(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.tracer = create_user("tracer", "Tracer")
+        self.url = "/api/ml/classification/predict/batch/"
+        self.records = [
+            {"F502": 2, "F14": "Erat", "F5d": 3},
+            {"F502": 12, "F14": "Tidak Sama Sekali", "Gap_IT": 1.5},
+            {},
+        ]
+
+    def test_batch_matches_single_prediction(self):
+        print("\n[Test feature] Batch classification WHEN records are valid → expect same classes as pickled XGBClassifier")
+
+        self.client.force_authenticate(self.tracer)
+        res = self.client.post(self.url, {"records": self.records}, format="json")
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["total"], 3)
+        self.assertEqual(sum(res.data["label_counts"].values()), 3)
+
+        model = load_pickled_classifier()
+        for record, result in zip(self.records, res.data["results"]):
+            X = ml_loader.preprocess_classification_input(record)
+            self.assertEqual(result["prediction"], int(model.predict(X)[0]))
+            self.assertAlmostEqual(result["confidence"], float(model.predict_proba(X)[0].max()), places=6)
+
+    def test_batch_empty_records(self):
+        print("\n[Test feature] Batch classification WHEN records is empty → expect 400")
+
+        self.client.force_authenticate(self.tracer)
+        res = self.client.post(self.url, {"records": []}, format="json")
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_batch_unauthenticated(self):
+        print("\n[Test feature] Batch classification WHEN unauthenticated → expect 401")
+
+        res = self.client.post(self.url, {"records": self.records}, format="json")
+
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+@skipUnless(HAS_ML_DEPS, "ML dependencies (scikit-learn, xgboost, statsmodels) are not installed")
+class MLWarmUpTest(APITestCase):
+    def test_warm_up_reports_every_artifact(self):
+        print("\n[Test feature] ML warm-up WHEN all artifacts exist → expect every artifact ok with load time")
+
+        report = ml_loader.warm_up()
+
+        self.assertIn('classification_model', report['artifacts'])
+        self.assertIn('forecast_model', report['artifacts'])
+        for group in ('artifacts', 'predictions'):
+            for name, result in report[group].items():
+                self.assertEqual(result['status'], 'ok', f"{name}: {result['error']}")
+                self.assertGreaterEqual(result['elapsed_ms'], 0)
+
+
+class ArtifactRegistryTest(SimpleTestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'config.json')
+        self.write({"version": 1})
+        self.registry = ArtifactRegistry(check_interval=0)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write(self, data, mtime_ns=None):
+        with open(self.path, 'w') as f:
+            json.dump(data, f)
+        if mtime_ns is not None:
+            os.utime(self.path, ns=(mtime_ns, mtime_ns))
+
+    def test_reload_on_change(self):
+        print("\n[Test feature] Artifact registry WHEN file content changes → expect new version swapped in")
+
+        old = self.registry.get(self.path, json.loads)
+        old_version = self.registry.describe([self.path])['version']
+
+        self.write({"version": 2}, mtime_ns=os.stat(self.path).st_mtime_ns + 10**9)
+        new = self.registry.get(self.path, json.loads)
+
+        self.assertEqual(old, {"version": 1})
+        self.assertEqual(new, {"version": 2})
+        self.assertNotEqual(self.registry.describe([self.path])['version'], old_version)
+
+    def test_touch_without_change_keeps_object(self):
+        print("\n[Test feature] Artifact registry WHEN file is touched with same content → expect no reload")
+
+        old = self.registry.get(self.path, json.loads)
+        self.write({"version": 1}, mtime_ns=os.stat(self.path).st_mtime_ns + 10**9)
+
+        self.assertIs(self.registry.get(self.path, json.loads), old)
+
+    def test_broken_export_keeps_old_version(self):
+        print("\n[Test feature] Artifact registry WHEN new export is broken → expect old version kept")
+
+        old = self.registry.get(self.path, json.loads)
+        with open(self.path, 'w') as f:
+            f.write("{not json")
+        os.utime(self.path, ns=(os.stat(self.path).st_mtime_ns + 10**9,) * 2)
+
+        with self.assertLogs('utils.model_registry', level='ERROR'):
+            self.assertIs(self.registry.get(self.path, json.loads), old)
+
+
+@skipUnless(HAS_ML_DEPS, "ML dependencies (scikit-learn, xgboost, statsmodels) are not installed")
+class MLHealthCheckAPITest(APITestCase):
+    def test_health_check_exposes_versions(self):
+        print("\n[Test feature] ML health check WHEN models load → expect version & loaded_at per model")
+
+        res = self.client.get("/api/ml/health/")
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        for model_status in res.data['models'].values():
+            self.assertIsNotNone(model_status['version'])
+            self.assertIsNotNone(model_status['loaded_at'])
+
+
+@skipUnless(HAS_ML_DEPS, "ML dependencies (scikit-learn, xgboost, statsmodels) are not installed")
+class ForecastCacheAPITest(APITestCase):
+    def test_forecast_data_is_cached(self):
+        print("\n[Test feature] Forecast data WHEN files unchanged → expect cached response reused")
+
+        res = self.client.get("/api/ml/forecast/")
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertIn('year', res.data['historical_data'][0])
+        self.assertIs(ml_loader.get_forecast_data(), ml_loader.get_forecast_data())
+
+    def test_forecast_custom_matches_model(self):
+        print("\n[Test feature] Custom forecast WHEN steps given → expect same values as ARIMA forecast")
+
+        model = ml_loader.load_forecast_model()
+        for steps in (1, 7, 20):
+            res = self.client.post("/api/ml/forecast/custom/", {"steps": steps}, format="json")
+
+            self.assertEqual(res.status_code, status.HTTP_200_OK)
+            self.assertEqual(len(res.data['forecast_years']), steps)
+            for cached, expected in zip(res.data['forecast_values'], model.forecast(steps=steps).tolist()):
+                self.assertAlmostEqual(cached, expected, places=6)
+
+
+@skipUnless(HAS_ML_DEPS, "ML dependencies (scikit-learn, xgboost, statsmodels) are not installed")
+class ClusteringEngineParityTest(SimpleTestCase):
+    def test_engine_matches_sklearn(self):
+        print("\n[Test feature] Clustering engine WHEN given random batch → expect same clusters & PCA as sklearn")
+
+        scaler = ml_loader.load_clustering_scaler()
+        kmeans = ml_loader.load_clustering_model()
+        pca = ml_loader.load_clustering_pca()
+        engine = ml_loader.load_clustering_engine()
+
+        rng = np.random.default_rng(42)
+        X = scaler.mean_ + rng.standard_normal((5000, len(scaler.mean_))) * scaler.scale_ * 2
+
+        clusters, coordinates = engine.predict(X, chunk_size=777)
+        X_scaled = scaler.transform(X)
+
+        np.testing.assert_array_equal(clusters, kmeans.predict(X_scaled))
+        np.testing.assert_allclose(coordinates, pca.transform(X_scaled), rtol=1e-9, atol=1e-9)
+
+
+@skipUnless(HAS_ML_DEPS, "ML dependencies (scikit-learn, xgboost, statsmodels) are not installed")
+class BoosterClassifierParityTest(SimpleTestCase):
+    def test_booster_matches_pickled_classifier(self):
+        print("\n[Test feature] Native booster WHEN given random batch with missing values → expect same probabilities as XGBClassifier")
+
+        from utils.booster_classifier import BoosterClassifier
+
+        with open(os.path.join(ml_loader.classification_path, 'xgb_model.json'), 'rb') as f:
+            booster = BoosterClassifier.from_json(f.read(), nthread=1)
+        classifier = load_pickled_classifier()
+
+        rng = np.random.default_rng(7)
+        X = rng.uniform(0, 5, size=(2000, 11))
+        X[rng.random(X.shape) < 0.05] = np.nan
+
+        expected = classifier.predict_proba(pd.DataFrame(X, columns=booster.feature_names))
+
+        np.testing.assert_allclose(booster.predict_proba(X), expected, rtol=1e-5, atol=1e-6)
+        np.testing.assert_array_equal(booster.predict(X), classifier.predict(pd.DataFrame(X, columns=booster.feature_names)))
+
+    def test_booster_rejects_non_probability_objective(self):
+        print("\n[Test feature] Native booster WHEN the model is multi:softmax → expect load rejected")
+
+        import xgboost as xgb
+        from utils.booster_classifier import BoosterClassifier
+
+        X = np.arange(12, dtype=np.float32).reshape(6, 2)
+        booster = xgb.train(
+            {'objective': 'multi:softmax', 'num_class': 3}, xgb.DMatrix(X, label=[0, 1, 2, 0, 1, 2]), num_boost_round=1
+        )
+
+        with self.assertRaises(ValueError):
+            BoosterClassifier.from_json(booster.save_raw('json'))
+
+
+class ClassificationPreprocessorTest(SimpleTestCase):
+    def test_defaults_and_f14_lookup(self):
+        print("\n[Test feature] Classification preprocessing WHEN keys are missing/unknown → expect defaults & F14 codes")
+
+        records = [
+            {"F502": 6, "F14": "Sangat Erat", "F5d": 4, "Gap_IT": -1.5},
+            {"F14": "Tidak Dikenal", "F502": None},
+            {},
+        ]
+
+        X = ml_loader.classification_feature_matrix(records)
+
+        self.assertEqual(X.shape, (3, 11))
+        np.testing.assert_array_equal(X[0, :4], [6, 1, 4, 2.0])
+        self.assertEqual(X[0, 7], -1.5)
+        self.assertTrue(np.isnan(X[1, 0]))
+        self.assertEqual(X[1, 1], 3)
+        np.testing.assert_array_equal(X[2], [3.0, 3, 3.0, 2.0] + [0.0] * 7)
+
+    def test_dataframe_input_matches_records(self):
+        print("\n[Test feature] Classification preprocessing WHEN input is a DataFrame → expect same matrix as list of dicts")
+
+        records = [
+            {"F502": 1.5, "F14": "Erat", "F5d": 2, "Years_Since_Graduation": 1, "Gap_Etika": 0.5},
+            {"F502": 8, "F14": "Kurang Erat", "F5d": 5, "Years_Since_Graduation": 3, "Gap_Etika": -2},
+        ]
+
+        np.testing.assert_array_equal(
+            ml_loader.classification_feature_matrix(pd.DataFrame(records)),
+            ml_loader.classification_feature_matrix(records),
+        )
+
+
+@skipUnless(HAS_ML_DEPS, "ML dependencies (scikit-learn, xgboost, statsmodels) are not installed")
+class ScoreAlumniCommandTest(TestCase):
+    def setUp(self):
+        role = Role.objects.create(name='Alumni')
+        self.survey = Survey.objects.create(title="Tracer", survey_type="lv1")
+        section = Section.objects.create(survey=self.survey, title="Pekerjaan", order=1)
+        self.questions = {
+            code: Question.objects.create(section=section, text=code, code=code, question_type=question_type)
+            for code, question_type in [
+                ('F502', 'number'), ('F505', 'number'), ('F5d', 'scale'),
+                ('F14', 'radio'), ('F1101', 'radio'),
+            ]
+        }
+        self.complete = User.objects.create_user(id='1001', username='Lengkap', password='pass12345', role=role)
+        self.partial = User.objects.create_user(id='1002', username='Sebagian', password='pass12345', role=role)
+
+        for code, value in [
+            ('F502', '2'), ('F505', '6000000'), ('F5d', '4'),
+            ('F14', 'Erat'), ('F1101', 'Perusahaan swasta'),
+        ]:
+            Answer.objects.create(user=self.complete, survey=self.survey, question=self.questions[code], answer_value=value)
+        Answer.objects.create(user=self.partial, survey=self.survey, question=self.questions['F502'], answer_value='5')
+
+    def test_score_alumni_persists_predictions(self):
+        print("\n[Test feature] Offline scoring WHEN alumni answered feature questions → expect stored predictions with model version")
+
+        call_command('score_alumni', '--chunk-size', '1', stdout=io.StringIO())
+
+        self.assertEqual(AlumniPrediction.objects.count(), 2)
+
+        complete = AlumniPrediction.objects.get(user=self.complete)
+        expected = ml_loader.predict_classification({'F502': 2.0, 'F505': 6000000.0, 'F5d': 4.0, 'F14': 'Erat', 'F1101': 'Perusahaan swasta'})
+        self.assertEqual(complete.prediction, expected['prediction'])
+        self.assertIsNotNone(complete.cluster)
+        self.assertTrue(complete.classification_version)
+
+        partial = AlumniPrediction.objects.get(user=self.partial)
+        self.assertIsNone(partial.cluster)
+        self.assertEqual(partial.features, {'F502': 5.0})
+
+    def test_rescoring_updates_in_place(self):
+        print("\n[Test feature] Offline scoring WHEN run twice → expect predictions upserted, not duplicated")
+
+        call_command('score_alumni', stdout=io.StringIO())
+        call_command('score_alumni', '--survey', str(self.survey.id), stdout=io.StringIO())
+
+        self.assertEqual(AlumniPrediction.objects.count(), 2)
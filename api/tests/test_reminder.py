@@ -0,0 +1,269 @@
+import io
+from datetime import timedelta
+
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework import status
+
+from api.models import Survey, Section, Question, ProgramStudy, Answer, ReminderJob, ReminderLog, SurveyProgress
+from api.progress import refresh_progress
+from api.reminders import ReminderDelivery, find_unfinished
+from accounts.models import User, Role
+
+
+@override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend')
+class ReminderAPITest(APITestCase):
+    def setUp(self):
+        now = timezone.now()
+        self.alumni_role = Role.objects.create(name='Alumni')
+        self.admin = User.objects.create_user(
+            id='9001', username='Admin', password='pass12345',
+            role=Role.objects.create(name='Admin'),
+        )
+        self.client.force_authenticate(self.admin)
+        self.program_study = ProgramStudy.objects.create(name="Informatika")
+
+        self.survey = Survey.objects.create(
+            title="Tracer Study", is_active=True,
+            start_at=now - timedelta(days=1), end_at=now + timedelta(days=1)
+        )
+        section = Section.objects.create(survey=self.survey, title="Profil", order=1)
+        self.required = [
+            Question.objects.create(section=section, text=f"Wajib {i}", question_type="text", is_required=True, order=i)
+            for i in range(2)
+        ]
+        self.optional = Question.objects.create(section=section, text="Opsional", question_type="text", order=3)
+
+        # Survey tidak aktif tidak ikut diingatkan
+        Survey.objects.create(title="Lama", is_active=False)
+
+    def alumni(self, n, start=0):
+        return [
+            User.objects.create_user(
+                id=f'50{i:03d}', username=f'Alumni {i}', email=f'alumni{i}@example.com',
+                password='pass12345', role=self.alumni_role, program_study=self.program_study,
+            )
+            for i in range(start, start + n)
+        ]
+
+    def answer(self, user, *questions):
+        for question in questions:
+            Answer.objects.create(user=user, survey=self.survey, question=question, answer_value="x")
+        refresh_progress(user.id, [self.survey.id])
+
+    def run_jobs(self):
+        call_command("process_reminder_jobs", stdout=io.StringIO())
+
+    def test_reminds_only_incomplete_users(self):
+        print("\n[Test feature] Reminder all WHEN some alumni finished → expect job emails only incomplete alumni")
+
+        done, partial, optional_only, empty = self.alumni(4)
+        self.answer(done, *self.required)
+        self.answer(partial, self.required[0])
+        self.answer(optional_only, self.optional)
+
+        res = self.client.post("/api/mailer/reminder/all/")
+
+        self.assertEqual(res.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(res.data["status"], "queued")
+        self.assertEqual(len(mail.outbox), 0)
+
+        self.run_jobs()
+        job = self.client.get(f"/api/mailer/reminder/jobs/{res.data['job_id']}/")
+
+        self.assertEqual(job.status_code, status.HTTP_200_OK)
+        self.assertEqual(job.data["status"], "done")
+        self.assertEqual((job.data["total"], job.data["sent"], job.data["failed"], job.data["skipped"]), (3, 3, 0, 0))
+        self.assertEqual(job.data["progress"], 100.0)
+        self.assertEqual(
+            sorted(message.to[0] for message in mail.outbox),
+            [partial.email, optional_only.email, empty.email]
+        )
+
+    def test_required_question_added_after_completion(self):
+        print("\n[Test feature] Reminder WHEN a required question is added after alumni finished → expect them reminded again")
+
+        done, = self.alumni(1)
+        self.answer(done, *self.required)
+        self.assertEqual(find_unfinished(User.objects.filter(pk=done.pk), cooldown_hours=0), [])
+
+        Question.objects.create(
+            section=self.required[0].section, text="Wajib baru", question_type="text", is_required=True, order=4
+        )
+
+        self.assertEqual(
+            [(user.id, surveys) for user, surveys in find_unfinished(User.objects.filter(pk=done.pk), cooldown_hours=0)],
+            [(done.id, [self.survey])]
+        )
+        progress = SurveyProgress.objects.get(user=done, survey=self.survey)
+        self.assertEqual((progress.answered_required, progress.total_required), (2, 3))
+        self.assertIsNone(progress.completed_at)
+
+    def test_reminder_by_users(self):
+        print("\n[Test feature] Reminder by users WHEN user_id and user_ids are given → expect only those alumni emailed")
+
+        first, second, _ = self.alumni(3)
+        res = self.client.post(f"/api/mailer/reminder/user/{first.id}/", {"user_ids": [second.id]}, format="json")
+        self.run_jobs()
+
+        self.assertEqual(res.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(ReminderJob.objects.get(pk=res.data["job_id"]).sent, 2)
+
+    def test_reminder_by_users_rejects_invalid_user_ids(self):
+        print("\n[Test feature] Reminder by users WHEN user_ids is not a list → expect 400 and no job")
+
+        (alumnus,) = self.alumni(1)
+        for user_ids in ("123", {"id": "123"}, [["123"]]):
+            res = self.client.post(f"/api/mailer/reminder/user/{alumnus.id}/", {"user_ids": user_ids}, format="json")
+            self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(ReminderJob.objects.exists())
+
+    def test_stale_running_job_is_reclaimed(self):
+        print("\n[Test feature] Reminder job WHEN worker died after claiming → expect job rerun after lease, then failed")
+
+        (alumnus,) = self.alumni(1)
+        stale_at = timezone.now() - timedelta(hours=1)
+        job = ReminderJob.objects.create(
+            scope='users', user_ids=[alumnus.id], status='running', attempts=1,
+            started_at=stale_at, heartbeat_at=stale_at,
+        )
+        # Job lain yang masih hidup (heartbeat baru) tidak disentuh
+        alive = ReminderJob.objects.create(
+            scope='all', status='running', attempts=1, started_at=stale_at, heartbeat_at=timezone.now()
+        )
+
+        self.run_jobs()
+
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts, job.sent), ('done', 2, 1))
+        self.assertEqual(ReminderJob.objects.get(pk=alive.pk).status, 'running')
+
+        ReminderJob.objects.filter(pk=alive.pk).update(heartbeat_at=stale_at, attempts=3)
+        self.run_jobs()
+
+        alive.refresh_from_db()
+        self.assertEqual(alive.status, 'failed')
+        self.assertIsNotNone(alive.finished_at)
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_job_visible_to_owner_only(self):
+        print("\n[Test feature] Reminder job WHEN requested by another non-admin user → expect 404")
+
+        job = ReminderJob.objects.create(scope='all', created_by=self.admin)
+        other = self.alumni(1)[0]
+        self.client.force_authenticate(other)
+
+        res = self.client.get(f"/api/mailer/reminder/jobs/{job.id}/")
+
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_query_count_does_not_grow_with_alumni(self):
+        print("\n[Test feature] Reminder job WHEN there are more alumni → expect same number of queries")
+
+        self.alumni(2)
+        ReminderJob.objects.create(scope='all')
+        with CaptureQueriesContext(connection) as small:
+            self.run_jobs()
+
+        self.alumni(30, start=2)
+        ReminderLog.objects.all().delete()
+        ReminderJob.objects.create(scope='all')
+        with CaptureQueriesContext(connection) as large:
+            self.run_jobs()
+
+        self.assertEqual(len(small), len(large))
+
+
+    def test_cooldown_skips_recently_reminded(self):
+        print("\n[Test feature] Reminder job WHEN run twice within cooldown → expect second run sends nothing")
+
+        user = self.alumni(1)[0]
+        ReminderJob.objects.create(scope='all')
+        self.run_jobs()
+        ReminderJob.objects.create(scope='all')
+        self.run_jobs()
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(list(ReminderJob.objects.values_list('sent', flat=True)), [1, 0])
+        self.assertEqual(ReminderLog.objects.get(user=user, survey=self.survey).reminder_count, 1)
+
+        # Setelah cooldown lewat, user diingatkan lagi dan ledger bertambah
+        ReminderLog.objects.update(last_reminded_at=timezone.now() - timedelta(days=2))
+        ReminderJob.objects.create(scope='all')
+        self.run_jobs()
+
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(ReminderLog.objects.get(user=user, survey=self.survey).reminder_count, 2)
+
+    def test_digest_merges_surveys(self):
+        print("\n[Test feature] Reminder job WHEN user has two unfinished surveys → expect one digest email")
+
+        now = timezone.now()
+        other = Survey.objects.create(
+            title="Exit Survey", is_active=True,
+            start_at=now - timedelta(days=1), end_at=now + timedelta(days=1)
+        )
+        section = Section.objects.create(survey=other, title="Profil", order=1)
+        Question.objects.create(section=section, text="Wajib", question_type="text", is_required=True, order=1)
+        user = self.alumni(1)[0]
+
+        ReminderJob.objects.create(scope='all')
+        self.run_jobs()
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIn("Tracer Study", mail.outbox[0].body)
+        self.assertIn("Exit Survey", mail.outbox[0].body)
+        self.assertEqual(ReminderLog.objects.filter(user=user).count(), 2)
+
+
+class FlakyBackend(EmailBackend):
+    """locmem backend yang gagal untuk alamat tertentu dan mencatat jumlah koneksi"""
+    opened = 0
+
+    def open(self):
+        FlakyBackend.opened += 1
+        return super().open()
+
+    def send_messages(self, messages):
+        if any("gagal" in address for message in messages for address in message.to):
+            raise ConnectionError("550 mailbox unavailable")
+        return super().send_messages(messages)
+
+
+@override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend')
+class ReminderDeliveryTest(TestCase):
+    def test_chunked_delivery_statuses(self):
+        print("\n[Test feature] Reminder delivery WHEN some recipients fail or have no email → expect per-recipient status")
+
+        survey = Survey.objects.create(title="Tracer Study")
+        role = Role.objects.create(name='Alumni')
+        users = [
+            User.objects.create_user(id=f'60{i}', username=f'Alumni {i}', email=f'alumni{i}@example.com', password='pass12345', role=role)
+            for i in range(5)
+        ]
+        users[1].email = ""
+        users[3].email = "gagal@example.com"
+        FlakyBackend.opened = 0
+
+        delivery = ReminderDelivery(chunk_size=2, rate=0, connection_factory=FlakyBackend)
+        counts = delivery.send([(user, [survey]) for user in users])
+
+        self.assertEqual(counts, {'sent': 3, 'failed': 1, 'skipped': 1})
+        self.assertEqual(
+            {status['email']: status['status'] for status in delivery.statuses},
+            {
+                users[0].email: 'sent', '': 'skipped', users[2].email: 'sent',
+                'gagal@example.com': 'failed', users[4].email: 'sent',
+            }
+        )
+        failed = next(status for status in delivery.statuses if status['status'] == 'failed')
+        self.assertIn("550", failed['error'])
+        # 4 penerima / chunk 2 = 2 koneksi, + 1 koneksi dibuka ulang setelah error
+        self.assertEqual(FlakyBackend.opened, 3)
+        self.assertEqual(len(mail.outbox), 3)
@@ -0,0 +1,237 @@
+import io
+import json
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import IntegrityError, transaction
+from rest_framework.test import APITestCase
+from rest_framework import status
+
+from api.models import (
+    Survey, Section, Question, ProgramSpecificQuestion, ProgramStudy, Periode, Answer, SurveyProgress, QuestionStatistic
+)
+from api.statistics import number_bin, update_answer_statistics
+from accounts.models import User, Role
+
+
+class SurveyStatisticsTest(APITestCase):
+    def setUp(self):
+        self.informatika = ProgramStudy.objects.create(name="Informatika")
+        self.sipil = ProgramStudy.objects.create(name="Teknik Sipil")
+        self.periode = Periode.objects.create(category="2024", order=1)
+
+        self.survey = Survey.objects.create(title="Tracer Study", survey_type="lv1", periode=self.periode)
+        section = Section.objects.create(survey=self.survey, title="Pekerjaan", order=1)
+        self.status_q = Question.objects.create(
+            section=section, text="Status", question_type="radio", order=1,
+            options=json.dumps(["Bekerja", "Belum Bekerja", "Studi"])
+        )
+        self.skills = Question.objects.create(
+            section=section, text="Skill", question_type="checkbox", order=2,
+            options=json.dumps(["IT", "English"])
+        )
+        self.scale = Question.objects.create(section=section, text="Kepuasan", question_type="scale", order=3)
+        self.salary = Question.objects.create(section=section, text="Gaji", question_type="number", order=4)
+        Question.objects.create(section=section, text="Catatan", question_type="text", order=5)
+
+        role = Role.objects.create(name='Alumni')
+        self.alumni = [
+            User.objects.create_user(id='7001', username='A', password='pass12345', role=role, program_study=self.informatika),
+            User.objects.create_user(id='7002', username='B', password='pass12345', role=role, program_study=self.sipil),
+        ]
+        self.tracer = User.objects.create_user(
+            id='7100', username='Tracer', password='pass12345', role=Role.objects.create(name='Tracer')
+        )
+
+    def submit(self, user, status_value, skills, scale, salary):
+        self.client.force_authenticate(user)
+        res = self.client.post(f"/api/surveys/{self.survey.id}/answers/bulk/", {"answers": [
+            {"question": self.status_q.id, "answer_value": status_value},
+            {"question": self.skills.id, "answer_value": json.dumps(skills)},
+            {"question": self.scale.id, "answer_value": str(scale)},
+            {"question": self.salary.id, "answer_value": str(salary)},
+        ]}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+
+    def statistics(self, user=None, **params):
+        self.client.force_authenticate(user or self.tracer)
+        res = self.client.get("/api/surveys/statistics/", params)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        return {row["question_id"]: row for row in res.data}
+
+    def snapshot(self):
+        # Counter 0 tetap disimpan oleh update inkremental, tetapi tidak ikut dibaca
+        return sorted(QuestionStatistic.objects.filter(count__gt=0).values_list('question_id', 'program_study_id', 'option', 'count', 'value_sum'))
+
+    def test_distributions_follow_answer_writes(self):
+        print("\n[Test feature] Statistics WHEN answers are submitted and resubmitted → expect counters updated incrementally")
+
+        self.submit(self.alumni[0], "Studi", ["IT"], 2, 3000000)
+        self.submit(self.alumni[1], "Bekerja", ["IT", "English"], 4, 7500000)
+        # Alumni A mengubah jawaban: jawaban lama dikurangi dari counter
+        self.submit(self.alumni[0], "Bekerja", ["English"], 5, 4000000)
+
+        stats = self.statistics(survey=self.survey.id)
+
+        self.assertEqual(len(stats), 4)
+        self.assertEqual(stats[self.status_q.id]["options"], [
+            {"option": "Bekerja", "count": 2},
+            {"option": "Belum Bekerja", "count": 0},
+            {"option": "Studi", "count": 0},
+        ])
+        self.assertEqual(stats[self.skills.id]["options"], [
+            {"option": "IT", "count": 1},
+            {"option": "English", "count": 2},
+        ])
+        self.assertEqual(stats[self.scale.id]["mean"], 4.5)
+        self.assertEqual(stats[self.salary.id]["histogram"], [
+            {"bin": "2000000", "count": 1},
+            {"bin": "5000000", "count": 1},
+        ])
+
+    def test_filters_and_tim_prodi_scope(self):
+        print("\n[Test feature] Statistics WHEN filtered by program study / periode or requested by Tim Prodi → expect scoped counts")
+
+        self.submit(self.alumni[0], "Studi", ["IT"], 2, 3000000)
+        self.submit(self.alumni[1], "Bekerja", ["IT"], 4, 7500000)
+
+        stats = self.statistics(periode=self.periode.id, program_study=self.sipil.id)
+        self.assertEqual(stats[self.scale.id]["mean"], 4.0)
+        self.assertEqual(stats[self.status_q.id]["total"], 1)
+
+        tim_prodi = User.objects.create_user(
+            id='7200', username='Prodi', password='pass12345',
+            role=Role.objects.create(name='Tim Prodi'), program_study=self.informatika,
+        )
+        stats = self.statistics(tim_prodi, survey=self.survey.id, program_study=self.sipil.id)
+        self.assertEqual(stats[self.scale.id]["mean"], 2.0)
+
+        # Tim Prodi tanpa program studi tidak melihat statistik semua prodi
+        tim_prodi.program_study = None
+        tim_prodi.save()
+        self.client.force_authenticate(tim_prodi)
+        res = self.client.get("/api/surveys/statistics/", {"survey": self.survey.id})
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+
+        self.client.force_authenticate(self.tracer)
+        res = self.client.get("/api/surveys/statistics/")
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_recompute_matches_incremental(self):
+        print("\n[Test feature] Recompute statistics WHEN counters already exist → expect identical counters")
+
+        self.submit(self.alumni[0], "Studi", ["IT"], 2, 3000000)
+        self.submit(self.alumni[1], "Bekerja", ["IT", "English"], 4, 7500000)
+        self.submit(self.alumni[0], "Bekerja", ["English"], 5, 4000000)
+        incremental = self.snapshot()
+        # Recompute membaca kolom bertipe, bukan answer_value
+        Answer.objects.update(answer_value='')
+
+        call_command("recompute_statistics", stdout=io.StringIO())
+
+        self.assertEqual(self.snapshot(), incremental)
+
+    def test_edit_by_tracer_keeps_owner_program_study(self):
+        print("\n[Test feature] Statistics WHEN a Tracer edits an alumni answer → expect counters stay on the owner's program study")
+
+        self.submit(self.alumni[1], "Bekerja", ["IT"], 4, 7500000)
+        answer = Answer.objects.get(user=self.alumni[1], question=self.status_q)
+
+        self.client.force_authenticate(self.tracer)
+        res = self.client.patch(
+            f"/api/surveys/{self.survey.id}/answers/{answer.id}/",
+            {"question": self.status_q.id, "answer_value": "Studi"}, format="json"
+        )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        answer.refresh_from_db()
+        self.assertEqual(answer.user, self.alumni[1])
+        self.assertEqual(
+            [row for row in self.snapshot() if row[0] == self.status_q.id],
+            [(self.status_q.id, self.sipil.id, "Studi", 1, 0.0)]
+        )
+
+    def test_failed_counter_update_rolls_back_answer(self):
+        print("\n[Test feature] Statistics WHEN the counter update fails → expect the answer not saved either")
+
+        self.client.force_authenticate(self.alumni[0])
+        with mock.patch("api.views.answer_views.update_answer_statistics", side_effect=RuntimeError), \
+                self.assertRaises(RuntimeError):
+            self.client.post(f"/api/surveys/{self.survey.id}/answers/", {
+                "question": self.status_q.id, "answer_value": "Studi"
+            }, format="json")
+
+        self.assertFalse(Answer.objects.exists())
+        self.assertFalse(SurveyProgress.objects.exists())
+
+    def test_program_specific_questions_counted(self):
+        print("\n[Test feature] Statistics WHEN alumni answer program-specific questions → expect their distributions reported")
+
+        lab = ProgramSpecificQuestion.objects.create(
+            program_study=self.informatika, survey=self.survey, text="Lab", question_type="radio",
+            options=json.dumps(["Ya", "Tidak"])
+        )
+        hours = ProgramSpecificQuestion.objects.create(
+            program_study=self.informatika, survey=self.survey, text="Jam", question_type="scale"
+        )
+        self.client.force_authenticate(self.alumni[0])
+        res = self.client.post(f"/api/surveys/{self.survey.id}/answers/bulk/", {"answers": [
+            {"program_specific_question": lab.id, "answer_value": "Ya"},
+            {"program_specific_question": hours.id, "answer_value": "4"},
+        ]}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.client.post(f"/api/surveys/{self.survey.id}/answers/bulk/", {"answers": [
+            {"program_specific_question": lab.id, "answer_value": "Tidak"},
+        ]}, format="json")
+
+        self.client.force_authenticate(self.tracer)
+        res = self.client.get("/api/surveys/statistics/", {"survey": self.survey.id})
+        stats = {row["program_specific_question_id"]: row for row in res.data if row["question_id"] is None}
+        self.assertEqual(stats[lab.id]["options"], [{"option": "Ya", "count": 0}, {"option": "Tidak", "count": 1}])
+        self.assertEqual(stats[hours.id]["mean"], 4.0)
+
+        # Filter program studi lain tidak menampilkan pertanyaan khusus Informatika
+        res = self.client.get("/api/surveys/statistics/", {"survey": self.survey.id, "program_study": self.sipil.id})
+        self.assertTrue(all(row["program_specific_question_id"] is None for row in res.data))
+
+        counters = sorted(QuestionStatistic.objects.filter(count__gt=0).values_list(
+            'program_specific_question_id', 'option', 'count'
+        ))
+        call_command("recompute_statistics", stdout=io.StringIO())
+        self.assertEqual(sorted(QuestionStatistic.objects.filter(count__gt=0).values_list(
+            'program_specific_question_id', 'option', 'count'
+        )), counters)
+
+    def test_counter_created_concurrently_is_incremented(self):
+        print("\n[Test feature] Statistics WHEN the counter row was inserted by another submit → expect increment, no duplicate")
+
+        # Submit lain sudah menyisipkan counter (belum terlihat saat delta dihitung)
+        QuestionStatistic.objects.create(question=self.status_q, program_study=self.sipil, option="Bekerja", count=1)
+        update_answer_statistics(added=[(self.status_q, self.sipil.id, (None, "Bekerja", None))])
+        update_answer_statistics(removed=[(self.status_q, self.sipil.id, (None, "Bekerja", None))] * 2)
+        update_answer_statistics(added=[(self.status_q, self.sipil.id, (None, "Bekerja", None))])
+
+        self.assertEqual(self.snapshot(), [(self.status_q.id, self.sipil.id, "Bekerja", 1, 0.0)])
+
+    def test_counters_without_program_study_are_unique(self):
+        print("\n[Test feature] Statistics WHEN respondents have no program study → expect a single counter per option")
+
+        self.alumni[0].program_study = None
+        self.alumni[0].save()
+        self.submit(self.alumni[0], "Studi", ["IT"], 2, 3000000)
+        update_answer_statistics(added=[(self.status_q, None, (None, "Studi", None))])
+
+        self.assertEqual(
+            QuestionStatistic.objects.filter(question=self.status_q, program_study=None).count(), 1
+        )
+        self.assertEqual(self.statistics(survey=self.survey.id)[self.status_q.id]["total"], 2)
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            QuestionStatistic.objects.create(question=self.status_q, option="Studi")
+
+    def test_number_bins(self):
+        print("\n[Test feature] Number histogram WHEN values span magnitudes → expect 1-2-5 bins")
+
+        self.assertEqual(
+            [number_bin(value) for value in (0, 0.3, 1, 19, 20, 499, 5000000, -7)],
+            ['0', '0.2', '1', '10', '20', '200', '5000000', '-5']
+        )
@@ -1,11 +1,16 @@
+import json
+
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
 
 from api.models import (
     Survey, Section, Question, Answer,
     ProgramSpecificQuestion, SupervisorToken,
-    SystemConfig
+    SystemConfig, QuestionBranch, ProgramStudy
 )
 
 from accounts.models import Role
@@ -193,6 +198,82 @@ class QuestionAPITest(APITestCase):
         self.assertEqual(res.status_code, 200)
 
 
+class SurveyTreeAPITest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.program_study = ProgramStudy.objects.create(name="Informatika")
+        self.alumni = create_user("alumni", "Alumni", self.program_study)
+        self.admin = create_user("admin", "Admin")
+        self.client.force_authenticate(self.alumni)
+
+        self.survey = Survey.objects.create(title="Tracer Study", survey_type="lv1")
+        self.sections = [
+            Section.objects.create(survey=self.survey, title=f"Section {i}", order=i)
+            for i in range(3)
+        ]
+        for section in self.sections:
+            for i in range(3):
+                question = Question.objects.create(
+                    section=section, text=f"{section.title} Q{i}", question_type="radio", order=i,
+                    options=json.dumps(["Ya", "Tidak"])
+                )
+                QuestionBranch.objects.create(question=question, answer_value="Ya", next_section=self.sections[-1])
+        ProgramSpecificQuestion.objects.create(
+            program_study=self.program_study, survey=self.survey, text="Prodi", question_type="text"
+        )
+        ProgramSpecificQuestion.objects.create(
+            program_study=ProgramStudy.objects.create(name="Sipil"), survey=self.survey, text="Lain", question_type="text"
+        )
+        self.url = f"/api/surveys/{self.survey.id}/tree/"
+
+    def test_full_tree_with_constant_queries(self):
+        print("\n[Test feature] Survey tree WHEN survey has sections/questions/branches → expect nested tree in few queries")
+
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.get(self.url)
+
+        self.assertEqual(res.status_code, 200)
+        self.assertLessEqual(len(queries), 8)
+        self.assertEqual([section["title"] for section in res.data["sections"]], ["Section 0", "Section 1", "Section 2"])
+        question = res.data["sections"][0]["questions"][0]
+        self.assertEqual(question["options"], ["Ya", "Tidak"])
+        self.assertEqual(question["branches"], [{"answer_value": "Ya", "next_section": self.sections[-1].id}])
+        self.assertEqual([q["text"] for q in res.data["program_specific_questions"]], ["Prodi"])
+
+    def test_etag_and_invalidation(self):
+        print("\n[Test feature] Survey tree WHEN ETag matches / survey changes → expect 304 / fresh tree")
+
+        first = self.client.get(self.url)
+        etag = first["ETag"]
+
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, 304)
+        self.assertLessEqual(len(queries), 2)
+
+        self.client.force_authenticate(self.admin)
+        self.client.patch(
+            f"/api/surveys/{self.survey.id}/sections/{self.sections[0].id}/",
+            {"title": "Profil"}, format="json"
+        )
+        self.client.force_authenticate(self.alumni)
+
+        res = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, 200)
+        self.assertNotEqual(res["ETag"], etag)
+        self.assertEqual(res.data["sections"][0]["title"], "Profil")
+
+    def test_saved_survey_keeps_integer_version(self):
+        print("\n[Test feature] Survey save WHEN version is bumped in the database → expect instance holds the new integer")
+
+        version = Survey.objects.get(pk=self.survey.pk).version
+        self.survey.title = "Tracer Study 2025"
+        self.survey.save()
+
+        self.assertEqual(self.survey.version, version + 1)
+        self.assertEqual(Survey.objects.get(pk=self.survey.pk).version, version + 1)
+
+
 class AnswerAPITest(APITestCase):
     def setUp(self):
         self.alumni = create_user("alumni", "Alumni")
@@ -0,0 +1,176 @@
+import json
+import math
+from rest_framework import serializers
+
+# Batas jumlah validator yang disimpan per proses
+MAX_VALIDATORS = 4096
+
+# Kolom bertipe Answer yang diturunkan dari answer_value
+TYPED_ANSWER_FIELDS = ['numeric_value', 'choice_key', 'choice_keys']
+
+
+def compile_choices(options):
+    """
+    Pilihan jawaban sebagai frozenset (JSON array / object, atau satu pilihan per baris)
+
+    Returns:
+        frozenset, atau None jika pertanyaan tidak membatasi pilihan
+    """
+    if not options:
+        return None
+    try:
+        parsed = json.loads(options) if isinstance(options, str) else options
+    except (json.JSONDecodeError, TypeError):
+        parsed = None
+    if not isinstance(parsed, (list, dict)):
+        parsed = options.splitlines() if isinstance(options, str) else []
+    return frozenset(option for option in parsed if option.__hash__ is not None)
+
+
+class AnswerValidator:
+    """
+    Aturan validasi answer_value untuk satu pertanyaan, dikompilasi sekali:
+    opsi di-parse menjadi frozenset sehingga cek pilihan cukup satu hash lookup
+    """
+
+    def __init__(self, question_type, options, version=None):
+        self.question_type = question_type
+        self.choices = compile_choices(options) if question_type in ('radio', 'dropdown', 'checkbox') else None
+        self.version = version
+
+    def _check_choice(self, value):
+        if self.choices is None:
+            return
+        try:
+            valid = value in self.choices
+        except TypeError:
+            valid = False
+        if not valid:
+            raise serializers.ValidationError(
+                f"Jawaban '{value}' tidak ada dalam pilihan yang tersedia"
+            )
+
+    def validate(self, answer_value):
+        """
+        Returns:
+            answer_value yang disimpan (checkbox dinormalisasi menjadi JSON string)
+        """
+        question_type = self.question_type
+
+        if question_type == 'text':
+            if not isinstance(answer_value, str):
+                raise serializers.ValidationError(
+                    "Jawaban untuk tipe 'text' harus berupa string"
+                )
+
+        elif question_type == 'number':
+            try:
+                float(answer_value)
+            except (ValueError, TypeError):
+                raise serializers.ValidationError(
+                    "Jawaban untuk tipe 'number' harus berupa angka"
+                )
+
+        elif question_type in ['radio', 'dropdown']:
+            if not isinstance(answer_value, str):
+                raise serializers.ValidationError(
+                    f"Jawaban untuk tipe '{question_type}' harus berupa string"
+                )
+            self._check_choice(answer_value)
+
+        elif question_type == 'checkbox':
+            if not isinstance(answer_value, (list, str)):
+                raise serializers.ValidationError(
+                    "Jawaban untuk tipe 'checkbox' harus berupa array/list"
+                )
+            if isinstance(answer_value, str):
+                try:
+                    answer_value = json.loads(answer_value)
+                except json.JSONDecodeError:
+                    raise serializers.ValidationError(
+                        "Jawaban untuk tipe 'checkbox' harus berupa JSON array yang valid"
+                    )
+            if not isinstance(answer_value, list):
+                raise serializers.ValidationError(
+                    "Jawaban untuk tipe 'checkbox' harus berupa array/list"
+                )
+            for value in answer_value:
+                self._check_choice(value)
+
+            # Simpan sebagai JSON string
+            answer_value = json.dumps(answer_value)
+
+        elif question_type == 'scale':
+            try:
+                scale_value = int(answer_value)
+            except (ValueError, TypeError):
+                scale_value = None
+            if scale_value is None or scale_value < 1 or scale_value > 5:
+                raise serializers.ValidationError(
+                    "Jawaban untuk tipe 'scale' harus berupa angka antara 1-5"
+                )
+
+        return answer_value
+
+
+def typed_answer_values(question_type, answer_value):
+    """
+    Nilai kolom bertipe Answer dari answer_value yang disimpan
+
+    Returns:
+        dict numeric_value / choice_key / choice_keys (None jika tidak berlaku)
+    """
+    values = dict.fromkeys(TYPED_ANSWER_FIELDS)
+
+    if question_type in ('number', 'scale'):
+        try:
+            number = float(answer_value)
+        except (TypeError, ValueError):
+            number = None
+        if number is not None and math.isfinite(number):
+            values['numeric_value'] = number
+
+    elif question_type in ('radio', 'dropdown'):
+        if isinstance(answer_value, str) and answer_value.strip():
+            values['choice_key'] = answer_value.strip()[:255]
+
+    elif question_type == 'checkbox':
+        try:
+            selected = json.loads(answer_value)
+        except (json.JSONDecodeError, TypeError):
+            selected = answer_value.splitlines() if isinstance(answer_value, str) else []
+        if not isinstance(selected, list):
+            selected = [selected]
+        values['choice_keys'] = list(dict.fromkeys(str(option) for option in selected))
+
+    return values
+
+
+# (model_name, pk) -> AnswerValidator
+_validators = {}
+
+
+def get_answer_validator(question):
+    """
+    Validator untuk Question / ProgramSpecificQuestion, dimemo per (model, id)
+
+    Validator dikompilasi ulang jika updated_at pertanyaan berbeda dengan versi
+    yang tersimpan (perubahan dari proses lain), dan dibuang oleh signal saat
+    pertanyaan disimpan / dihapus di proses ini.
+    """
+    version = getattr(question, 'updated_at', None)
+    if question.pk is None:
+        return AnswerValidator(question.question_type, question.options, version)
+
+    key = (question._meta.model_name, question.pk)
+    validator = _validators.get(key)
+    if validator is None or validator.version != version:
+        validator = AnswerValidator(question.question_type, question.options, version)
+        if len(_validators) >= MAX_VALIDATORS:
+            _validators.clear()
+        _validators[key] = validator
+    return validator
+
+
+def invalidate_answer_validator(question):
+    _validators.pop((question._meta.model_name, question.pk), None)
@@ -1,4 +1,5 @@
-import os
+import csv
+from django.http import FileResponse, StreamingHttpResponse
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework import status
@@ -6,14 +7,19 @@ from rest_framework.permissions import AllowAny
 from api.models import (
     SupervisorAnswer, Survey, Question,
     ProgramSpecificQuestion, Answer,
-    SystemConfig, SupervisorToken
+    SupervisorToken, SupervisorInvitation
 )
 from api.serializers import AnswerSerializer, SupervisorAnswerSerializer
 from api.permissions import permissions
+from api.exports import SurveyAnswerExport
+from api.pagination import KeysetPagination
+from api.progress import refresh_progress
+from api.statistics import answer_question, typed_values, update_answer_statistics
+from api.validation import TYPED_ANSWER_FIELDS
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
-from django.conf import settings
-from django.core.mail import send_mail
+from django.db import transaction
+from django.db.models import Q
 
 
 # =====================================================
@@ -38,13 +44,52 @@ def get_answer_queryset(user, survey):
     )
 
 
+# =====================================================
+# HELPER: ANSWER READ QUERYSET
+# =====================================================
+# Relasi yang dibaca AnswerSerializer (user, program studi, question)
+ANSWER_RELATIONS = ('user__program_study', 'question', 'program_specific_question')
+
+# Kolom yang dibutuhkan AnswerSerializer, sisanya tidak diambil dari database
+ANSWER_READ_FIELDS = (
+    'id', 'survey_id', 'answer_value', 'created_at', 'updated_at',
+    'user__id', 'user__username', 'user__email', 'user__program_study__name',
+    'question__id', 'question__text', 'question__question_type',
+    'program_specific_question__id', 'program_specific_question__text',
+    'program_specific_question__question_type',
+)
+
+
+def shape_answer_queryset(answers):
+    """
+    select_related + only() untuk serialisasi jawaban tanpa query tambahan per baris
+    """
+    return answers.select_related(*ANSWER_RELATIONS).only(*ANSWER_READ_FIELDS)
+
+
+# =====================================================
+# HELPER: KEYSET PAGINATION
+# =====================================================
+pagination_params = [
+    openapi.Parameter('cursor', openapi.IN_QUERY, description="Cursor from `next_cursor` of the previous page", type=openapi.TYPE_STRING),
+    openapi.Parameter('page_size', openapi.IN_QUERY, description="Number of answers per page", type=openapi.TYPE_INTEGER),
+]
+
+
+def paginated_answers(request, answers):
+    paginator = KeysetPagination()
+    page = paginator.paginate_queryset(shape_answer_queryset(answers), request)
+    return paginator.get_paginated_response(AnswerSerializer(page, many=True).data)
+
+
 # =====================================================
 # ANSWER LIST + CREATE
 # =====================================================
 @swagger_auto_schema(
     method='get',
     tags=['Answer'],
-    operation_description="Retrieve all answers for a specific survey.",
+    operation_description="Retrieve answers for a specific survey (keyset paginated, newest first).",
+    manual_parameters=pagination_params,
     responses={200: AnswerSerializer(many=True)},
 )
 @swagger_auto_schema(
@@ -64,15 +109,20 @@ def answer_list_create(request, survey_id):
 
     if request.method == 'GET':
         answers = get_answer_queryset(request.user, survey)
-        serializer = AnswerSerializer(answers, many=True)
-        return Response(serializer.data)
+        return paginated_answers(request, answers)
 
     data = request.data.copy()
     data['survey'] = survey_id
 
     serializer = AnswerSerializer(data=data)
     if serializer.is_valid():
-        serializer.save(user=request.user)
+        # Jawaban, progress dan counter statistik berubah bersama atau tidak sama sekali
+        with transaction.atomic():
+            answer = serializer.save(user=request.user)
+            refresh_progress(answer.user_id, [survey.id])
+            update_answer_statistics(
+                added=[(answer_question(answer), answer.user.program_study_id, typed_values(answer))]
+            )
         return Response(serializer.data, status=201)
     return Response(serializer.errors, status=400)
 
@@ -84,7 +134,7 @@ def answer_list_create(request, survey_id):
 @permission_classes([permissions.SurveyPermissions])
 def answer_detail(request, survey_id, pk):
     try:
-        answer = Answer.objects.get(pk=pk, survey_id=survey_id)
+        answer = Answer.objects.select_related(*ANSWER_RELATIONS).get(pk=pk, survey_id=survey_id)
     except Answer.DoesNotExist:
         return Response({'detail': 'Answer not found.'}, status=404)
 
@@ -113,17 +163,38 @@ def answer_detail(request, survey_id, pk):
             partial=(request.method == 'PATCH')
         )
         if serializer.is_valid():
-            serializer.save(user=request.user)
+            removed = (answer_question(answer), answer.user.program_study_id, typed_values(answer))
+            with transaction.atomic():
+                # Pemilik jawaban tetap (Admin/Tracer yang mengedit tidak mengambil alih),
+                # sehingga kedua delta counter memakai program studi yang sama
+                serializer.save()
+                refresh_progress(answer.user_id, [answer.survey_id])
+                update_answer_statistics(
+                    removed=[removed],
+                    added=[(answer_question(answer), answer.user.program_study_id, typed_values(answer))],
+                )
             return Response(serializer.data)
         return Response(serializer.errors, status=400)
 
-    answer.delete()
+    user_id, answer_survey_id = answer.user_id, answer.survey_id
+    removed = (answer_question(answer), answer.user.program_study_id, typed_values(answer))
+    with transaction.atomic():
+        answer.delete()
+        refresh_progress(user_id, [answer_survey_id])
+        update_answer_statistics(removed=[removed])
     return Response(status=204)
 
 
 # =====================================================
 # ANSWER BY QUESTION
 # =====================================================
+@swagger_auto_schema(
+    method='get',
+    tags=['Answer'],
+    operation_description="Retrieve answers for a question (keyset paginated, newest first).",
+    manual_parameters=pagination_params,
+    responses={200: AnswerSerializer(many=True)},
+)
 @api_view(['GET'])
 @permission_classes([permissions.SurveyPermissions])
 def answer_by_question(request, survey_id, section_id, question_id):
@@ -135,12 +206,19 @@ def answer_by_question(request, survey_id, section_id, question_id):
     answers = get_answer_queryset(request.user, question.section.survey)
     answers = answers.filter(question=question)
 
-    return Response(AnswerSerializer(answers, many=True).data)
+    return paginated_answers(request, answers)
 
 
 # =====================================================
 # ANSWER BY PROGRAM-SPECIFIC QUESTION
 # =====================================================
+@swagger_auto_schema(
+    method='get',
+    tags=['Answer'],
+    operation_description="Retrieve answers for a program-specific question (keyset paginated, newest first).",
+    manual_parameters=pagination_params,
+    responses={200: AnswerSerializer(many=True)},
+)
 @api_view(['GET'])
 @permission_classes([permissions.SurveyPermissions])
 def answer_by_program_question(request, survey_id, program_study_id, question_id):
@@ -156,7 +234,7 @@ def answer_by_program_question(request, survey_id, program_study_id, question_id
     answers = get_answer_queryset(request.user, question.survey)
     answers = answers.filter(program_specific_question=question)
 
-    return Response(AnswerSerializer(answers, many=True).data)
+    return paginated_answers(request, answers)
 
 
 
@@ -164,6 +242,169 @@ def answer_by_program_question(request, survey_id, program_study_id, question_id
 
 
 
+# =====================================================
+# ANSWER EXPORT (CSV / XLSX)
+# =====================================================
+class Echo:
+    """Pseudo-buffer untuk csv.writer: write() langsung mengembalikan baris"""
+    def write(self, value):
+        return value
+
+
+@swagger_auto_schema(
+    method='get',
+    tags=['Answer'],
+    operation_description="Export survey answers, one row per respondent and one column per question (section/question order).",
+    manual_parameters=[
+        openapi.Parameter('file_type', openapi.IN_QUERY, description="csv (default) or xlsx", type=openapi.TYPE_STRING),
+    ],
+    responses={200: "CSV / XLSX file", 400: "Unsupported file_type", 404: "Survey not found"},
+)
+@api_view(['GET'])
+@permission_classes([permissions.AnswerExportPermissions])
+def answer_export(request, survey_id):
+    try:
+        survey = Survey.objects.get(pk=survey_id)
+    except Survey.DoesNotExist:
+        return Response({'detail': 'Survey not found.'}, status=404)
+
+    file_type = request.query_params.get('file_type', 'csv').lower()
+    if file_type not in ('csv', 'xlsx'):
+        return Response({'detail': "file_type must be 'csv' or 'xlsx'."}, status=400)
+
+    program_study = None
+    if request.user.role.name == 'Tim Prodi':
+        program_study = request.user.program_study
+
+    export = SurveyAnswerExport(
+        survey,
+        get_answer_queryset(request.user, survey),
+        program_study=program_study
+    )
+    filename = f"survey_{survey.id}_answers.{file_type}"
+
+    if file_type == 'xlsx':
+        return FileResponse(export.write_xlsx(), as_attachment=True, filename=filename)
+
+    writer = csv.writer(Echo())
+    response = StreamingHttpResponse(
+        (writer.writerow(row) for row in export.rows()),
+        content_type='text/csv'
+    )
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
+# =====================================================
+# HELPER: BULK ANSWER WRITE
+# =====================================================
+def _pk_set(values):
+    pks = set()
+    for value in values:
+        try:
+            pks.add(int(value))
+        except (TypeError, ValueError):
+            continue
+    return pks
+
+
+def preload_answer_context(survey, answers_data):
+    """
+    Ambil semua Question / ProgramSpecificQuestion yang direferensikan payload
+    dalam satu query masing-masing, untuk dipakai AnswerSerializer via context
+    """
+    items = [ans for ans in answers_data if isinstance(ans, dict)]
+    question_ids = _pk_set(ans.get('question') for ans in items)
+    program_question_ids = _pk_set(ans.get('program_specific_question') for ans in items)
+
+    return {
+        'surveys': {survey.id: survey},
+        'questions': Question.objects.in_bulk(question_ids) if question_ids else {},
+        'program_specific_questions': (
+            ProgramSpecificQuestion.objects.in_bulk(program_question_ids)
+            if program_question_ids else {}
+        ),
+    }
+
+
+def bulk_upsert_answers(user, survey, validated_answers):
+    """
+    Simpan jawaban yang sudah tervalidasi dengan bulk_create (upsert pada
+    unique user+question / user+program_specific_question) dalam satu transaksi
+
+    Returns:
+        list Answer yang tersimpan, urut sesuai payload
+    """
+    # Jika satu pertanyaan dikirim lebih dari sekali, jawaban terakhir yang dipakai
+    by_question, by_program_question = {}, {}
+    for data in validated_answers:
+        answer = Answer(
+            user=user,
+            survey=survey,
+            question=data.get('question'),
+            program_specific_question=data.get('program_specific_question'),
+            answer_value=data['answer_value'],
+            **{field: data.get(field) for field in TYPED_ANSWER_FIELDS},
+        )
+        if answer.question_id:
+            by_question[answer.question_id] = answer
+        else:
+            by_program_question[answer.program_specific_question_id] = answer
+
+    with transaction.atomic():
+        # Jawaban lama dibaca dulu supaya counter statistik bisa dikoreksi
+        previous = Answer.objects.filter(
+            Q(question_id__in=by_question) | Q(program_specific_question_id__in=by_program_question),
+            user=user,
+        ).values_list('question_id', 'program_specific_question_id', *TYPED_ANSWER_FIELDS)
+        program_study_id = user.program_study_id
+        update_answer_statistics(
+            removed=[
+                (
+                    answer_question(by_question[question_id] if question_id else by_program_question[program_question_id]),
+                    program_study_id, values,
+                )
+                for question_id, program_question_id, *values in previous
+            ],
+            added=[
+                (answer_question(answer), program_study_id, typed_values(answer))
+                for answer in [*by_question.values(), *by_program_question.values()]
+            ],
+        )
+
+        if by_question:
+            Answer.objects.bulk_create(
+                by_question.values(),
+                update_conflicts=True,
+                unique_fields=['user', 'question'],
+                update_fields=['survey', 'answer_value', *TYPED_ANSWER_FIELDS, 'updated_at'],
+            )
+        if by_program_question:
+            Answer.objects.bulk_create(
+                by_program_question.values(),
+                update_conflicts=True,
+                unique_fields=['user', 'program_specific_question'],
+                update_fields=['survey', 'answer_value', *TYPED_ANSWER_FIELDS, 'updated_at'],
+            )
+
+    saved = Answer.objects.filter(user=user).filter(
+        Q(question_id__in=by_question) | Q(program_specific_question_id__in=by_program_question)
+    ).select_related(*ANSWER_RELATIONS)
+    saved = {
+        (answer.question_id, answer.program_specific_question_id): answer
+        for answer in saved
+    }
+
+    ordered = []
+    for data in validated_answers:
+        question = data.get('question')
+        program_question = data.get('program_specific_question')
+        key = (question.id if question else None, program_question.id if program_question else None)
+        if key in saved:
+            ordered.append(saved.pop(key))
+    return ordered
+
+
 @api_view(['POST'])
 @permission_classes([permissions.AnswerPermissions])
 def answer_bulk_create(request, survey_id):
@@ -173,48 +414,32 @@ def answer_bulk_create(request, survey_id):
         return Response({'detail': 'Survey not found.'}, status=404)
 
     answers_data = request.data.get('answers', [])
-    results, errors = [], []
+    context = preload_answer_context(survey, answers_data)
+    validated, errors = [], []
 
+    # Satu pass validasi tanpa query per item (Question/Survey dari context)
     for idx, ans in enumerate(answers_data):
         ans = ans.copy()
         ans['survey'] = survey_id
-        serializer = AnswerSerializer(data=ans)
+        serializer = AnswerSerializer(data=ans, context=context)
         if serializer.is_valid():
-            serializer.save(user=request.user)
-            results.append(serializer.data)
+            validated.append(serializer.validated_data)
         else:
             errors.append({'index': idx, 'errors': serializer.errors})
 
+    saved = bulk_upsert_answers(request.user, survey, validated) if validated else []
+    if saved:
+        refresh_progress(request.user.id, [survey.id])
+    results = AnswerSerializer(saved, many=True).data
+
     if errors:
         return Response({'success': results, 'errors': errors}, status=207)
 
-    # Supervisor email logic (unchanged)
+    # Undangan atasan dikirim worker `send_supervisor_invitations` (outbox)
     if survey.survey_type == "lv1":
-        code = SystemConfig.objects.get(key="QUESTION_CODE_SPV_EMAIL").value
-        question_spv = Question.objects.get(code=code)
-        answer_spv = Answer.objects.get(
-            user=request.user,
-            survey=survey,
-            question=question_spv
-        )
-        spv_email = answer_spv.answer_value
-
-        token_obj = SupervisorToken.objects.create(alumni=request.user)
-        skp_survey = Survey.objects.get(survey_type='skp')
-        token = str(token_obj.token)
-
-        send_mail(
-            f"Pengisian survey kepuasan pengguna - {request.user.username}",
-            f"""
-Nama : {request.user.username}
-NIM : {request.user.id}
-Program Studi : {request.user.program_study.name}
-
-Link:
-{os.getenv("FRONTEND_URL")}/surveys/{skp_survey.id}/skp?token={token}
-""",
-            settings.EMAIL_HOST_USER,
-            [spv_email],
+        SupervisorInvitation.objects.bulk_create(
+            [SupervisorInvitation(alumni=request.user, survey=survey)],
+            ignore_conflicts=True,
         )
 
     return Response(results, status=201)
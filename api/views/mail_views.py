@@ -1,17 +1,15 @@
-from django.utils import timezone
-from django.core.mail import send_mail
-from django.conf import settings
-
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
 
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
 from api.permissions.permissions import AllReminderPermission, ProdiReminderPermission, UserReminderPermission
 
-from accounts.models import User
-from api.models import Survey, Question, Answer
+from api.models import ReminderJob
+from api.serializers import ReminderJobSerializer, ReminderUsersSerializer
 
 program_study_ids_param = openapi.Parameter(
     'program_study_ids',
@@ -22,18 +20,28 @@ program_study_ids_param = openapi.Parameter(
 )
 
 
+def job_queued_response(job):
+    """Response 202 untuk job reminder yang baru dibuat (dikirim oleh worker process_reminder_jobs)"""
+    return Response({
+        "message": "Reminder job queued",
+        "job_id": job.id,
+        "status": job.status,
+    }, status=status.HTTP_202_ACCEPTED)
+
+
 
 
 @swagger_auto_schema(
     methods=['POST'],
     tags=['Survey Reminder'],
-    operation_description="Send reminder emails to all alumni who have not completed active surveys.",
+    operation_description="Queue a background job that sends reminder emails to all alumni who have not completed active surveys.",
     responses={
-        200: openapi.Schema(
+        202: openapi.Schema(
             type=openapi.TYPE_OBJECT,
             properties={
                 "message": openapi.Schema(type=openapi.TYPE_STRING),
-                "total_reminded": openapi.Schema(type=openapi.TYPE_INTEGER),
+                "job_id": openapi.Schema(type=openapi.TYPE_INTEGER),
+                "status": openapi.Schema(type=openapi.TYPE_STRING),
             },
         )
     },
@@ -41,57 +49,8 @@ program_study_ids_param = openapi.Parameter(
 @api_view(['POST'])
 @permission_classes([AllReminderPermission])
 def remind_unfinished_survey_users(request):
-    now = timezone.now()
-    reminders_sent = []
-
-    active_surveys = Survey.objects.filter(
-        is_active=True,
-        start_at__lte=now,
-        end_at__gte=now
-    )
-
-    alumni_users = User.objects.filter(
-        role__name='Alumni'
-    ).select_related('program_study')
-
-    for survey in active_surveys:
-        required_questions = Question.objects.filter(
-            section__survey=survey,
-            is_required=True
-        )
-
-        total_required = required_questions.count()
-        if total_required == 0:
-            continue
-
-        for user in alumni_users:
-            answered_count = Answer.objects.filter(
-                user=user,
-                survey=survey,
-                question__in=required_questions
-            ).count()
-
-            if answered_count < total_required:
-                send_mail(
-                    subject=f"Reminder Survey: {survey.title}",
-                    message=(
-                        f"Halo {user.username},\n\n"
-                        f"Anda belum menyelesaikan survey:\n"
-                        f"{survey.title}\n\n"
-                        f"Batas waktu: {survey.end_at}\n\n"
-                        f"Terima kasih."
-                    ),
-                    from_email=settings.DEFAULT_FROM_EMAIL,
-                    recipient_list=[user.email],
-                    fail_silently=True,
-                )
-
-                reminders_sent.append(user.id)
-
-    return Response({
-        "message": "Reminder process completed",
-        "total_reminded": len(reminders_sent),
-    })
+    job = ReminderJob.objects.create(scope='all', created_by=request.user)
+    return job_queued_response(job)
 
 
 
@@ -102,12 +61,14 @@ def remind_unfinished_survey_users(request):
 @swagger_auto_schema(
     methods=['POST'],
     tags=['Survey Reminder'],
-    operation_description="Send reminder emails to alumni in the Prodi of the logged-in Prodi user.",
+    operation_description="Queue a background job that sends reminder emails to alumni in the Prodi of the logged-in Prodi user.",
     responses={
-        200: openapi.Schema(
+        202: openapi.Schema(
             type=openapi.TYPE_OBJECT,
             properties={
-                "total_reminded": openapi.Schema(type=openapi.TYPE_INTEGER),
+                "message": openapi.Schema(type=openapi.TYPE_STRING),
+                "job_id": openapi.Schema(type=openapi.TYPE_INTEGER),
+                "status": openapi.Schema(type=openapi.TYPE_STRING),
             },
         )
     },
@@ -115,57 +76,12 @@ def remind_unfinished_survey_users(request):
 @api_view(['POST'])
 @permission_classes([ProdiReminderPermission])
 def remind_unfinished_by_program_study(request):
-    now = timezone.now()
-    reminders_sent = []
-
-    users = User.objects.filter(
-        role__name='Alumni',
-        program_study=request.user.program_study
-    ).select_related('program_study')
-
-    active_surveys = Survey.objects.filter(
-        is_active=True,
-        start_at__lte=now,
-        end_at__gte=now
+    job = ReminderJob.objects.create(
+        scope='program_study',
+        program_study=request.user.program_study,
+        created_by=request.user
     )
-
-    for survey in active_surveys:
-        required_questions = Question.objects.filter(
-            section__survey=survey,
-            is_required=True
-        )
-
-        total_required = required_questions.count()
-        if total_required == 0:
-            continue
-
-        for user in users:
-            answered_count = Answer.objects.filter(
-                user=user,
-                survey=survey,
-                question__in=required_questions
-            ).count()
-
-            if answered_count < total_required:
-                send_mail(
-                    subject=f"Reminder Survey: {survey.title}",
-                    message=(
-                        f"Halo {user.username},\n\n"
-                        f"Anda belum menyelesaikan survey:\n"
-                        f"{survey.title}\n\n"
-                        f"Batas waktu: {survey.end_at}\n\n"
-                        f"Terima kasih."
-                    ),
-                    from_email=settings.DEFAULT_FROM_EMAIL,
-                    recipient_list=[user.email],
-                    fail_silently=True,
-                )
-
-                reminders_sent.append(user.id)
-
-    return Response({
-        "total_reminded": len(reminders_sent),
-    })
+    return job_queued_response(job)
 
 
 
@@ -176,7 +92,7 @@ def remind_unfinished_by_program_study(request):
 @swagger_auto_schema(
     methods=['POST'],
     tags=['Survey Reminder'],
-    operation_description="Send reminder emails to specific alumni users.",
+    operation_description="Queue a background job that sends reminder emails to specific alumni users.",
     request_body=openapi.Schema(
         type=openapi.TYPE_OBJECT,
         required=['user_ids'],
@@ -188,67 +104,59 @@ def remind_unfinished_by_program_study(request):
         },
     ),
     responses={
-        200: openapi.Schema(
+        202: openapi.Schema(
             type=openapi.TYPE_OBJECT,
             properties={
-                "total_reminded": openapi.Schema(type=openapi.TYPE_INTEGER),
+                "message": openapi.Schema(type=openapi.TYPE_STRING),
+                "job_id": openapi.Schema(type=openapi.TYPE_INTEGER),
+                "status": openapi.Schema(type=openapi.TYPE_STRING),
             },
-        )
+        ),
+        400: "user_ids must be a list of user IDs",
     },
 )
 @api_view(['POST'])
 @permission_classes([UserReminderPermission])
-def remind_unfinished_by_users(request):
-    user_ids = request.data.get("user_ids", [])
+def remind_unfinished_by_users(request, user_id=None):
+    serializer = ReminderUsersSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    user_ids = serializer.validated_data['user_ids']
+    if user_id is not None:
+        user_ids = [*user_ids, str(user_id)]
+
+    job = ReminderJob.objects.create(
+        scope='users',
+        user_ids=user_ids,
+        created_by=request.user
+    )
+    return job_queued_response(job)
 
-    now = timezone.now()
-    reminders_sent = []
 
-    users = User.objects.filter(
-        id__in=user_ids,
-        role__name='Alumni'
-    )
 
-    active_surveys = Survey.objects.filter(
-        is_active=True,
-        start_at__lte=now,
-        end_at__gte=now
-    )
 
-    for survey in active_surveys:
-        required_questions = Question.objects.filter(
-            section__survey=survey,
-            is_required=True
-        )
 
-        total_required = required_questions.count()
-        if total_required == 0:
-            continue
-
-        for user in users:
-            answered_count = Answer.objects.filter(
-                user=user,
-                survey=survey,
-                question__in=required_questions
-            ).count()
-
-            if answered_count < total_required:
-                send_mail(
-                    subject=f"Reminder Survey: {survey.title}",
-                    message=(
-                        f"Halo {user.username},\n\n"
-                        f"Anda belum menyelesaikan survey:\n"
-                        f"{survey.title}\n\n"
-                        f"Batas waktu: {survey.end_at}\n\n"
-                        f"Terima kasih."
-                    ),
-                    from_email=settings.DEFAULT_FROM_EMAIL,
-                    recipient_list=[user.email],
-                    fail_silently=True,
-                )
-
-                reminders_sent.append(user.id)
 
-    return Response({
-        "total_reminded": len(reminders_sent),
-    })
+
+@swagger_auto_schema(
+    method='get',
+    tags=['Survey Reminder'],
+    operation_description="Get progress, throughput and errors of a reminder job.",
+    responses={200: ReminderJobSerializer, 404: "Job not found"},
+)
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def reminder_job_detail(request, job_id):
+    jobs = ReminderJob.objects.all()
+
+    # Selain Admin/Tracer hanya bisa melihat job miliknya sendiri
+    if not request.user.role or request.user.role.name not in ['Admin', 'Tracer']:
+        jobs = jobs.filter(created_by=request.user)
+
+    try:
+        job = jobs.get(pk=job_id)
+    except ReminderJob.DoesNotExist:
+        return Response({"detail": "Reminder job not found."}, status=status.HTTP_404_NOT_FOUND)
+
+    return Response(ReminderJobSerializer(job).data)
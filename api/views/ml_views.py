@@ -7,6 +7,8 @@ from drf_yasg import openapi
 from api.serializers import (
     ClassificationInputSerializer,
     ClassificationOutputSerializer,
+    ClassificationBatchInputSerializer,
+    ClassificationBatchOutputSerializer,
     ClusteringInputSerializer,
     ClusteringOutputSerializer,
     ClusteringBatchOutputSerializer,
@@ -65,6 +67,52 @@ def classification_predict(request):
         )
 
 
+@swagger_auto_schema(
+    method='post',
+    tags=['Machine Learning - Classification'],
+    operation_description="""
+    Predict classification for many alumni records at once (e.g. a whole program study cohort).
+    All records are scored with a single model call.
+    """,
+    request_body=ClassificationBatchInputSerializer,
+    responses={
+        200: openapi.Response("Batch classification result", ClassificationBatchOutputSerializer),
+        400: "Invalid input data",
+        500: "Internal server error"
+    }
+)
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def classification_predict_batch(request):
+    """
+    Endpoint untuk prediksi batch menggunakan classification model (XGBoost)
+    Mengembalikan hasil per record beserta jumlah per label
+    """
+    try:
+        serializer = ClassificationBatchInputSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(
+                {'error': 'Invalid input', 'details': serializer.errors},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        records = serializer.validated_data['records']
+        result = ml_loader.predict_classification_batch(records)
+        
+        return Response(result, status=status.HTTP_200_OK)
+            
+    except FileNotFoundError as e:
+        return Response(
+            {'error': 'Model files not found', 'details': str(e)},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+    except Exception as e:
+        return Response(
+            {'error': 'Prediction failed', 'details': str(e), 'traceback': traceback.format_exc()},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
 @swagger_auto_schema(
     method='get',
     tags=['Machine Learning - Classification'],
@@ -86,6 +134,7 @@ def classification_info(request):
         
         return Response({
             'model_type': 'XGBoost Classifier',
+            'backend': ml_loader.classification_backend,
             'features': config['preprocessing']['features'],
             'target_mapping': config.get('target_mapping', {}),
             'categorical_mappings': mappings,
@@ -358,6 +407,13 @@ def ml_health_check(request):
         health_status['forecasting']['status'] = 'error'
         health_status['forecasting']['error'] = str(e)
     
+    # Versi artifact yang sedang aktif beserta waktu load-nya
+    for group, model_status in health_status.items():
+        version_info = ml_loader.get_version_info(group)
+        model_status['version'] = version_info['version']
+        model_status['loaded_at'] = version_info['loaded_at']
+        model_status['artifacts'] = version_info['artifacts']
+    
     all_ok = all(v['status'] == 'ok' for v in health_status.values())
     
     return Response(
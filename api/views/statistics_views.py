@@ -0,0 +1,78 @@
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+from rest_framework import status
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+from api.models import Question, ProgramSpecificQuestion
+from api.permissions import permissions
+from api.statistics import question_statistics
+
+
+def _int_param(request, name):
+    value = request.query_params.get(name)
+    if value in (None, ''):
+        return None
+    return int(value)
+
+
+@swagger_auto_schema(
+    method='get',
+    tags=['Statistics'],
+    operation_description=(
+        "Per-question answer distributions: option counts for radio/dropdown/checkbox, "
+        "histogram and mean for scale/number. Filter by survey or periode, and optionally "
+        "by the respondent's program study (Tim Prodi always see their own program study). "
+        "Program-specific questions of the survey follow the regular questions (`question_id` null, "
+        "`program_specific_question_id` set); with a program study filter only that program "
+        "study's own questions are included."
+    ),
+    manual_parameters=[
+        openapi.Parameter('survey', openapi.IN_QUERY, description="Survey ID", type=openapi.TYPE_INTEGER),
+        openapi.Parameter('periode', openapi.IN_QUERY, description="Periode ID", type=openapi.TYPE_INTEGER),
+        openapi.Parameter('program_study', openapi.IN_QUERY, description="Program Study ID", type=openapi.TYPE_INTEGER),
+    ],
+    responses={
+        200: "List of question statistics",
+        400: "Missing or invalid filter",
+        403: "Tim Prodi account without a program study",
+    },
+)
+@api_view(['GET'])
+@permission_classes([permissions.StatisticsPermissions])
+def survey_statistics(request):
+    try:
+        survey_id = _int_param(request, 'survey')
+        periode_id = _int_param(request, 'periode')
+        program_study_id = _int_param(request, 'program_study')
+    except ValueError:
+        return Response({'detail': 'survey, periode and program_study must be integers.'}, status=status.HTTP_400_BAD_REQUEST)
+
+    if survey_id is None and periode_id is None:
+        return Response({'detail': 'Provide a survey or periode filter.'}, status=status.HTTP_400_BAD_REQUEST)
+
+    if request.user.role.name == 'Tim Prodi':
+        # Tim Prodi tanpa program studi tidak boleh jatuh ke statistik semua prodi
+        if request.user.program_study_id is None:
+            return Response(
+                {'detail': 'Your account is not assigned to a program study.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        program_study_id = request.user.program_study_id
+
+    questions = Question.objects.all()
+    if survey_id is not None:
+        questions = questions.filter(section__survey_id=survey_id)
+    if periode_id is not None:
+        questions = questions.filter(section__survey__periode_id=periode_id)
+    questions = questions.order_by('section__survey_id', 'section__order', 'order', 'id')
+
+    program_questions = ProgramSpecificQuestion.objects.all()
+    if survey_id is not None:
+        program_questions = program_questions.filter(survey_id=survey_id)
+    if periode_id is not None:
+        program_questions = program_questions.filter(survey__periode_id=periode_id)
+    if program_study_id is not None:
+        program_questions = program_questions.filter(program_study_id=program_study_id)
+    program_questions = program_questions.order_by('survey_id', 'order', 'id')
+
+    return Response(question_statistics(questions, program_study_id, program_questions))
@@ -1,8 +1,14 @@
+import json
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework import status
-from api.models import Survey, Section, Question, ProgramSpecificQuestion
-from api.serializers import SurveySerializer, SectionSerializer, QuestionSerializer, ProgramSpecificQuestionSerializer
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Prefetch
+from django.utils.cache import patch_vary_headers
+from api.models import Survey, Section, Question, ProgramSpecificQuestion, Answer
+from api.branching import get_survey_graph
+from api.serializers import SurveySerializer, SectionSerializer, QuestionSerializer, ProgramSpecificQuestionSerializer, SurveyTreeSerializer
 from api.permissions import permissions
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
@@ -107,6 +113,123 @@ def survey_detail(request, pk):
         survey.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
+def build_survey_tree(survey_id, program_study_id):
+    """
+    Serialisasi survey lengkap dengan jumlah query tetap:
+    survey, section, question, branch, pertanyaan khusus prodi
+    """
+    questions = Question.objects.order_by('order', 'id').prefetch_related('branches')
+    sections = Section.objects.order_by('order', 'id').prefetch_related(
+        Prefetch('questions', queryset=questions)
+    )
+    program_questions = ProgramSpecificQuestion.objects.filter(
+        program_study_id=program_study_id
+    ).select_related('program_study').order_by('order', 'id')
+
+    survey = Survey.objects.select_related('periode', 'created_by').prefetch_related(
+        Prefetch('sections', queryset=sections),
+        Prefetch('program_questions', queryset=program_questions, to_attr='tree_program_questions'),
+    ).get(pk=survey_id)
+
+    return SurveyTreeSerializer(survey).data
+
+
+@swagger_auto_schema(
+    method='get',
+    tags=['Survey'],
+    operation_description=(
+        "Retrieve a full survey (sections, questions, branches and program-specific questions "
+        "of a program study) in one response. Cached per survey version; send If-None-Match "
+        "with the ETag to get 304 when unchanged."
+    ),
+    manual_parameters=[
+        openapi.Parameter(
+            'program_study', openapi.IN_QUERY, type=openapi.TYPE_INTEGER,
+            description="Program Study ID for program-specific questions (default: the caller's program study)"
+        ),
+    ],
+    responses={200: SurveyTreeSerializer, 304: "Not modified", 404: "Survey not found"},
+)
+@api_view(['GET'])
+@permission_classes([permissions.SurveyPermissions])
+def survey_tree(request, pk):
+    version = Survey.objects.filter(pk=pk).values_list('version', flat=True).first()
+    if version is None:
+        return Response({'detail': 'Survey not found.'}, status=status.HTTP_404_NOT_FOUND)
+
+    program_study_id = request.query_params.get('program_study') or getattr(request.user, 'program_study_id', None)
+    try:
+        program_study_id = int(program_study_id) if program_study_id else None
+    except ValueError:
+        return Response({'detail': 'program_study must be an integer.'}, status=status.HTTP_400_BAD_REQUEST)
+
+    etag = f'"survey-{pk}-v{version}-ps{program_study_id or 0}"'
+    if etag in [tag.strip() for tag in request.headers.get('If-None-Match', '').split(',')]:
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        cache_key = f"survey_tree:{pk}:{program_study_id or 0}:{version}"
+        data = cache.get(cache_key)
+        if data is None:
+            data = build_survey_tree(pk, program_study_id)
+            cache.set(cache_key, data, settings.SURVEY_TREE_CACHE_TIMEOUT)
+        response = Response(data)
+
+    response['ETag'] = etag
+    patch_vary_headers(response, ['Authorization'])
+    return response
+
+
+@swagger_auto_schema(
+    method='get',
+    tags=['Survey'],
+    operation_description=(
+        "Compute the sections reachable through the survey branching for a set of answers, "
+        "and the required questions on those sections. Defaults to the caller's saved answers."
+    ),
+    manual_parameters=[
+        openapi.Parameter(
+            'answers', openapi.IN_QUERY, type=openapi.TYPE_STRING,
+            description='JSON object of question ID to answer value, e.g. {"12": "Ya"} (optional)'
+        ),
+    ],
+    responses={200: "Reachable sections", 400: "Invalid answers", 404: "Survey not found"},
+)
+@api_view(['GET'])
+@permission_classes([permissions.SurveyPermissions])
+def survey_navigation(request, pk):
+    graph = get_survey_graph(pk)
+    if graph is None:
+        return Response({'detail': 'Survey not found.'}, status=status.HTTP_404_NOT_FOUND)
+
+    raw_answers = request.query_params.get('answers')
+    if raw_answers is not None:
+        try:
+            answers = {int(key): str(value) for key, value in json.loads(raw_answers).items()}
+        except (json.JSONDecodeError, AttributeError, TypeError, ValueError):
+            return Response(
+                {'detail': 'answers must be a JSON object of question ID to answer value.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+    elif request.user.is_authenticated:
+        answers = dict(Answer.objects.filter(
+            user=request.user,
+            survey_id=pk,
+            question_id__in=graph.required_question_ids | graph.branch_question_ids,
+        ).values_list('question_id', 'answer_value'))
+    else:
+        answers = {}
+
+    required = graph.reachable_required(answers)
+    return Response({
+        'survey_id': graph.survey_id,
+        'version': graph.version,
+        'sections': graph.reachable_sections(answers),
+        'required_questions': sorted(required),
+        'answered_required': len(required.intersection(answers)),
+        'total_required': len(required),
+    })
+
+
 @api_view(['GET', 'POST'])
 @permission_classes([permissions.SurveyPermissions])
 def section_list_create(request, survey_id):
@@ -146,6 +146,13 @@ REST_FRAMEWORK = {
     ),
 }
 
+# Keyset pagination daftar jawaban (?page_size=, maksimum ANSWER_MAX_PAGE_SIZE)
+ANSWER_PAGE_SIZE = int(os.getenv("ANSWER_PAGE_SIZE", "100"))
+ANSWER_MAX_PAGE_SIZE = int(os.getenv("ANSWER_MAX_PAGE_SIZE", "1000"))
+
+# Lama cache (detik) struktur survey lengkap per (survey, program studi, version)
+SURVEY_TREE_CACHE_TIMEOUT = int(os.getenv("SURVEY_TREE_CACHE_TIMEOUT", "3600"))
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=60),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=1),
@@ -178,6 +185,28 @@ EMAIL_USE_TLS = os.getenv("EMAIL_USE_TLS") == "True"
 
 DEFAULT_FROM_EMAIL = EMAIL_HOST_USER
 
+# Reminder massal: jumlah email per koneksi SMTP dan batas kirim (email/detik, 0 = tanpa batas)
+REMINDER_CHUNK_SIZE = int(os.getenv("REMINDER_CHUNK_SIZE", "100"))
+REMINDER_SEND_RATE = float(os.getenv("REMINDER_SEND_RATE", "0"))
+
+# User yang sudah diingatkan dalam jendela ini (jam) tidak dikirimi reminder lagi
+REMINDER_COOLDOWN_HOURS = float(os.getenv("REMINDER_COOLDOWN_HOURS", "24"))
+
+# Job reminder "running" tanpa heartbeat selama lease (detik) diambil ulang worker lain,
+# setelah REMINDER_JOB_MAX_ATTEMPTS percobaan job ditandai failed
+REMINDER_JOB_LEASE_SECONDS = int(os.getenv("REMINDER_JOB_LEASE_SECONDS", "900"))
+REMINDER_JOB_MAX_ATTEMPTS = int(os.getenv("REMINDER_JOB_MAX_ATTEMPTS", "3"))
+
+# Load semua ML model saat worker start supaya request pertama tidak lambat
+ML_WARMUP_ON_START = os.getenv("ML_WARMUP_ON_START") == "True"
+
+# Interval (detik) pengecekan perubahan file di exports/ untuk hot-reload model
+ML_RELOAD_CHECK_INTERVAL = float(os.getenv("ML_RELOAD_CHECK_INTERVAL", "5"))
+
+# "booster": xgboost.Booster native dari xgb_model.json, "pickle": XGBClassifier dari xgb_model.pkl
+ML_CLASSIFICATION_BACKEND = os.getenv("ML_CLASSIFICATION_BACKEND", "booster")
+ML_XGB_NTHREAD = int(os.getenv("ML_XGB_NTHREAD")) if os.getenv("ML_XGB_NTHREAD") else None
+
 SWAGGER_SETTINGS = {
     'USE_SESSION_AUTH': False,
     'SECURITY_DEFINITIONS': {
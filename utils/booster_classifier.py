@@ -0,0 +1,58 @@
+import json
+import numpy as np
+import xgboost as xgb
+
+# Objective yang outputnya probabilitas kelas (multi:softmax hanya mengembalikan label)
+PROBA_OBJECTIVES = ('binary:logistic', 'multi:softprob')
+
+
+class BoosterClassifier:
+    """
+    Wrapper tipis di atas xgboost.Booster native (di-load dari xgb_model.json)
+
+    Menyediakan predict_proba seperti XGBClassifier, tetapi scoring langsung
+    lewat inplace_predict pada NumPy array tanpa DataFrame maupun unpickling.
+    """
+
+    def __init__(self, booster):
+        self.booster = booster
+        self.feature_names = booster.feature_names
+        config = json.loads(booster.save_config())
+        self.objective = config['learner']['objective']['name']
+        if self.objective not in PROBA_OBJECTIVES:
+            raise ValueError(
+                f"Model XGBoost harus memakai objective {' / '.join(PROBA_OBJECTIVES)}, "
+                f"bukan '{self.objective}'"
+            )
+
+    @classmethod
+    def from_json(cls, raw, nthread=None):
+        """
+        Args:
+            raw: isi file xgb_model.json (bytes)
+            nthread: jumlah thread untuk scoring, None = default xgboost
+        """
+        booster = xgb.Booster()
+        booster.load_model(bytearray(raw))
+        if nthread:
+            booster.set_param({'nthread': nthread})
+        return cls(booster)
+
+    def predict_proba(self, X):
+        """
+        Args:
+            X: array-like (n_samples, n_features) dengan urutan feature_names
+
+        Returns:
+            numpy array (n_samples, n_classes)
+        """
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        proba = self.booster.inplace_predict(X)
+
+        # binary:logistic hanya mengembalikan probabilitas kelas 1
+        if self.objective == 'binary:logistic':
+            return np.column_stack([1.0 - proba, proba])
+        return proba
+
+    def predict(self, X):
+        return self.predict_proba(X).argmax(axis=1)
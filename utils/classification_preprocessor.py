@@ -0,0 +1,76 @@
+import numpy as np
+
+
+class ClassificationPreprocessor:
+    """
+    Preprocessing kolumnar untuk classification model
+
+    Input (list of dict atau DataFrame dengan kolom F502, F14, F5d, ...) diproses
+    per kolom sekaligus untuk N baris: mapping F14 lewat lookup array NumPy dan
+    default untuk kolom yang tidak ada.
+
+    Hasilnya fitur mentah: model XGBoost dilatih tanpa imputer/scaler dan menangani
+    NaN sendiri. Statistik imputer/scaler di supervised_config.json (5 fitur) berasal
+    dari pipeline lain dan sengaja tidak dipakai.
+    """
+
+    # (fitur model, key input, default jika key tidak ada)
+    NUMERIC_COLUMNS = [
+        ('F502', 'F502', 3.0),  # Waktu tunggu kerja, default: 3 bulan
+        ('F5d_enc', 'F5d', 3.0),  # Tingkat tempat kerja (ordinal 1-5)
+        ('Years_Since_Graduation', 'Years_Since_Graduation', 2.0),
+        ('Gap_Etika', 'Gap_Etika', 0.0),
+        ('Gap_Keahlian', 'Gap_Keahlian', 0.0),
+        ('Gap_English', 'Gap_English', 0.0),
+        ('Gap_IT', 'Gap_IT', 0.0),
+        ('Gap_Komunikasi', 'Gap_Komunikasi', 0.0),
+        ('Gap_Teamwork', 'Gap_Teamwork', 0.0),
+        ('Gap_Development', 'Gap_Development', 0.0),
+    ]
+    F14_DEFAULT = 3  # Cukup Erat
+
+    def __init__(self, features, mappings):
+        self.features = list(features)
+        self.index = {name: i for i, name in enumerate(self.features)}
+
+        # Lookup F14: kategori terurut + kode, dicari dengan searchsorted
+        f14_map = mappings['f14_map']
+        self.f14_keys = np.array(sorted(f14_map), dtype=str)
+        self.f14_codes = np.array([f14_map[key] for key in self.f14_keys], dtype=float)
+
+    def _column(self, records, key, default):
+        # list of dict: satu list per kolom; DataFrame: ambil kolom utuh (None jika tidak ada)
+        if isinstance(records, list):
+            return [record.get(key, default) for record in records]
+        return records[key] if key in records else None
+
+    def encode_f14(self, values):
+        values = np.asarray(values, dtype=str)
+        if len(self.f14_keys) == 0:
+            return np.full(len(values), self.F14_DEFAULT, dtype=float)
+
+        idx = np.searchsorted(self.f14_keys, values).clip(max=len(self.f14_keys) - 1)
+        found = self.f14_keys[idx] == values
+        return np.where(found, self.f14_codes[idx], self.F14_DEFAULT)
+
+    def transform(self, records):
+        """
+        Args:
+            records: list of dict atau DataFrame dengan kolom sesuai key input
+
+        Returns:
+            numpy array float64 (n_records, n_features) dengan urutan fitur model
+        """
+        X = np.empty((len(records), len(self.features)), dtype=float)
+
+        for feature, key, default in self.NUMERIC_COLUMNS:
+            column = self._column(records, key, default)
+            if column is None:
+                X[:, self.index[feature]] = default
+            else:
+                X[:, self.index[feature]] = np.asarray(column, dtype=float)
+
+        f14 = self._column(records, 'F14', '')
+        X[:, self.index['F14_enc']] = self.F14_DEFAULT if f14 is None else self.encode_f14(f14)
+
+        return X
@@ -0,0 +1,69 @@
+import numpy as np
+
+
+class ClusteringEngine:
+    """
+    Inference KMeans + PCA dengan NumPy murni
+
+    Parameter StandardScaler, centroid KMeans dan komponen PCA diekstrak sekali
+    menjadi array contiguous, sehingga prediksi cukup beberapa operasi matriks
+    tanpa overhead validasi scikit-learn di setiap request.
+    """
+
+    def __init__(self, scaler, kmeans, pca):
+        n_features = kmeans.cluster_centers_.shape[1]
+
+        # StandardScaler: (X - mean) / scale, mean/scale bisa None (with_mean/with_std=False)
+        mean = getattr(scaler, 'mean_', None)
+        scale = getattr(scaler, 'scale_', None)
+        self.scaler_mean = np.ascontiguousarray(
+            mean if mean is not None else np.zeros(n_features), dtype=np.float64
+        )
+        self.scaler_scale = np.ascontiguousarray(
+            scale if scale is not None else np.ones(n_features), dtype=np.float64
+        )
+
+        # KMeans: argmin ||x - c||^2 = argmin (||c||^2 - 2 x.c)
+        self.centroids_t = np.ascontiguousarray(kmeans.cluster_centers_.T, dtype=np.float64)
+        self.centroid_sq_norms = np.einsum('ij,ij->i', kmeans.cluster_centers_, kmeans.cluster_centers_)
+
+        # PCA: (X - mean) @ components.T, dibagi sqrt(explained_variance) jika whiten
+        components_t = np.asarray(pca.components_, dtype=np.float64).T
+        if getattr(pca, 'whiten', False):
+            components_t = components_t / np.sqrt(pca.explained_variance_)
+        self.pca_components_t = np.ascontiguousarray(components_t)
+        self.pca_offset = np.asarray(pca.mean_, dtype=np.float64) @ self.pca_components_t
+
+    def scale(self, X):
+        return (np.asarray(X, dtype=np.float64) - self.scaler_mean) / self.scaler_scale
+
+    def assign(self, X_scaled):
+        """Cluster terdekat untuk data yang sudah di-scale"""
+        distances = self.centroid_sq_norms - 2.0 * (X_scaled @ self.centroids_t)
+        return distances.argmin(axis=1)
+
+    def project(self, X_scaled):
+        """Koordinat PCA untuk data yang sudah di-scale"""
+        return X_scaled @ self.pca_components_t - self.pca_offset
+
+    def predict(self, X, chunk_size=10000):
+        """
+        Scale, assign cluster dan proyeksi PCA untuk data mentah
+
+        Args:
+            X: array (n_samples, n_features) dengan urutan features_used
+            chunk_size: jumlah baris per chunk agar memori tetap terbatas untuk batch besar
+
+        Returns:
+            tuple (clusters, pca_coordinates)
+        """
+        X = np.asarray(X, dtype=np.float64)
+        clusters = np.empty(len(X), dtype=np.int64)
+        coordinates = np.empty((len(X), self.pca_components_t.shape[1]), dtype=np.float64)
+
+        for start in range(0, len(X), chunk_size):
+            X_scaled = self.scale(X[start:start + chunk_size])
+            clusters[start:start + chunk_size] = self.assign(X_scaled)
+            coordinates[start:start + chunk_size] = self.project(X_scaled)
+
+        return clusters, coordinates
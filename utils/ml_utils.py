@@ -1,76 +1,155 @@
+import io
 import os
 import json
+import time
 import pickle
 import numpy as np
 import pandas as pd
 from django.conf import settings
+from utils.model_registry import ArtifactRegistry
+from utils.clustering_engine import ClusteringEngine
+from utils.classification_preprocessor import ClassificationPreprocessor
+
+# Batas atas steps untuk forecast_custom (lihat ForecastCustomSerializer)
+FORECAST_MAX_STEPS = 20
+
+# Model XGBoost expects these 11 features (in this exact order)
+CLASSIFICATION_FEATURES = [
+    'F502', 'F14_enc', 'F5d_enc', 'Years_Since_Graduation',
+    'Gap_Etika', 'Gap_Keahlian', 'Gap_English', 'Gap_IT',
+    'Gap_Komunikasi', 'Gap_Teamwork', 'Gap_Development'
+]
+
+
+def _load_pickle(raw):
+    try:
+        return pickle.loads(raw)
+    except (pickle.UnpicklingError, ValueError, EOFError) as e:
+        raise FileNotFoundError(f"Model file is corrupt or incompatible. Please regenerate the model. Error: {str(e)}")
+
+
+def _load_historical_csv(raw):
+    df = pd.read_csv(io.BytesIO(raw))
+    
+    # Normalize column names untuk historical
+    # Handle both 'Tahun Lulus' and 'Tahun'
+    if 'Tahun Lulus' in df.columns:
+        df.rename(columns={'Tahun Lulus': 'year'}, inplace=True)
+    elif 'Tahun' in df.columns:
+        df.rename(columns={'Tahun': 'year'}, inplace=True)
+    
+    # Handle both 'jumlah_lulusan' and other variations
+    if 'jumlah_lulusan' in df.columns:
+        df.rename(columns={'jumlah_lulusan': 'lulusan'}, inplace=True)
+    
+    return df.to_dict('records')
+
+
+def _load_forecast_csv(raw):
+    df = pd.read_csv(io.BytesIO(raw))
+    
+    # Normalize column names untuk forecast
+    if 'Tahun' in df.columns:
+        df.rename(columns={'Tahun': 'year'}, inplace=True)
+    
+    # Handle both 'predicted_jumlah_lulusan' and other variations
+    if 'predicted_jumlah_lulusan' in df.columns:
+        df.rename(columns={'predicted_jumlah_lulusan': 'lulusan'}, inplace=True)
+    
+    return df.to_dict('records')
+
 
 class MLModelLoader:
     """
     Utility class untuk load ML models dan konfigurasi
+    
+    Semua artifact disimpan di ArtifactRegistry, sehingga aman dipakai dari banyak
+    thread dan otomatis memakai versi baru jika file di exports/ diganti.
     """
     
+    ARTIFACTS = {
+        'classification': [
+            'xgb_model.pkl', 'xgb_model.json', 'supervised_config.json', 'scaler_supervised.pkl',
+            'imputer_supervised.pkl', 'mappings_supervised.json',
+        ],
+        'clustering': [
+            'kmeans_model.pkl', 'clustering_config.json', 'scaler.pkl', 'pca_model.pkl',
+        ],
+        'forecasting': [
+            'arima_model.pickle', 'forecast_config.json',
+        ],
+    }
+    
     def __init__(self):
         self.base_path = os.path.join(settings.BASE_DIR, 'exports')
         self.classification_path = os.path.join(self.base_path, 'classification')
         self.clustering_path = os.path.join(self.base_path, 'clustering')
         self.forecast_path = os.path.join(self.base_path, 'forecast')
         
-        self._classification_model = None
-        self._classification_config = None
-        self._classification_scaler = None
-        self._classification_imputer = None
-        self._classification_mappings = None
+        self.classification_backend = getattr(settings, 'ML_CLASSIFICATION_BACKEND', 'booster')
+        self.xgb_nthread = getattr(settings, 'ML_XGB_NTHREAD', None)
         
-        self._clustering_model = None
-        self._clustering_config = None
-        self._clustering_scaler = None
-        self._clustering_pca = None
+        self.registry = ArtifactRegistry(
+            check_interval=getattr(settings, 'ML_RELOAD_CHECK_INTERVAL', 5.0)
+        )
         
-        self._forecast_model = None
-        self._forecast_config = None
+        # (sumber, hasil) untuk objek turunan artifact: engine dan response forecast
+        self._classification_preprocessor_cache = None
+        self._clustering_engine_cache = None
+        self._forecast_data_cache = None
+        self._forecast_table_cache = None
+    
+    def _artifact_paths(self, group):
+        folder = {
+            'classification': self.classification_path,
+            'clustering': self.clustering_path,
+            'forecasting': self.forecast_path,
+        }[group]
+        return [os.path.join(folder, filename) for filename in self.ARTIFACTS[group]]
+    
+    def get_version_info(self, group):
+        """
+        Versi aktif artifact untuk satu grup model (classification/clustering/forecasting)
+        
+        Returns:
+            dict dengan version, loaded_at, dan versi per file
+        """
+        return self.registry.describe(self._artifact_paths(group))
     
     # ==================== CLASSIFICATION ====================
     
     def load_classification_model(self):
-        """Load XGBoost classification model"""
-        if self._classification_model is None:
-            model_path = os.path.join(self.classification_path, 'xgb_model.pkl')
-            with open(model_path, 'rb') as f:
-                self._classification_model = pickle.load(f)
-        return self._classification_model
+        """
+        Load XGBoost classification model
+        
+        ML_CLASSIFICATION_BACKEND = 'booster' memakai xgboost.Booster native dari
+        xgb_model.json, 'pickle' memakai XGBClassifier dari xgb_model.pkl.
+        """
+        if self.classification_backend == 'booster':
+            return self.registry.get(
+                os.path.join(self.classification_path, 'xgb_model.json'), self._load_booster
+            )
+        return self.registry.get(os.path.join(self.classification_path, 'xgb_model.pkl'), _load_pickle)
+    
+    def _load_booster(self, raw):
+        from utils.booster_classifier import BoosterClassifier
+        return BoosterClassifier.from_json(raw, nthread=self.xgb_nthread)
     
     def load_classification_config(self):
         """Load classification configuration"""
-        if self._classification_config is None:
-            config_path = os.path.join(self.classification_path, 'supervised_config.json')
-            with open(config_path, 'r') as f:
-                self._classification_config = json.load(f)
-        return self._classification_config
+        return self.registry.get(os.path.join(self.classification_path, 'supervised_config.json'), json.loads)
     
     def load_classification_scaler(self):
         """Load StandardScaler for classification"""
-        if self._classification_scaler is None:
-            scaler_path = os.path.join(self.classification_path, 'scaler_supervised.pkl')
-            with open(scaler_path, 'rb') as f:
-                self._classification_scaler = pickle.load(f)
-        return self._classification_scaler
+        return self.registry.get(os.path.join(self.classification_path, 'scaler_supervised.pkl'), _load_pickle)
     
     def load_classification_imputer(self):
         """Load SimpleImputer for classification"""
-        if self._classification_imputer is None:
-            imputer_path = os.path.join(self.classification_path, 'imputer_supervised.pkl')
-            with open(imputer_path, 'rb') as f:
-                self._classification_imputer = pickle.load(f)
-        return self._classification_imputer
+        return self.registry.get(os.path.join(self.classification_path, 'imputer_supervised.pkl'), _load_pickle)
     
     def load_classification_mappings(self):
         """Load feature mappings for classification"""
-        if self._classification_mappings is None:
-            mappings_path = os.path.join(self.classification_path, 'mappings_supervised.json')
-            with open(mappings_path, 'r') as f:
-                self._classification_mappings = json.load(f)
-        return self._classification_mappings
+        return self.registry.get(os.path.join(self.classification_path, 'mappings_supervised.json'), json.loads)
     
     def preprocess_classification_input(self, data):
         """
@@ -85,45 +164,50 @@ class MLModelLoader:
         Returns:
             DataFrame yang sudah dipreprocess dengan 11 features
         """
-        config = self.load_classification_config()
-        mappings = self.load_classification_mappings()
-        
-        # Model XGBoost expects these 11 features (in this exact order)
-        model_features = [
-            'F502', 'F14_enc', 'F5d_enc', 'Years_Since_Graduation',
-            'Gap_Etika', 'Gap_Keahlian', 'Gap_English', 'Gap_IT',
-            'Gap_Komunikasi', 'Gap_Teamwork', 'Gap_Development'
-        ]
-        
-        # Build input dict according to model's expected feature order
-        input_dict = {}
-        
-        # F502 - Waktu tunggu kerja (bulan)
-        input_dict['F502'] = data.get('F502', 3.0)  # Default: 3 bulan
-        
-        # F14_enc - Mapping categorical F14
-        f14_value = data.get('F14', '')
-        input_dict['F14_enc'] = mappings['f14_map'].get(f14_value, 3)  # Default: Cukup Erat
-        
-        # F5d_enc - Tingkat tempat kerja (ordinal 1-5)
-        input_dict['F5d_enc'] = data.get('F5d', 3.0)  # Default: 3
+        return self.preprocess_classification_batch([data])
+    
+    def preprocess_classification_batch(self, records):
+        """
+        Preprocess banyak record sekaligus menjadi satu feature matrix
         
-        # Years_Since_Graduation
-        input_dict['Years_Since_Graduation'] = data.get('Years_Since_Graduation', 2.0) 
+        Args:
+            records: list of dict dengan keys yang sama seperti preprocess_classification_input
         
-        # Competency gaps 
-        input_dict['Gap_Etika'] = data.get('Gap_Etika', 0.0)
-        input_dict['Gap_Keahlian'] = data.get('Gap_Keahlian', 0.0)
-        input_dict['Gap_English'] = data.get('Gap_English', 0.0)
-        input_dict['Gap_IT'] = data.get('Gap_IT', 0.0)
-        input_dict['Gap_Komunikasi'] = data.get('Gap_Komunikasi', 0.0)
-        input_dict['Gap_Teamwork'] = data.get('Gap_Teamwork', 0.0)
-        input_dict['Gap_Development'] = data.get('Gap_Development', 0.0)
+        Returns:
+            DataFrame dengan satu baris per record dan 11 features
+        """
+        # Convert to DataFrame with feature names (XGBClassifier expects this)
+        return pd.DataFrame(self.classification_feature_matrix(records), columns=CLASSIFICATION_FEATURES)
+    
+    def load_classification_preprocessor(self):
+        """
+        Load ClassificationPreprocessor dari config dan mappings
         
-        # Convert to DataFrame with feature names (XGBoost expects this)
-        X = pd.DataFrame([input_dict], columns=model_features)
+        Dibangun ulang hanya jika salah satu artifact berganti versi.
+        """
+        sources = (self.load_classification_config(), self.load_classification_mappings())
+        cached = self._classification_preprocessor_cache
+        if cached is not None and all(a is b for a, b in zip(cached[0], sources)):
+            return cached[1]
+        
+        config, mappings = sources
+        features = config.get('preprocessing', {}).get('features', CLASSIFICATION_FEATURES)
+        preprocessor = ClassificationPreprocessor(features, mappings)
+        self._classification_preprocessor_cache = (sources, preprocessor)
+        return preprocessor
+    
+    def classification_feature_matrix(self, records):
+        """
+        Bangun feature matrix NumPy (n_records, 11) dengan urutan CLASSIFICATION_FEATURES
         
-        return X
+        Args:
+            records: list of dict atau DataFrame dengan kolom F502, F14, F5d, Years_Since_Graduation, Gap_*
+        """
+        return self.load_classification_preprocessor().transform(records)
+    
+    def _classification_label_mapping(self):
+        config = self.load_classification_config()
+        return config.get('preprocessing', {}).get('label_mapping', {}).get('High_Salary', {})
     
     def predict_classification(self, data):
         """
@@ -135,66 +219,85 @@ class MLModelLoader:
         Returns:
             dict dengan prediction dan probability
         """
-        model = self.load_classification_model()
-        X = self.preprocess_classification_input(data)
+        return self.predict_classification_batch([data])['results'][0]
+    
+    def predict_classification_batch(self, records):
+        """
+        Predict banyak record dengan satu kali pemanggilan predict_proba
         
-        # Predict
-        prediction = model.predict(X)[0]
-        probabilities = model.predict_proba(X)[0]
+        Args:
+            records: list of dict dengan keys: F502, F14, F5d, Years_Since_Graduation, Gap_*
         
-        # Get class labels from config
-        config = self.load_classification_config()
-        label_mapping = config.get('preprocessing', {}).get('label_mapping', {}).get('High_Salary', {})
+        Returns:
+            dict dengan hasil per record dan jumlah per label
+        """
+        model = self.load_classification_model()
+        X = self.classification_feature_matrix(records)
+        if self.classification_backend != 'booster':
+            X = pd.DataFrame(X, columns=CLASSIFICATION_FEATURES)
+        
+        # Class diturunkan dari probabilitas, jadi cukup satu pemanggilan model
+        probabilities = np.asarray(model.predict_proba(X))
+        predictions = probabilities.argmax(axis=1)
+        confidences = probabilities.max(axis=1)
         
         # Use label mapping (0 = "Gaji <= 5jt", 1 = "Gaji > 5jt")
-        predicted_label = label_mapping.get(str(int(prediction)), f"Class {prediction}")
+        label_mapping = self._classification_label_mapping()
+        class_labels = [
+            label_mapping.get(str(i), f"Class {i}")
+            for i in range(probabilities.shape[1])
+        ]
+        
+        results = []
+        label_counts = {label: 0 for label in class_labels}
+        for row_proba, prediction, confidence in zip(probabilities.tolist(), predictions.tolist(), confidences.tolist()):
+            predicted_label = class_labels[prediction]
+            label_counts[predicted_label] += 1
+            results.append({
+                'prediction': int(prediction),
+                'predicted_label': predicted_label,
+                'probabilities': dict(zip(class_labels, row_proba)),
+                'confidence': float(confidence)
+            })
         
         return {
-            'prediction': int(prediction),
-            'predicted_label': predicted_label,
-            'probabilities': {
-                label_mapping.get(str(i), f"Class {i}"): float(prob) 
-                for i, prob in enumerate(probabilities)
-            },
-            'confidence': float(max(probabilities))
+            'total': len(results),
+            'label_counts': label_counts,
+            'results': results
         }
     
     # ==================== CLUSTERING ====================
     
     def load_clustering_model(self):
         """Load KMeans clustering model"""
-        if self._clustering_model is None:
-            model_path = os.path.join(self.clustering_path, 'kmeans_model.pkl')
-            try:
-                with open(model_path, 'rb') as f:
-                    self._clustering_model = pickle.load(f)
-            except (pickle.UnpicklingError, ValueError, EOFError) as e:
-                raise FileNotFoundError(f"Clustering model file is corrupt or incompatible. Please regenerate the model. Error: {str(e)}")
-        return self._clustering_model
+        return self.registry.get(os.path.join(self.clustering_path, 'kmeans_model.pkl'), _load_pickle)
     
     def load_clustering_config(self):
         """Load clustering configuration"""
-        if self._clustering_config is None:
-            config_path = os.path.join(self.clustering_path, 'clustering_config.json')
-            with open(config_path, 'r') as f:
-                self._clustering_config = json.load(f)
-        return self._clustering_config
+        return self.registry.get(os.path.join(self.clustering_path, 'clustering_config.json'), json.loads)
     
     def load_clustering_scaler(self):
         """Load StandardScaler for clustering"""
-        if self._clustering_scaler is None:
-            scaler_path = os.path.join(self.clustering_path, 'scaler.pkl')
-            with open(scaler_path, 'rb') as f:
-                self._clustering_scaler = pickle.load(f)
-        return self._clustering_scaler
+        return self.registry.get(os.path.join(self.clustering_path, 'scaler.pkl'), _load_pickle)
     
     def load_clustering_pca(self):
         """Load PCA for clustering"""
-        if self._clustering_pca is None:
-            pca_path = os.path.join(self.clustering_path, 'pca_model.pkl')
-            with open(pca_path, 'rb') as f:
-                self._clustering_pca = pickle.load(f)
-        return self._clustering_pca
+        return self.registry.get(os.path.join(self.clustering_path, 'pca_model.pkl'), _load_pickle)
+    
+    def load_clustering_engine(self):
+        """
+        Load ClusteringEngine (NumPy fast path) dari scaler, KMeans dan PCA
+        
+        Engine dibangun ulang hanya jika salah satu artifact berganti versi.
+        """
+        sources = (self.load_clustering_scaler(), self.load_clustering_model(), self.load_clustering_pca())
+        cached = self._clustering_engine_cache
+        if cached is not None and all(a is b for a, b in zip(cached[0], sources)):
+            return cached[1]
+        
+        engine = ClusteringEngine(*sources)
+        self._clustering_engine_cache = (sources, engine)
+        return engine
     
     def preprocess_clustering_input(self, data):
         """
@@ -204,10 +307,9 @@ class MLModelLoader:
             data: dict atau list of dict dengan keys: F502, F505, F14_enc, F5d_enc, F1101_enc
         
         Returns:
-            numpy array yang sudah dipreprocess
+            numpy array mentah (belum di-scale) dengan urutan features_used
         """
         config = self.load_clustering_config()
-        scaler = self.load_clustering_scaler()
         
         # Features yang digunakan
         features = config['features_used']
@@ -216,18 +318,12 @@ class MLModelLoader:
         if isinstance(data, dict):
             data = [data]
         
-        # Buat DataFrame
         input_data = []
         for item in data:
             row = [item.get(f, 0) for f in features]
             input_data.append(row)
         
-        X = np.array(input_data, dtype=float)
-        
-        # Scale features
-        X = scaler.transform(X)
-        
-        return X
+        return np.array(input_data, dtype=float).reshape(len(input_data), len(features))
     
     def predict_clustering(self, data):
         """
@@ -239,16 +335,13 @@ class MLModelLoader:
         Returns:
             dict dengan cluster assignment dan PCA coordinates untuk visualisasi
         """
-        model = self.load_clustering_model()
         config = self.load_clustering_config()
         pca = self.load_clustering_pca()
+        engine = self.load_clustering_engine()
         X = self.preprocess_clustering_input(data)
         
-        # Predict cluster
-        clusters = model.predict(X)
-        
-        # Get PCA coordinates for visualization
-        X_pca = pca.transform(X)
+        # Predict cluster + PCA coordinates for visualization
+        clusters, X_pca = engine.predict(X)
         
         # Get cluster labels
         cluster_labels = config.get('cluster_labels', {})
@@ -267,14 +360,13 @@ class MLModelLoader:
         
         # Jika input multiple items
         results = []
-        for i, cluster_id in enumerate(clusters):
-            cluster_id = int(cluster_id)
+        for cluster_id, (pc1, pc2) in zip(clusters.tolist(), X_pca[:, :2].tolist()):
             results.append({
                 'cluster': cluster_id,
                 'cluster_label': cluster_labels.get(str(cluster_id), f"Cluster {cluster_id}"),
                 'pca_coordinates': {
-                    'pc1': float(X_pca[i, 0]),
-                    'pc2': float(X_pca[i, 1])
+                    'pc1': pc1,
+                    'pc2': pc2
                 }
             })
         
@@ -286,30 +378,24 @@ class MLModelLoader:
             'pca_variance': pca_variance
         }
     
-    def cluster_batch_data(self, dataframe):
+    def cluster_batch_data(self, dataframe, chunk_size=10000):
         """
         Clustering untuk batch data (DataFrame)
         
         Args:
             dataframe: pandas DataFrame dengan kolom sesuai features_used
+            chunk_size: jumlah baris yang diproses per chunk
         
         Returns:
             DataFrame dengan kolom cluster tambahan
         """
-        model = self.load_clustering_model()
         config = self.load_clustering_config()
-        scaler = self.load_clustering_scaler()
+        engine = self.load_clustering_engine()
         
         features = config['features_used']
         
-        # Extract features
-        X = dataframe[features].values
-        
-        # Scale
-        X = scaler.transform(X)
-        
-        # Predict
-        clusters = model.predict(X)
+        # Extract features, scale & predict per chunk
+        clusters, _ = engine.predict(dataframe[features].to_numpy(dtype=float), chunk_size=chunk_size)
         
         # Add to dataframe
         result_df = dataframe.copy()
@@ -327,57 +413,38 @@ class MLModelLoader:
     
     def load_forecast_model(self):
         """Load ARIMA forecast model"""
-        if self._forecast_model is None:
-            model_path = os.path.join(self.forecast_path, 'arima_model.pickle')
-            with open(model_path, 'rb') as f:
-                self._forecast_model = pickle.load(f)
-        return self._forecast_model
+        return self.registry.get(os.path.join(self.forecast_path, 'arima_model.pickle'), _load_pickle)
     
     def load_forecast_config(self):
         """Load forecast configuration"""
-        if self._forecast_config is None:
-            config_path = os.path.join(self.forecast_path, 'forecast_config.json')
-            with open(config_path, 'r') as f:
-                self._forecast_config = json.load(f)
-        return self._forecast_config
+        return self.registry.get(os.path.join(self.forecast_path, 'forecast_config.json'), json.loads)
     
     def get_forecast_data(self):
         """
         Get forecast data dari config
         
+        Response di-cache dan hanya dibangun ulang jika salah satu file
+        (config, historical CSV, forecast CSV) berubah di disk.
+        
         Returns:
             dict dengan historical dan forecast data
         """
         config = self.load_forecast_config()
+        historical_data = self.registry.get(
+            os.path.join(self.forecast_path, 'historical_lulusan.csv'), _load_historical_csv
+        )
+        forecast_data = self.registry.get(
+            os.path.join(self.forecast_path, 'forecast_lulusan.csv'), _load_forecast_csv
+        )
         
-        # Load historical data
-        historical_path = os.path.join(self.forecast_path, 'historical_lulusan.csv')
-        historical_df = pd.read_csv(historical_path)
-        
-        # Normalize column names untuk historical
-        # Handle both 'Tahun Lulus' and 'Tahun'
-        if 'Tahun Lulus' in historical_df.columns:
-            historical_df.rename(columns={'Tahun Lulus': 'year'}, inplace=True)
-        elif 'Tahun' in historical_df.columns:
-            historical_df.rename(columns={'Tahun': 'year'}, inplace=True)
-        
-        # Handle both 'jumlah_lulusan' and other variations
-        if 'jumlah_lulusan' in historical_df.columns:
-            historical_df.rename(columns={'jumlah_lulusan': 'lulusan'}, inplace=True)
-        
-        # Load forecast data
-        forecast_path = os.path.join(self.forecast_path, 'forecast_lulusan.csv')
-        forecast_df = pd.read_csv(forecast_path)
-        
-        # Normalize column names untuk forecast
-        if 'Tahun' in forecast_df.columns:
-            forecast_df.rename(columns={'Tahun': 'year'}, inplace=True)
-        
-        # Handle both 'predicted_jumlah_lulusan' and other variations
-        if 'predicted_jumlah_lulusan' in forecast_df.columns:
-            forecast_df.rename(columns={'predicted_jumlah_lulusan': 'lulusan'}, inplace=True)
+        # Registry hanya mengganti objek jika isi file berubah,
+        # jadi identitas objek cukup sebagai cache key
+        sources = (config, historical_data, forecast_data)
+        cached = self._forecast_data_cache
+        if cached is not None and all(a is b for a, b in zip(cached[0], sources)):
+            return cached[1]
         
-        return {
+        result = {
             'model_info': {
                 'model_name': config['model']['model_name'],
                 'arima_order': config['model']['arima_order'],
@@ -385,16 +452,22 @@ class MLModelLoader:
                 'bic': config['model']['bic']
             },
             'training_period': config['model']['training_period'],
-            'historical_data': historical_df.to_dict('records'),
-            'forecast_data': forecast_df.to_dict('records'),
+            'historical_data': historical_data,
+            'forecast_data': forecast_data,
             'forecast_years': config['model']['forecast_years'],
             'forecast_values': config['model']['forecast_values']
         }
+        self._forecast_data_cache = (sources, result)
+        return result
     
     def forecast_future(self, steps=5):
         """
         Generate forecast untuk steps ke depan
         
+        Untuk 1..FORECAST_MAX_STEPS hasilnya diambil dari tabel yang dihitung
+        sekali per versi model (forecast ARIMA untuk n steps = n nilai pertama
+        dari forecast FORECAST_MAX_STEPS steps).
+        
         Args:
             steps: jumlah periode ke depan yang ingin di-forecast
         
@@ -404,24 +477,88 @@ class MLModelLoader:
         model = self.load_forecast_model()
         config = self.load_forecast_config()
         
+        if 1 <= steps <= FORECAST_MAX_STEPS:
+            cached = self._forecast_table_cache
+            if cached is None or cached[0] is not model or cached[1] is not config:
+                table = self._build_forecast_table(model, config)
+                self._forecast_table_cache = (model, config, table)
+            else:
+                table = cached[2]
+            return table[steps]
+        
+        return self._forecast_response(model.forecast(steps=steps).tolist(), config)
+    
+    def _build_forecast_table(self, model, config):
+        values = model.forecast(steps=FORECAST_MAX_STEPS).tolist()
+        return {
+            steps: self._forecast_response(values[:steps], config)
+            for steps in range(1, FORECAST_MAX_STEPS + 1)
+        }
+    
+    def _forecast_response(self, forecast_values, config):
         # Get last year from training
         last_year = config['model']['training_period']['end_year']
         
-        # Forecast
-        forecast_result = model.forecast(steps=steps)
-        
         # Generate years
-        forecast_years = [last_year + i + 1 for i in range(steps)]
+        forecast_years = [last_year + i + 1 for i in range(len(forecast_values))]
         
         return {
             'forecast_years': forecast_years,
-            'forecast_values': forecast_result.tolist(),
+            'forecast_values': forecast_values,
             'model_info': {
                 'arima_order': config['model']['arima_order'],
                 'aic': config['model']['aic'],
                 'bic': config['model']['bic']
             }
         }
+    
+    # ==================== WARM-UP ====================
+    
+    def warm_up(self):
+        """
+        Load semua artifact dan jalankan satu dummy prediction per model,
+        supaya request pertama di setiap worker tidak menanggung biaya unpickling
+        
+        Returns:
+            dict dengan status dan waktu load (ms) per artifact serta per dummy prediction
+        """
+        artifacts = [
+            ('classification_model', self.load_classification_model),
+            ('classification_config', self.load_classification_config),
+            ('classification_scaler', self.load_classification_scaler),
+            ('classification_imputer', self.load_classification_imputer),
+            ('classification_mappings', self.load_classification_mappings),
+            ('classification_preprocessor', self.load_classification_preprocessor),
+            ('clustering_model', self.load_clustering_model),
+            ('clustering_config', self.load_clustering_config),
+            ('clustering_scaler', self.load_clustering_scaler),
+            ('clustering_pca', self.load_clustering_pca),
+            ('clustering_engine', self.load_clustering_engine),
+            ('forecast_model', self.load_forecast_model),
+            ('forecast_config', self.load_forecast_config),
+        ]
+        predictions = [
+            ('classification', lambda: self.predict_classification({})),
+            ('clustering', lambda: self.predict_clustering(
+                {f: 0.0 for f in self.load_clustering_config()['features_used']}
+            )),
+            ('forecasting', lambda: self.forecast_future(steps=1)),
+        ]
+        
+        return {
+            'artifacts': dict(self._timed(name, func) for name, func in artifacts),
+            'predictions': dict(self._timed(name, func) for name, func in predictions),
+        }
+    
+    def _timed(self, name, func):
+        start = time.perf_counter()
+        try:
+            func()
+            result = {'status': 'ok', 'error': None}
+        except Exception as e:
+            result = {'status': 'error', 'error': str(e)}
+        result['elapsed_ms'] = round((time.perf_counter() - start) * 1000, 2)
+        return name, result
 
 
 # Singleton instance
@@ -0,0 +1,128 @@
+import os
+import time
+import hashlib
+import logging
+import threading
+from collections import namedtuple
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+ArtifactEntry = namedtuple(
+    'ArtifactEntry',
+    ['value', 'sha256', 'mtime_ns', 'size', 'loaded_at', 'checked_at']
+)
+
+
+class ArtifactRegistry:
+    """
+    Registry thread-safe untuk artifact ML (model, scaler, config) di folder exports/
+
+    Setiap artifact di-fingerprint dengan (mtime, size, sha256). Jika file di disk
+    berubah, versi baru di-load lalu di-swap secara atomik ke registry. Request yang
+    sedang berjalan tetap memakai objek lama yang sudah dipegangnya.
+    """
+
+    def __init__(self, check_interval=5.0):
+        # check_interval: jarak minimal (detik) antar pengecekan file di disk
+        self.check_interval = check_interval
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, path, loader):
+        """
+        Ambil artifact dari registry, load (ulang) jika belum ada atau file berubah
+
+        Args:
+            path: path absolut ke file artifact
+            loader: callable yang menerima bytes file dan mengembalikan objek artifact
+
+        Returns:
+            objek artifact versi aktif
+        """
+        entry = self._entries.get(path)
+        if entry is not None and time.monotonic() - entry.checked_at < self.check_interval:
+            return entry.value
+
+        with self._lock:
+            # Cek ulang: thread lain mungkin sudah me-refresh artifact ini
+            entry = self._entries.get(path)
+            now = time.monotonic()
+            if entry is not None and now - entry.checked_at < self.check_interval:
+                return entry.value
+
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                if entry is None:
+                    raise
+                logger.warning("ML artifact %s disappeared, keeping version %s", path, entry.sha256[:12])
+                self._entries[path] = entry._replace(checked_at=now)
+                return entry.value
+
+            if entry is not None and (stat.st_mtime_ns, stat.st_size) == (entry.mtime_ns, entry.size):
+                self._entries[path] = entry._replace(checked_at=now)
+                return entry.value
+
+            with open(path, 'rb') as f:
+                raw = f.read()
+            sha256 = hashlib.sha256(raw).hexdigest()
+
+            if entry is not None and sha256 == entry.sha256:
+                # File di-touch tapi isinya sama, tidak perlu load ulang
+                self._entries[path] = entry._replace(
+                    mtime_ns=stat.st_mtime_ns, size=stat.st_size, checked_at=now
+                )
+                return entry.value
+
+            try:
+                value = loader(raw)
+            except Exception:
+                if entry is None:
+                    raise
+                # Export baru rusak / belum selesai ditulis: tetap pakai versi lama
+                logger.exception("Failed to reload ML artifact %s, keeping version %s", path, entry.sha256[:12])
+                self._entries[path] = entry._replace(checked_at=now)
+                return entry.value
+
+            if entry is not None:
+                logger.info("Reloaded ML artifact %s: %s -> %s", path, entry.sha256[:12], sha256[:12])
+
+            self._entries[path] = ArtifactEntry(
+                value=value,
+                sha256=sha256,
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size,
+                loaded_at=timezone.now(),
+                checked_at=now,
+            )
+            return value
+
+    def describe(self, paths):
+        """
+        Informasi versi untuk sekumpulan artifact yang sudah di-load
+
+        Returns:
+            dict dengan version gabungan, loaded_at terbaru, dan versi per file
+        """
+        entries = {path: self._entries.get(path) for path in paths}
+        loaded = {path: entry for path, entry in entries.items() if entry is not None}
+        if not loaded:
+            return {'version': None, 'loaded_at': None, 'artifacts': {}}
+
+        combined = hashlib.sha256(
+            ''.join(loaded[path].sha256 for path in sorted(loaded)).encode()
+        ).hexdigest()
+
+        return {
+            'version': combined[:12],
+            'loaded_at': max(entry.loaded_at for entry in loaded.values()).isoformat(),
+            'artifacts': {
+                os.path.basename(path): {
+                    'version': entry.sha256[:12],
+                    'loaded_at': entry.loaded_at.isoformat(),
+                }
+                for path, entry in loaded.items()
+            }
+        }